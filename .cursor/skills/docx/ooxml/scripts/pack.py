@@ -4,16 +4,31 @@ Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting
 
 Example usage:
     python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> --workers 4 --compression-level 9
 """
 
 import argparse
-import shutil
-import subprocess
+import io
 import sys
 import tempfile
-import defusedxml.minidom
+import defusedxml.sax
 import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.sax.handler import ContentHandler, property_lexical_handler
+from xml.sax.saxutils import escape
+
+if __package__:
+    from .soffice_pool import get_pool
+else:
+    from soffice_pool import get_pool
+
+# Extra escapes for text, matching minidom's toxml
+_TEXT_ENTITIES = {'"': "&quot;"}
+
+# Extra escapes for attribute values (always written in double quotes)
+_ATTR_ENTITIES = {'"': "&quot;", "\t": "&#9;", "\n": "&#10;", "\r": "&#13;"}
 
 
 def main():
@@ -21,11 +36,28 @@ def main():
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(10),
+        metavar="{0-9}",
+        help="Deflate compression level (default: zlib default)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to condense XML parts (default: 1)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            compression_level=args.compression_level,
+            workers=args.workers,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +74,21 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir, output_file, validate=False, compression_level=None, workers=1
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    XML parts are condensed while they are written into the archive, so the
+    input directory is never copied or modified. Binary parts (media, fonts,
+    embeddings) are streamed from disk into the archive as-is.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        compression_level: Deflate level 0-9, or None for the zlib default
+        workers: Number of processes used to condense XML parts (default: 1)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +101,51 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    files = sorted(f for f in input_dir.rglob("*") if f.is_file())
+    xml_files = [f for f in files if _is_xml_part(f)]
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(
+        output_file, "w", zipfile.ZIP_DEFLATED, compresslevel=compression_level
+    ) as zf:
+        if workers and workers > 1 and len(xml_files) > 1:
+            # Condense in worker processes; the archive itself is written
+            # serially, in file order, as each part's turn comes. At most two
+            # parts per worker are in flight, which bounds the condensed
+            # bytes held in memory.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for f in files:
+                    condensed = (
+                        executor.submit(_condense_to_bytes, f)
+                        if _is_xml_part(f)
+                        else None
+                    )
+                    pending.append((f, condensed))
+                    if len(pending) >= workers * 2:
+                        _write_part(zf, input_dir, *pending.popleft())
+                while pending:
+                    _write_part(zf, input_dir, *pending.popleft())
+        else:
+            for f in files:
+                arcname = f.relative_to(input_dir).as_posix()
+                if _is_xml_part(f):
+                    with zf.open(arcname, "w") as dest:
+                        _condense_stream(f, dest)
+                else:
+                    zf.write(f, arcname)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
 def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+    """Validate document by converting to HTML with a pooled soffice worker."""
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,59 +157,168 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            get_pool().convert(doc_path, temp_dir, filter_name, timeout=10)
             return True
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
-            print(f"Validation error: {e}", file=sys.stderr)
+            error_msg = str(e) or "Document validation failed"
+            print(f"Validation error: {error_msg}", file=sys.stderr)
             return False
 
 
 def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    """Strip unnecessary whitespace and remove comments, rewriting the file in place."""
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(_condense_to_bytes(xml_file))
+
+
+def _write_part(zf, input_dir, f, condensed):
+    """Write f into the archive, from its condensed future when it has one."""
+    arcname = f.relative_to(input_dir).as_posix()
+    if condensed is None:
+        zf.write(f, arcname)
+    else:
+        zf.writestr(arcname, condensed.result())
+
+
+def _is_xml_part(path):
+    """Return True for parts that should be condensed (XML and relationships)."""
+    return path.name.lower().endswith((".xml", ".rels"))
+
+
+def _condense_to_bytes(xml_file):
+    """Condense an XML file and return the serialized bytes."""
+    buffer = io.BytesIO()
+    _condense_stream(xml_file, buffer)
+    return buffer.getvalue()
+
+
+def _condense_stream(xml_file, dest):
+    """Stream a condensed copy of xml_file into the binary file object dest."""
+    writer = io.TextIOWrapper(dest, encoding="utf-8", newline="")
+    try:
+        parser = defusedxml.sax.make_parser()
+        handler = _CondensingHandler(writer)
+        parser.setContentHandler(handler)
+        parser.setProperty(property_lexical_handler, handler)
+        parser.parse(str(xml_file))
+        writer.flush()
+    finally:
+        # Leave dest open for the caller
+        writer.detach()
+
+
+class _CondensingHandler(ContentHandler):
+    """SAX handler that re-serializes XML without formatting whitespace or comments.
+
+    Whitespace-only text and comments are dropped unless they are the content
+    of a text element (tags ending in ":t", e.g. w:t or a:t) or sit outside the
+    root element. The handler is also registered as the lexical handler, which
+    is how comments and CDATA sections are reported.
+
+    Output follows minidom's toxml: elements without content are written in
+    short form (<tag/>), '"' in text is escaped as &quot;, and namespace
+    declarations are written before the other attributes. The one difference
+    from the previous minidom-based packer is that tabs and newlines in
+    attribute values are written as character references; minidom wrote them
+    raw, so they were read back as spaces.
+    """
+
+    def __init__(self, out):
+        super().__init__()
+        self._write = out.write
+        self._open_tags = []
+        self._text = []
+        self._start_pending = False
+        self._in_cdata = False
+
+    def startDocument(self):
+        self._write('<?xml version="1.0" encoding="UTF-8"?>')
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        self._close_start_tag()
+        self._write("<" + name)
+        # minidom's namespace-aware parser puts namespace declarations first
+        items = sorted(attrs.items(), key=lambda item: not _is_xmlns(item[0]))
+        for attr_name, value in items:
+            self._write(f' {attr_name}="{escape(value, _ATTR_ENTITIES)}"')
+        self._start_pending = True
+        self._open_tags.append(name)
+
+    def endElement(self, name):
+        self._flush_text()
+        if self._start_pending:
+            self._write("/>")
+            self._start_pending = False
+        else:
+            self._write(f"</{name}>")
+        self._open_tags.pop()
+
+    def characters(self, content):
+        if self._in_cdata:
+            self._write(content)
+        else:
+            self._text.append(content)
+
+    def ignorableWhitespace(self, whitespace):
+        self._text.append(whitespace)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._close_start_tag()
+        self._write(f"<?{target} {data}?>")
+
+    # LexicalHandler methods
+
+    def comment(self, content):
+        self._flush_text()
+        if not self._open_tags or self._open_tags[-1].endswith(":t"):
+            self._close_start_tag()
+            self._write(f"<!--{content}-->")
+
+    def startCDATA(self):
+        self._flush_text()
+        self._close_start_tag()
+        self._write("<![CDATA[")
+        self._in_cdata = True
+
+    def endCDATA(self):
+        self._in_cdata = False
+        self._write("]]>")
+
+    def startDTD(self, name, public_id, system_id):
+        pass
+
+    def endDTD(self):
+        pass
+
+    def _close_start_tag(self):
+        if self._start_pending:
+            self._write(">")
+            self._start_pending = False
+
+    def _flush_text(self):
+        # Text is buffered because SAX may deliver a single text node in chunks
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text.clear()
+        if not self._open_tags:
+            return
+        if text.strip() == "" and not self._open_tags[-1].endswith(":t"):
+            return
+        self._close_start_tag()
+        self._write(escape(text, _TEXT_ENTITIES))
+
+
+def _is_xmlns(attr_name):
+    return attr_name == "xmlns" or attr_name.startswith("xmlns:")
 
 
 if __name__ == "__main__":
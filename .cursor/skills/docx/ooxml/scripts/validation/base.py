@@ -2,11 +2,15 @@
 Base validator with common validation logic for document files.
 """
 
+import posixpath
 import re
 from pathlib import Path
 
 import lxml.etree
 
+from .cache import ValidationCache, content_hash, open_original_part
+from .package import CONTENT_TYPES_PART, PackageGraph
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -81,6 +85,13 @@ class BaseSchemaValidator:
         "http://schemas.openxmlformats.org/package/2006/content-types"
     )
 
+    # Parts larger than this (in bytes) are checked with streaming iterparse
+    # variants that free elements as they go, so memory stays flat
+    STREAMING_THRESHOLD = 64 * 1024 * 1024
+
+    # Compiled XSD schemas shared by all validators in the process
+    _schemas = {}
+
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
@@ -103,18 +114,41 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        cache=False,
+        streaming_threshold=None,
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        if streaming_threshold is not None:
+            self.STREAMING_THRESHOLD = streaming_threshold
+
+        # With cache=True (or a shared ValidationCache), per-part results are
+        # reused across runs for parts whose content is unchanged. Off by
+        # default; the validate.py command line and batch mode turn it on.
+        if isinstance(cache, ValidationCache):
+            self.cache = cache
+        else:
+            self.cache = ValidationCache() if cache else None
+        self._part_hashes = {}
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
+        # Walk the package once; the structural checks query this graph
+        self.package = PackageGraph(self.unpacked_dir)
+
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            self.package.path(part)
+            for suffix in (".xml", ".rels")
+            for part in self.package.parts
+            if part.endswith(suffix)
         ]
 
         if not self.xml_files:
@@ -124,24 +158,70 @@ class BaseSchemaValidator:
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _part_results(self, check, compute, xml_files=None):
+        """Run a per-part check over XML files, reusing cached results.
+
+        Args:
+            check: Name of the check, part of the cache key
+            compute: Function taking an XML file path and returning a
+                JSON-serializable result that depends only on that part
+            xml_files: Files to check (default: all XML files)
+
+        Returns:
+            list: (xml_file, result) pairs in file order
+        """
+        if xml_files is None:
+            xml_files = self.xml_files
+        if self.cache is None:
+            return [(xml_file, compute(xml_file)) for xml_file in xml_files]
+
+        check = f"{type(self).__name__}.{check}"
+        results = []
+        for xml_file in xml_files:
+            key = ValidationCache.key(
+                check, self._part_name(xml_file), self._part_hash(xml_file)
+            )
+            result = self.cache.get(key)
+            if result is None:
+                result = compute(xml_file)
+                self.cache.put(key, result)
+            results.append((xml_file, result))
+        self.cache.flush()
+        return results
+
+    def _is_large_part(self, xml_file):
+        """True if a part should be checked with a streaming variant."""
+        return xml_file.stat().st_size > self.STREAMING_THRESHOLD
+
+    def _iterparse(self, xml_file, events=("end",)):
+        """Yield (event, element) pairs, freeing each element after its end event.
+
+        Only the ancestors of the current element stay in memory, so callers
+        must take what they need from an element (including its text at the
+        end event) before asking for the next one. xml_file is a path or a
+        binary stream.
+        """
+        source = xml_file if hasattr(xml_file, "read") else str(xml_file)
+        for event, elem in lxml.etree.iterparse(source, events=events):
+            yield event, elem
+            if event == "end":
+                elem.clear(keep_tail=True)
+                # Drop already processed siblings still held by the parent
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+    def _part_hash(self, xml_file):
+        if xml_file not in self._part_hashes:
+            self._part_hashes[xml_file] = content_hash(xml_file)
+        return self._part_hashes[xml_file]
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
-
-        for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+        for _, file_errors in self._part_results("xml", self._check_well_formed):
+            errors.extend(file_errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -153,26 +233,33 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _check_well_formed(self, xml_file):
+        try:
+            # Try to parse the XML file
+            if self._is_large_part(xml_file):
+                for _ in self._iterparse(xml_file):
+                    pass
+            else:
+                lxml.etree.parse(str(xml_file))
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Line {e.lineno}: {e.msg}"
+            ]
+        except Exception as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Unexpected error: {str(e)}"
+            ]
+        return []
+
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
-
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+        for _, file_errors in self._part_results(
+            "namespaces", self._check_ignorable_namespaces
+        ):
+            errors.extend(file_errors)
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -183,86 +270,60 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _check_ignorable_namespaces(self, xml_file):
+        errors = []
+        try:
+            # Only the root's declarations and attributes are needed, and they
+            # are complete at its start event
+            root = self._root_element(xml_file)
+            declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+            for attr_val in [
+                v for k, v in root.attrib.items() if k.endswith("Ignorable")
+            ]:
+                undeclared = set(attr_val.split()) - declared
+                errors.extend(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Namespace '{ns}' in Ignorable but not declared"
+                    for ns in undeclared
+                )
+        except lxml.etree.XMLSyntaxError:
+            pass
+        return errors
+
+    @staticmethod
+    def _root_element(xml_file):
+        """Root element of a part with its attributes, read without parsing the rest."""
+        for _, root in lxml.etree.iterparse(str(xml_file), events=("start",)):
+            return root
+        raise lxml.etree.XMLSyntaxError("Document is empty", None, 0, 0)
+
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+        for xml_file, events in self._part_results("unique_ids", self._collect_ids):
+            for event in events:
+                if event[0] == "error":
+                    errors.append(event[1])
+                    continue
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                # Check global uniqueness
+                _, id_value, line, tag = event
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,99 +335,175 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _collect_ids(self, xml_file):
+        """Check file-scoped ID uniqueness in one part.
+
+        Returns a list of events in document order: ["error", message] for
+        duplicates within the file and ["global", id, line, tag] for IDs that
+        must be unique across all files, which the caller checks.
+        """
+        if self._is_large_part(xml_file):
+            return self._collect_ids_streaming(xml_file)
+
+        events = []
+        try:
+            root = lxml.etree.parse(str(xml_file)).getroot()
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # Remove all mc:AlternateContent elements from the tree
+            mc_elements = root.xpath(
+                ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+            )
+            for elem in mc_elements:
+                elem.getparent().remove(elem)
+
+            # Now check IDs in the cleaned tree
+            for elem in root.iter():
+                # Get the element name without namespace
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                # Check if this element type has ID uniqueness requirements
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower()
+                            if "}" in attr
+                            else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            events.append(["global", id_value, elem.sourceline, tag])
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                events.append(
+                                    [
+                                        "error",
+                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                        f"(first occurrence at line {prev_line})",
+                                    ]
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            events.append(
+                ["error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"]
+            )
+        return events
+
+    def _collect_ids_streaming(self, xml_file):
+        """Streaming variant of _collect_ids for very large parts."""
+        events = []
+        alternate_content = f"{{{self.MC_NAMESPACE}}}AlternateContent"
+        skip_depth = 0  # Depth inside mc:AlternateContent, whose IDs are ignored
+        try:
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            for event, elem in self._iterparse(xml_file, events=("start", "end")):
+                if elem.tag == alternate_content:
+                    skip_depth += 1 if event == "start" else -1
+                    continue
+                if event == "end" or skip_depth:
+                    continue
+
+                tag = elem.tag.rsplit("}", 1)[-1].lower()
+                if tag not in self.UNIQUE_ID_REQUIREMENTS:
+                    continue
+                attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                # Look for the specified attribute
+                id_value = None
+                for attr, value in elem.attrib.items():
+                    if attr.rsplit("}", 1)[-1].lower() == attr_name:
+                        id_value = value
+                        break
+                if id_value is None:
+                    continue
+
+                if scope == "global":
+                    events.append(["global", id_value, elem.sourceline, tag])
+                elif scope == "file":
+                    seen = file_ids.setdefault((tag, attr_name), {})
+                    if id_value in seen:
+                        events.append(
+                            [
+                                "error",
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                f"(first occurrence at line {seen[id_value]})",
+                            ]
+                        )
+                    else:
+                        seen[id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            events.append(
+                ["error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"]
+            )
+        return events
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
+        package = self.package
 
-        # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
-
-        if not rels_files:
+        if not package.rels_parts:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
+        # All parts except the reference files themselves
+        all_files = {
+            part
+            for part in package.parts
+            if posixpath.basename(part) != CONTENT_TYPES_PART
+            and not part.endswith(".rels")
+        }
 
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(package.rels_parts)} .rels files and {len(all_files)} target files"
             )
 
-        # Check each .rels file
-        for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+        for rels_part, e in package.rels_errors.items():
+            errors.append(f"  Error parsing {rels_part}: {e}")
 
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
-
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+        # Track all files that are referenced by any .rels file
+        all_referenced_files = set()
+        for _, rels_part, rel in package.all_relationships():
+            if rel.external or not rel.target:
+                continue
+            if rel.target_part in package.parts:
+                all_referenced_files.add(rel.target_part)
+            else:
+                errors.append(
+                    f"  {rels_part}: Line {rel.sourceline}: Broken reference to {rel.target}"
+                )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
-
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+        for unref_part in sorted(all_files - all_referenced_files):
+            errors.append(f"  Unreferenced file: {unref_part}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -390,87 +527,67 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
+        package = self.package
+
+        # Process each XML file that might contain r:id references. Skip .rels
+        # files themselves and files without a .rels file (that's okay)
+        xml_files = [
+            xml_file
+            for xml_file in self.xml_files
+            if xml_file.suffix != ".rels"
+            and self._part_name(xml_file) in package.rels_parts
+        ]
 
-        # Process each XML file that might contain r:id references
-        for xml_file in self.xml_files:
-            # Skip .rels files themselves
-            if xml_file.suffix == ".rels":
-                continue
-
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+        for xml_file, references in self._part_results(
+            "relationship_refs", self._collect_relationship_refs, xml_files
+        ):
+            part = self._part_name(xml_file)
+            rels_part = package.rels_parts[part]
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
 
-            # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if rels_part in package.rels_errors:
+                errors.append(
+                    f"  Error processing {xml_rel_path}: {package.rels_errors[rels_part]}"
+                )
                 continue
 
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+            # Valid relationship IDs and their types
+            rid_to_type = {}
+            for rel in package.relationships(part):
+                if rel.id:
+                    # Check for duplicate rIds
+                    if rel.id in rid_to_type:
+                        errors.append(
+                            f"  {rels_part}: Line {rel.sourceline}: "
+                            f"Duplicate relationship ID '{rel.id}' (IDs must be unique)"
                         )
+                    rid_to_type[rel.id] = rel.type_name
 
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
+            if "error" in references:
+                errors.append(f"  Error processing {xml_rel_path}: {references['error']}")
+                continue
+
+            for elem_name, rid_attr, line in references["refs"]:
+                # Check if the ID exists
+                if rid_attr not in rid_to_type:
+                    errors.append(
+                        f"  {xml_rel_path}: Line {line}: "
+                        f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                        f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                    )
+                # Check if we have type expectations for this element
+                elif self.ELEMENT_RELATIONSHIP_TYPES:
+                    expected_type = self._get_expected_relationship_type(elem_name)
+                    if expected_type:
+                        actual_type = rid_to_type[rid_attr]
+                        # Check if the actual type matches or contains the expected type
+                        if expected_type not in actual_type.lower():
                             errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                                f"  {xml_rel_path}: Line {line}: "
+                                f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                f"but should point to a '{expected_type}' relationship"
                             )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -483,6 +600,36 @@ class BaseSchemaValidator:
                 print("PASSED - All relationship ID references are valid")
             return True
 
+    def _collect_relationship_refs(self, xml_file):
+        """Collect the r:id references of one part as [element name, r:id, line]."""
+        refs = []
+        rid_name = f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
+        try:
+            if self._is_large_part(xml_file):
+                # Stream the part: attributes are complete at each start event
+                elements = (
+                    elem
+                    for event, elem in self._iterparse(
+                        xml_file, events=("start", "end")
+                    )
+                    if event == "start"
+                )
+            else:
+                elements = lxml.etree.parse(str(xml_file)).getroot().iter()
+            for elem in elements:
+                # Check for r:id attribute (relationship ID)
+                rid_attr = elem.get(rid_name)
+                if rid_attr:
+                    elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                    refs.append([elem_name, rid_attr, elem.sourceline])
+        except Exception as e:
+            return {"error": str(e)}
+        return {"refs": refs}
+
+    def _part_name(self, path):
+        """Package part name (POSIX path relative to the package root) of a file."""
+        return path.relative_to(self.unpacked_dir).as_posix()
+
     def _get_expected_relationship_type(self, element_name):
         """
         Get the expected relationship type for an element.
@@ -524,32 +671,13 @@ class BaseSchemaValidator:
         errors = []
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if CONTENT_TYPES_PART not in self.package.parts:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Declared parts (Override) and extensions (Default)
+            declared_parts, declared_extensions = self.package.content_types
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,15 +703,9 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
+                path_str = self._part_name(xml_file)
 
                 # Skip non-content files
                 if any(
@@ -593,8 +715,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+                    root_name = self.package.root_name(path_str)
 
                     if root_name in declarable_roots and path_str not in declared_parts:
                         errors.append(
@@ -605,22 +726,21 @@ class BaseSchemaValidator:
                     continue  # Skip unparseable files
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for part in self.package.parts:
                 # Skip XML files and metadata files (already checked above)
-                if file_path.suffix.lower() in {".xml", ".rels"}:
+                extension = posixpath.splitext(part)[1].lstrip(".").lower()
+                if extension in {"xml", "rels"}:
                     continue
-                if file_path.name == "[Content_Types].xml":
+                if posixpath.basename(part) == CONTENT_TYPES_PART:
                     continue
-                if "_rels" in file_path.parts or "docProps" in file_path.parts:
+                if {"_rels", "docProps"} & set(part.split("/")):
                     continue
 
-                extension = file_path.suffix.lstrip(".").lower()
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            f'  {part}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
 
         except Exception as e:
@@ -717,6 +837,9 @@ class BaseSchemaValidator:
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
+        if self.cache is not None:
+            self.cache.flush()
+
         # Print summary
         if self.verbose:
             print(f"Validated {len(self.xml_files)} files:")
@@ -823,20 +946,36 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, digest=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        Verdicts are cached by part name and content hash (digest, hashed from
+        xml_file if not given).
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
+        if self.cache is None:
+            return self._run_xsd_validation(xml_file, base_path, schema_path)
+
+        key = ValidationCache.key(
+            f"{type(self).__name__}.xsd",
+            xml_file.relative_to(base_path).as_posix(),
+            digest or self._part_hash(xml_file),
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            is_valid, errors = cached
+            return is_valid, set(errors)
+
+        is_valid, errors = self._run_xsd_validation(xml_file, base_path, schema_path)
+        self.cache.put(key, [is_valid, sorted(errors)])
+        return is_valid, errors
+
+    def _run_xsd_validation(self, xml_file, base_path, schema_path):
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            schema = self._load_schema(schema_path)
 
             # Load and preprocess XML
             with open(xml_file, "r") as f:
@@ -866,6 +1005,18 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    @classmethod
+    def _load_schema(cls, schema_path):
+        """Compile an XSD schema once per process and reuse it for every file."""
+        if schema_path not in cls._schemas:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+                cls._schemas[schema_path] = lxml.etree.XMLSchema(xsd_doc)
+        return cls._schemas[schema_path]
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
@@ -875,8 +1026,8 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
+        import hashlib
         import tempfile
-        import zipfile
 
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
@@ -885,21 +1036,25 @@ class BaseSchemaValidator:
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
             original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+            digest = hashlib.sha256()
+
+            # Copy only the corresponding file from the original, in chunks
+            with open_original_part(
+                self.original_file, relative_path.as_posix()
+            ) as source:
+                if source is None:
+                    # File didn't exist in original, so no original errors
+                    return set()
+                original_xml_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(original_xml_file, "wb") as target:
+                    while chunk := source.read(1024 * 1024):
+                        digest.update(chunk)
+                        target.write(chunk)
 
             # Validate the specific file in original
             is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+                original_xml_file, temp_path, digest.hexdigest()
             )
             return errors if errors else set()
 
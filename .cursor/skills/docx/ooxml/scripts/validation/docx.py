@@ -3,12 +3,11 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .cache import open_original_part
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -75,41 +74,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        document_files = [f for f in self.xml_files if f.name == "document.xml"]
+        for _, file_errors in self._part_results(
+            "whitespace", self._check_whitespace_preservation, document_files
+        ):
+            errors.extend(file_errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -121,6 +90,71 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    def _check_whitespace_preservation(self, xml_file):
+        """Whitespace preservation errors in one document part."""
+        if self._is_large_part(xml_file):
+            return self._check_whitespace_preservation_streaming(xml_file)
+
+        errors = []
+        try:
+            root = lxml.etree.parse(str(xml_file)).getroot()
+
+            # Find all w:t elements
+            for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
+                if elem.text:
+                    text = elem.text
+                    # Check if text starts or ends with whitespace
+                    if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+                        # Check if xml:space="preserve" attribute exists
+                        xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
+                        if (
+                            xml_space_attr not in elem.attrib
+                            or elem.attrib[xml_space_attr] != "preserve"
+                        ):
+                            # Show a preview of the text
+                            text_preview = (
+                                repr(text)[:50] + "..."
+                                if len(repr(text)) > 50
+                                else repr(text)
+                            )
+                            errors.append(
+                                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                            )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
+    def _check_whitespace_preservation_streaming(self, xml_file):
+        """Streaming variant of _check_whitespace_preservation for very large parts."""
+        errors = []
+        t_tag = f"{{{self.WORD_2006_NAMESPACE}}}t"
+        xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
+        try:
+            for _, elem in self._iterparse(xml_file):
+                if elem.tag != t_tag or not elem.text:
+                    continue
+                text = elem.text
+                if (
+                    re.match(r"^\s.*", text) or re.match(r".*\s$", text)
+                ) and elem.get(xml_space_attr) != "preserve":
+                    text_preview = (
+                        repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+                    )
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
+                    )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
@@ -128,37 +162,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        document_files = [f for f in self.xml_files if f.name == "document.xml"]
+        for _, file_errors in self._part_results(
+            "deletions", self._check_deletions, document_files
+        ):
+            errors.extend(file_errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -170,6 +178,67 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - No w:t elements found within w:del elements")
             return True
 
+    def _check_deletions(self, xml_file):
+        """Deletion errors in one document part."""
+        if self._is_large_part(xml_file):
+            return self._check_deletions_streaming(xml_file)
+
+        errors = []
+        try:
+            root = lxml.etree.parse(str(xml_file)).getroot()
+
+            # Find all w:t elements that are descendants of w:del elements
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+            xpath_expression = ".//w:del//w:t"
+            problematic_t_elements = root.xpath(
+                xpath_expression, namespaces=namespaces
+            )
+            for t_elem in problematic_t_elements:
+                if t_elem.text:
+                    # Show a preview of the text
+                    text_preview = (
+                        repr(t_elem.text)[:50] + "..."
+                        if len(repr(t_elem.text)) > 50
+                        else repr(t_elem.text)
+                    )
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
+                    )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
+    def _check_deletions_streaming(self, xml_file):
+        """Streaming variant of _check_deletions for very large parts."""
+        errors = []
+        del_tag = f"{{{self.WORD_2006_NAMESPACE}}}del"
+        t_tag = f"{{{self.WORD_2006_NAMESPACE}}}t"
+        del_depth = 0  # Number of open w:del ancestors
+        try:
+            for event, elem in self._iterparse(xml_file, events=("start", "end")):
+                if elem.tag == del_tag:
+                    del_depth += 1 if event == "start" else -1
+                elif event == "end" and elem.tag == t_tag and del_depth and elem.text:
+                    text_preview = (
+                        repr(elem.text)[:50] + "..."
+                        if len(repr(elem.text)) > 50
+                        else repr(elem.text)
+                    )
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
+                    )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
     def count_paragraphs_in_unpacked(self):
         """Count the number of paragraphs in the unpacked document."""
         count = 0
@@ -180,9 +249,15 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
+                p_tag = f"{{{self.WORD_2006_NAMESPACE}}}p"
+                if self._is_large_part(xml_file):
+                    count = sum(
+                        1 for _, elem in self._iterparse(xml_file) if elem.tag == p_tag
+                    )
+                    continue
                 root = lxml.etree.parse(str(xml_file)).getroot()
                 # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+                paragraphs = root.findall(f".//{p_tag}")
                 count = len(paragraphs)
             except Exception as e:
                 print(f"Error counting paragraphs in unpacked document: {e}")
@@ -194,19 +269,15 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
+            # Stream document.xml straight out of the original docx
+            p_tag = f"{{{self.WORD_2006_NAMESPACE}}}p"
+            with open_original_part(self.original_file, "word/document.xml") as f:
+                if f is None:
+                    raise KeyError(
+                        "There is no item named 'word/document.xml' in the archive"
+                    )
                 # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                count = sum(1 for _, elem in self._iterparse(f) if elem.tag == p_tag)
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -220,21 +291,72 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         """
         errors = []
 
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
+        document_files = [f for f in self.xml_files if f.name == "document.xml"]
+        for _, file_errors in self._part_results(
+            "insertions", self._check_insertions, document_files
+        ):
+            errors.extend(file_errors)
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
+        if errors:
+            print(f"FAILED - Found {len(errors)} insertion validation violations:")
+            for error in errors:
+                print(error)
+            return False
+        else:
+            if self.verbose:
+                print("PASSED - No w:delText elements within w:ins elements")
+            return True
+
+    def _check_insertions(self, xml_file):
+        """Insertion errors in one document part."""
+        if self._is_large_part(xml_file):
+            return self._check_insertions_streaming(xml_file)
 
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
+        errors = []
+        try:
+            root = lxml.etree.parse(str(xml_file)).getroot()
+            namespaces = {"w": self.WORD_2006_NAMESPACE}
+
+            # Find w:delText in w:ins that are NOT within w:del
+            invalid_elements = root.xpath(
+                ".//w:ins//w:delText[not(ancestor::w:del)]",
+                namespaces=namespaces
+            )
+
+            for elem in invalid_elements:
+                text_preview = (
+                    repr(elem.text or "")[:50] + "..."
+                    if len(repr(elem.text or "")) > 50
+                    else repr(elem.text or "")
                 )
+                errors.append(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
+                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
 
-                for elem in invalid_elements:
+    def _check_insertions_streaming(self, xml_file):
+        """Streaming variant of _check_insertions for very large parts."""
+        errors = []
+        ins_tag = f"{{{self.WORD_2006_NAMESPACE}}}ins"
+        del_tag = f"{{{self.WORD_2006_NAMESPACE}}}del"
+        del_text_tag = f"{{{self.WORD_2006_NAMESPACE}}}delText"
+        depth = {ins_tag: 0, del_tag: 0}  # Open w:ins / w:del ancestors
+        try:
+            for event, elem in self._iterparse(xml_file, events=("start", "end")):
+                if elem.tag in depth:
+                    depth[elem.tag] += 1 if event == "start" else -1
+                elif (
+                    event == "end"
+                    and elem.tag == del_text_tag
+                    and depth[ins_tag]
+                    and not depth[del_tag]
+                ):
                     text_preview = (
                         repr(elem.text or "")[:50] + "..."
                         if len(repr(elem.text or "")) > 50
@@ -245,20 +367,11 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                         f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
                     )
 
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} insertion validation violations:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print("PASSED - No w:delText elements within w:ins elements")
-            return True
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
 
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
@@ -0,0 +1,219 @@
+"""
+Package graph shared by the structural validation checks.
+"""
+
+import os
+import posixpath
+from urllib.parse import unquote
+
+import lxml.etree
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+
+class Relationship:
+    """A single <Relationship> entry from a .rels part."""
+
+    __slots__ = ("id", "type", "target", "external", "target_part", "sourceline")
+
+    def __init__(self, id, type, target, external, target_part, sourceline):
+        self.id = id
+        self.type = type
+        self.target = target  # Target attribute as written
+        self.external = external
+        # Package-relative part name the target resolves to (None for external
+        # targets and targets that escape the package)
+        self.target_part = target_part
+        self.sourceline = sourceline
+
+    @property
+    def type_name(self):
+        """Last segment of the relationship type URI, e.g. 'slideLayout'."""
+        return self.type.rsplit("/", 1)[-1]
+
+
+class PackageGraph:
+    """Parts, relationships and content types of an unpacked package.
+
+    The tree is walked once when the graph is built. Relationship and content
+    type parts are parsed on first use and every later query is a dictionary
+    lookup, so the structural checks no longer glob the tree, re-parse .rels
+    files or resolve target paths on the filesystem.
+
+    Part names are package-relative POSIX paths such as 'word/document.xml';
+    the package root relationships belong to the source part ''.
+    """
+
+    def __init__(self, unpacked_dir):
+        self.unpacked_dir = unpacked_dir
+        self.parts = {}  # Part name -> Path
+        self.rels_parts = {}  # Source part name -> .rels part name
+
+        for dirpath, dirnames, filenames in os.walk(unpacked_dir):
+            dirnames.sort()
+            rel_dir = os.path.relpath(dirpath, unpacked_dir)
+            rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/")
+            for filename in sorted(filenames):
+                name = posixpath.join(rel_dir, filename)
+                self.parts[name] = unpacked_dir / name
+                if filename.endswith(".rels"):
+                    self.rels_parts[self.source_part(name)] = name
+
+        self._relationships = None
+        self._rels_errors = {}
+        self._content_types = None
+        self._root_names = {}
+
+    @staticmethod
+    def source_part(rels_part):
+        """Map 'dir/_rels/name.rels' to its source part 'dir/name'."""
+        rels_dir, rels_filename = posixpath.split(rels_part)
+        return posixpath.join(
+            posixpath.dirname(rels_dir), rels_filename[: -len(".rels")]
+        )
+
+    @staticmethod
+    def rels_part_name(part):
+        """Name of the relationship part belonging to a source part."""
+        directory, filename = posixpath.split(part)
+        return posixpath.join(directory, "_rels", f"{filename}.rels")
+
+    @staticmethod
+    def _base_dir(rels_part):
+        """Directory relationship targets in a .rels part are relative to."""
+        return posixpath.dirname(posixpath.dirname(rels_part))
+
+    def path(self, part):
+        return self.parts[part]
+
+    def parts_in(self, directory, suffix=""):
+        """Parts directly inside directory whose names end with suffix."""
+        prefix = directory.rstrip("/") + "/"
+        return [
+            part
+            for part in self.parts
+            if part.startswith(prefix)
+            and "/" not in part[len(prefix) :]
+            and part.endswith(suffix)
+        ]
+
+    def resolve_target(self, rels_part, target):
+        """Resolve a relationship target to a package part name, or None."""
+        target = unquote(target.split("#", 1)[0])
+        if target.startswith("/"):
+            resolved = posixpath.normpath(target.lstrip("/"))
+        else:
+            resolved = posixpath.normpath(
+                posixpath.join(self._base_dir(rels_part), target)
+            )
+        if resolved == "." or resolved == ".." or resolved.startswith("../"):
+            return None
+        return resolved
+
+    # Relationships
+
+    def _load_relationships(self):
+        self._relationships = {}
+        for source, rels_part in self.rels_parts.items():
+            try:
+                root = lxml.etree.parse(str(self.parts[rels_part])).getroot()
+            except Exception as e:
+                self._rels_errors[rels_part] = e
+                continue
+
+            relationships = []
+            for rel in root.iter(f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"):
+                target = rel.get("Target") or ""
+                external = rel.get("TargetMode") == "External" or target.startswith(
+                    ("http", "mailto:")
+                )
+                relationships.append(
+                    Relationship(
+                        id=rel.get("Id"),
+                        type=rel.get("Type", ""),
+                        target=target,
+                        external=external,
+                        target_part=(
+                            None
+                            if external or not target
+                            else self.resolve_target(rels_part, target)
+                        ),
+                        sourceline=rel.sourceline,
+                    )
+                )
+            self._relationships[source] = relationships
+
+    @property
+    def rels_errors(self):
+        """Map of .rels part name -> exception for parts that failed to parse."""
+        if self._relationships is None:
+            self._load_relationships()
+        return self._rels_errors
+
+    def relationships(self, source):
+        """Relationships of a source part, in document order ([] if none)."""
+        if self._relationships is None:
+            self._load_relationships()
+        return self._relationships.get(source, [])
+
+    def has_relationships(self, source):
+        """True if the source part has a .rels part that parsed successfully."""
+        if self._relationships is None:
+            self._load_relationships()
+        return source in self._relationships
+
+    def all_relationships(self):
+        """Yield (source part, .rels part, relationship) for every relationship."""
+        if self._relationships is None:
+            self._load_relationships()
+        for source, relationships in self._relationships.items():
+            rels_part = self.rels_parts[source]
+            for rel in relationships:
+                yield source, rels_part, rel
+
+    def root_name(self, part):
+        """Local name of a part's root element, read without parsing the whole part."""
+        if part not in self._root_names:
+            path = str(self.parts[part])
+            for _, elem in lxml.etree.iterparse(path, events=("start",)):
+                self._root_names[part] = lxml.etree.QName(elem).localname
+                break
+        return self._root_names[part]
+
+    # Content types
+
+    def _load_content_types(self):
+        """Parse [Content_Types].xml into (overrides, defaults).
+
+        Raises FileNotFoundError if the part is missing and propagates parse
+        errors, so callers can report them.
+        """
+        if CONTENT_TYPES_PART not in self.parts:
+            raise FileNotFoundError(CONTENT_TYPES_PART)
+        root = lxml.etree.parse(str(self.parts[CONTENT_TYPES_PART])).getroot()
+
+        overrides = {}  # Part name -> content type
+        for override in root.iter(f"{{{CONTENT_TYPES_NAMESPACE}}}Override"):
+            part_name = override.get("PartName")
+            if part_name is not None:
+                overrides[part_name.lstrip("/")] = override.get("ContentType")
+
+        defaults = {}  # Lower-case extension -> content type
+        for default in root.iter(f"{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+            extension = default.get("Extension")
+            if extension is not None:
+                defaults[extension.lower()] = default.get("ContentType")
+
+        return overrides, defaults
+
+    @property
+    def content_types(self):
+        """(overrides, defaults) declared in [Content_Types].xml."""
+        if self._content_types is None:
+            self._content_types = self._load_content_types()
+        return self._content_types
@@ -2,6 +2,7 @@
 Validator for PowerPoint presentation XML files against XSD schemas.
 """
 
+import posixpath
 import re
 
 from .base import BaseSchemaValidator
@@ -25,6 +26,11 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         "tablestyleid": "tablestyles",
     }
 
+    # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+    UUID_PATTERN = re.compile(
+        r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+    )
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         # Test 0: XML well-formedness
@@ -76,37 +82,9 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
         errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
-
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        for _, file_errors in self._part_results("uuid_ids", self._check_uuid_ids):
+            errors.extend(file_errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
@@ -118,6 +96,35 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All UUID-like IDs contain valid hex values")
             return True
 
+    def _check_uuid_ids(self, xml_file):
+        """UUID ID errors in one part."""
+        import lxml.etree
+
+        errors = []
+        try:
+            root = lxml.etree.parse(str(xml_file)).getroot()
+
+            # Check all elements for ID attributes
+            for elem in root.iter():
+                for attr, value in elem.attrib.items():
+                    # Check if this is an ID attribute
+                    attr_name = attr.split("}")[-1].lower()
+                    if attr_name == "id" or attr_name.endswith("id"):
+                        # Check if value looks like a UUID (has the right length and pattern structure)
+                        if self._looks_like_uuid(value):
+                            # Validate that it contains only hex characters in the right positions
+                            if not self.UUID_PATTERN.match(value):
+                                errors.append(
+                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                    f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+                                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
         # Remove common UUID delimiters
@@ -132,7 +139,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = self.package.parts_in("ppt/slideMasters", ".xml")
 
         if not slide_masters:
             if self.verbose:
@@ -142,29 +149,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                slide_master_path = self.package.path(slide_master)
+                root = lxml.etree.parse(str(slide_master_path)).getroot()
 
                 # Find the corresponding _rels file for this slide master
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+                rels_part = self.package.rels_parts.get(slide_master)
 
-                if not rels_file.exists():
+                if rels_part is None:
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        f"  {slide_master}: "
+                        f"Missing relationships file: {self.package.rels_part_name(slide_master)}"
                     )
                     continue
-
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels_part in self.package.rels_errors:
+                    raise self.package.rels_errors[rels_part]
 
                 # Build a set of valid relationship IDs that point to slide layouts
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
+                valid_layout_rids = {
+                    rel.id
+                    for rel in self.package.relationships(slide_master)
+                    if "slideLayout" in rel.type
+                }
 
                 # Find all sldLayoutId elements in the slide master
                 for sld_layout_id in root.findall(
@@ -177,15 +182,13 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                     if r_id and r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
+                            f"  {slide_master}: "
                             f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
                             f"references r:id='{r_id}' which is not found in slide layout relationships"
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(f"  {slide_master}: Error: {e}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
@@ -202,32 +205,25 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
-
-        for rels_file in slide_rels_files:
-            try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all slideLayout relationships
-                layout_rels = [
-                    rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
-                ]
 
-                if len(layout_rels) > 1:
-                    errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
-                    )
-
-            except Exception as e:
+        for rels_part in self._slide_rels_parts():
+            if rels_part in self.package.rels_errors:
+                error = self.package.rels_errors[rels_part]
+                errors.append(f"  {rels_part}: Error: {error}")
+                continue
+
+            # Find all slideLayout relationships
+            slide = self.package.source_part(rels_part)
+            layout_rels = [
+                rel
+                for rel in self.package.relationships(slide)
+                if "slideLayout" in rel.type
+            ]
+
+            if len(layout_rels) > 1:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {rels_part}: has {len(layout_rels)} slideLayout references"
                 )
 
         if errors:
@@ -240,52 +236,41 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    def _slide_rels_parts(self):
+        """Relationship parts of the slides (ppt/slides/_rels/*.xml.rels)."""
+        return self.package.parts_in("ppt/slides/_rels", ".xml.rels")
+
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
         errors = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_parts = self._slide_rels_parts()
 
-        if not slide_rels_files:
+        if not slide_rels_parts:
             if self.verbose:
                 print("PASSED - No slide relationship files found")
             return True
 
-        for rels_file in slide_rels_files:
-            try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
-                        if target:
-                            # Normalize the target path to handle relative paths
-                            normalized_target = target.replace("../", "")
-
-                            # Track which slide references this notesSlide
-                            slide_name = rels_file.stem.replace(
-                                ".xml", ""
-                            )  # e.g., "slide1"
-
-                            if normalized_target not in notes_slide_references:
-                                notes_slide_references[normalized_target] = []
-                            notes_slide_references[normalized_target].append(
-                                (slide_name, rels_file)
-                            )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        for rels_part in slide_rels_parts:
+            if rels_part in self.package.rels_errors:
+                error = self.package.rels_errors[rels_part]
+                errors.append(f"  {rels_part}: Error: {error}")
+                continue
+
+            slide = self.package.source_part(rels_part)
+            # e.g., "slide1"
+            slide_name = posixpath.splitext(posixpath.basename(slide))[0]
+
+            # Find all notesSlide relationships
+            for rel in self.package.relationships(slide):
+                if "notesSlide" in rel.type and rel.target:
+                    # Group by resolved part so differently written targets match
+                    target = rel.target_part or rel.target
+                    notes_slide_references.setdefault(target, []).append(
+                        (slide_name, rels_part)
+                    )
 
         # Check for duplicate references
         for target, references in notes_slide_references.items():
@@ -294,8 +279,8 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 errors.append(
                     f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
                 )
-                for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+                for slide_name, rels_part in references:
+                    errors.append(f"    - {rels_part}")
 
         if errors:
             print(
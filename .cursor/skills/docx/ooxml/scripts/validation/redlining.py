@@ -2,11 +2,14 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
-import zipfile
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+from .cache import original_part
+
+# Edit distance beyond which a changed block is reported as a whole replacement
+MAX_DIFF_EDITS = 1000
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -27,92 +30,64 @@ class RedliningValidator:
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        # Parse the modified document once for both the pre-check and the comparison
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            modified_root = ET.parse(modified_file).getroot()
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
 
+        # Check for w:del or w:ins tags authored by Claude
+        del_elements = modified_root.findall(".//w:del", self.namespaces)
+        ins_elements = modified_root.findall(".//w:ins", self.namespaces)
+        author_attr = f"{{{self.namespaces['w']}}}author"
+
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not any(
+            elem.get(author_attr) == "Claude" for elem in del_elements + ins_elements
+        ):
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
             return True
 
-    def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        # Read the original document.xml straight from the original docx
+        try:
+            original_xml = original_part(self.original_docx, "word/document.xml")
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+        if original_xml is None:
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+
+        try:
+            original_root = ET.fromstring(original_xml)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+
+        # Remove Claude's tracked changes from both documents
+        self._remove_claude_tracked_changes(original_root)
+        self._remove_claude_tracked_changes(modified_root)
+
+        # Extract and compare text content
+        modified_paragraphs = self._extract_paragraphs(modified_root)
+        original_paragraphs = self._extract_paragraphs(original_root)
+
+        if "\n".join(modified_paragraphs) != "\n".join(original_paragraphs):
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(
+                original_paragraphs, modified_paragraphs
+            )
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _generate_detailed_diff(self, original_paragraphs, modified_paragraphs):
+        """Generate detailed character-level differences for changed paragraphs."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,92 +102,46 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        word_diff = self._get_word_diff(original_paragraphs, modified_paragraphs)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
+    def _get_word_diff(self, original_paragraphs, modified_paragraphs):
+        """Generate a character-level word diff of the changed paragraphs.
+
+        Output follows `git diff --word-diff=plain -U0`: only changed lines are
+        shown, with removed text as [-text-] and added text as {+text+}.
+        """
+        # Map each distinct paragraph text to a small integer so the paragraph-level
+        # diff compares hashes, and identical paragraphs are skipped cheaply
+        ids = {}
+        original_ids = [ids.setdefault(p, len(ids)) for p in original_paragraphs]
+        modified_ids = [ids.setdefault(p, len(ids)) for p in modified_paragraphs]
+
+        # Group adjacent deletions and insertions into changed blocks (diff hunks)
+        blocks = []
+        for tag, i1, i2, j1, j2 in _myers_diff(
+            original_ids, modified_ids, MAX_DIFF_EDITS
+        ):
+            if tag == "equal":
+                continue
+            if blocks and blocks[-1][1] == i1 and blocks[-1][3] == j1:
+                blocks[-1] = (blocks[-1][0], i2, blocks[-1][2], j2)
+            else:
+                blocks.append((i1, i2, j1, j2))
+
+        lines = []
+        for i1, i2, j1, j2 in blocks:
+            # Diff the changed block character by character
+            old_text = "\n".join(original_paragraphs[i1:i2])
+            new_text = "\n".join(modified_paragraphs[j1:j2])
+            lines.extend(_render_word_diff(old_text, new_text))
+
+        return "\n".join(line for line in lines if line.strip())
 
     def _remove_claude_tracked_changes(self, root):
         """Remove tracked changes authored by Claude from the XML root."""
@@ -251,8 +180,8 @@ class RedliningValidator:
                     parent.insert(del_index, child)
                 parent.remove(del_elem)
 
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
+    def _extract_paragraphs(self, root):
+        """Extract the text of each paragraph from Word XML.
 
         Empty paragraphs are skipped to avoid false positives when tracked
         insertions add only structural elements without text content.
@@ -272,7 +201,131 @@ class RedliningValidator:
             if paragraph_text:
                 paragraphs.append(paragraph_text)
 
-        return "\n".join(paragraphs)
+        return paragraphs
+
+
+def _myers_diff(a, b, max_edits=None):
+    """
+    Diff two sequences with Myers' O(ND) algorithm.
+
+    Args:
+        a: Original sequence
+        b: Modified sequence
+        max_edits: Give up and report one "replace" block beyond this many edits
+
+    Returns:
+        list: (tag, i1, i2, j1, j2) opcodes like difflib's, where tag is "equal",
+        "delete", "insert" or "replace"
+    """
+    # Trim the common prefix and suffix, which is most of a document
+    n, m = len(a), len(b)
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < n - prefix
+        and suffix < m - prefix
+        and a[n - 1 - suffix] == b[m - 1 - suffix]
+    ):
+        suffix += 1
+
+    opcodes = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+    middle = _myers_middle(a[prefix : n - suffix], b[prefix : m - suffix], max_edits)
+    for tag, i1, i2, j1, j2 in middle:
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(("equal", n - suffix, n, m - suffix, m))
+    return opcodes
+
+
+def _myers_middle(a, b, max_edits):
+    """Myers diff of two sequences that share no common prefix or suffix."""
+    n, m = len(a), len(b)
+    if not n and not m:
+        return []
+    if not n or not m:
+        return [("insert" if not n else "delete", 0, n, 0, m)]
+
+    limit = n + m if max_edits is None else min(n + m, max_edits)
+    offset = limit + 1
+    v = [0] * (2 * limit + 3)  # Furthest x reached on each diagonal k (index k+offset)
+    trace = []
+    for d in range(limit + 1):
+        trace.append(v[offset - d - 1 : offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]  # Move down (insertion)
+            else:
+                x = v[offset + k - 1] + 1  # Move right (deletion)
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m)
+    return [("replace", 0, n, 0, m)]
+
+
+def _myers_backtrack(trace, n, m):
+    """Walk the Myers trace back from (n, m) and group the moves into opcodes."""
+    moves = []  # (tag, x, y) for each step, collected end to start
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]  # Diagonals -d-1 .. d+1 before step d
+        k = x - y
+        if k == -d or (k != d and v[k - 1 + d + 1] < v[k + 1 + d + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k + d + 1]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x, y = x - 1, y - 1
+            moves.append(("equal", x, y))
+        if d > 0:
+            if x == prev_x:
+                moves.append(("insert", x, prev_y))
+            else:
+                moves.append(("delete", prev_x, y))
+        x, y = prev_x, prev_y
+    moves.reverse()
+
+    opcodes = []
+    for tag, x, y in moves:
+        di = 0 if tag == "insert" else 1
+        dj = 0 if tag == "delete" else 1
+        if opcodes and opcodes[-1][0] == tag:
+            _, i1, i2, j1, j2 = opcodes[-1]
+            opcodes[-1] = (tag, i1, i2 + di, j1, j2 + dj)
+        else:
+            opcodes.append((tag, x, x + di, y, y + dj))
+    return opcodes
+
+
+def _render_word_diff(old_text, new_text):
+    """Render a character-level diff as lines with [-removed-] and {+added+} markers."""
+    lines = [""]
+
+    def emit(text, start, end):
+        for index, piece in enumerate(text.split("\n")):
+            if index:
+                lines.append("")
+            if piece:
+                lines[-1] += f"{start}{piece}{end}"
+
+    for tag, i1, i2, j1, j2 in _myers_diff(old_text, new_text, MAX_DIFF_EDITS):
+        if tag == "equal":
+            emit(old_text[i1:i2], "", "")
+            continue
+        if tag in ("delete", "replace"):
+            emit(old_text[i1:i2], "[-", "-]")
+        if tag in ("insert", "replace"):
+            emit(new_text[j1:j2], "{+", "+}")
+    return lines
 
 
 if __name__ == "__main__":
@@ -26,23 +26,46 @@ Usage:
     doc.save()
 """
 
+import copy
 import html
+import os
 import random
 import shutil
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
-from defusedxml import minidom
+import lxml.etree
 from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import XMLEditor, _clark_name, _create_parser
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Attributes holding 8-digit hex paragraph/durable IDs that must not be reused
+HEX_ID_ATTRIBUTES = (
+    "w14:paraId",
+    "w14:textId",
+    "w15:paraId",
+    "w16cid:paraId",
+    "w16cid:durableId",
+    "w16cex:durableId",
+)
+
+# Namespaces the editor may need to declare when injecting attributes
+NAMESPACES = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
+    "w15": "http://schemas.microsoft.com/office/word/2012/wordml",
+    "w16cid": "http://schemas.microsoft.com/office/word/2016/wordml/cid",
+    "w16cex": "http://schemas.microsoft.com/office/word/2018/wordml/cex",
+    "w16du": "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
+}
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -53,11 +76,17 @@ class DocxXMLEditor(XMLEditor):
     - w:id (for w:ins and w:del elements)
 
     Attributes:
-        dom (defusedxml.minidom.Document): The DOM document for direct manipulation
+        dom (lxml.etree._ElementTree): The parsed tree for direct manipulation
+        hex_ids (set): paraId/durableId values in use, shared with other editors
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        hex_ids: Optional[set] = None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,52 +95,96 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            hex_ids: Set of paraId/durableId values already in use. Pass the same set
+                to every editor of a document to keep generated IDs unique across parts.
         """
         super().__init__(xml_path)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self.hex_ids = hex_ids if hex_ids is not None else set()
+
+        # Seed the ID counters with a single scan of the document
+        self._next_change_id = 0
+        self._change_tags = {self._qname("w:ins"), self._qname("w:del")}
+        self._change_id_key = self._qname("w:id", attribute=True)
+        self._hex_id_keys = [
+            self._qname(name, attribute=True) for name in HEX_ID_ATTRIBUTES
+        ]
+        for elem in self.root.iter(lxml.etree.Element):
+            self._register_ids(elem)
+
+    def _qname(self, name, attribute=False):
+        """Resolve a prefixed name, falling back to the well-known Word namespaces."""
+        return super()._qname(name, attribute) or _clark_name(
+            name, NAMESPACES, attribute
+        )
+
+    def _register_ids(self, elem):
+        """Record the tracked change ID and hex IDs used by an element."""
+        if elem.tag in self._change_tags:
+            change_id = elem.get(self._change_id_key)
+            if change_id:
+                try:
+                    self._next_change_id = max(self._next_change_id, int(change_id) + 1)
+                except ValueError:
+                    pass
+        for key in self._hex_id_keys:
+            hex_id = elem.get(key)
+            if hex_id:
+                self.hex_ids.add(hex_id)
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next available tracked change ID."""
+        change_id = self._next_change_id
+        self._next_change_id += 1
+        return change_id
+
+    def _ensure_namespace(self, prefix):
+        """Ensure a namespace from NAMESPACES is declared on the root element."""
+        root = self.root
+        if prefix in root.nsmap:
+            return
+
+        # lxml cannot add declarations to an existing element, so replace the
+        # root with a copy that declares the prefix and move the content over
+        new_root = self._parser.makeelement(
+            root.tag,
+            attrib=dict(root.attrib),
+            nsmap={**root.nsmap, prefix: NAMESPACES[prefix]},
+        )
+        new_root.text = root.text
+        new_root.extend(list(root))
+        preceding = list(root.itersiblings(preceding=True))
+        following = list(root.itersiblings())
+        self.dom._setroot(new_root)
+        for node in reversed(preceding):
+            new_root.addprevious(node)
+        for node in reversed(following):
+            new_root.addnext(node)
+
+        # The old root element is gone from the tag index
+        self._tag_index.pop(new_root.tag, None)
+        self._attr_index.pop(new_root.tag, None)
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16du"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16du",
-                "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
-            )
+        self._ensure_namespace("w16du")
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w16cex",
-                "http://schemas.microsoft.com/office/word/2018/wordml/cex",
-            )
+        self._ensure_namespace("w16cex")
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
-        if not root.hasAttribute("xmlns:w14"):  # type: ignore
-            root.setAttribute(  # type: ignore
-                "xmlns:w14",
-                "http://schemas.microsoft.com/office/word/2010/wordml",
-            )
+        self._ensure_namespace("w14")
+
+    def _new_element(self, name):
+        """Create a detached element that keeps the prefix used in name."""
+        tag = lxml.etree.QName(self._qname(name))
+        prefix = name.split(":")[0] if ":" in name else None
+        nsmap = {prefix: tag.namespace} if tag.namespace else None
+        return self._parser.makeelement(tag.text, nsmap=nsmap)
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -131,13 +204,19 @@ class DocxXMLEditor(XMLEditor):
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+        # Register IDs already present in the new content before allocating any
+        for node in nodes:
+            if isinstance(node.tag, str):
+                for elem in node.iter(lxml.etree.Element):
+                    self._register_ids(elem)
+
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
-            parent = elem.parentNode
-            while parent:
-                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
+            parent = elem.getparent()
+            while parent is not None:
+                if parent.tagName == "w:del":
                     return True
-                parent = parent.parentNode
+                parent = parent.getparent()
             return False
 
         def add_rsid_to_p(elem):
@@ -150,10 +229,10 @@ class DocxXMLEditor(XMLEditor):
             # Add w14:paraId and w14:textId if not present
             if not elem.hasAttribute("w14:paraId"):
                 self._ensure_w14_namespace()
-                elem.setAttribute("w14:paraId", _generate_hex_id())
+                elem.setAttribute("w14:paraId", _generate_hex_id(self.hex_ids))
             if not elem.hasAttribute("w14:textId"):
                 self._ensure_w14_namespace()
-                elem.setAttribute("w14:textId", _generate_hex_id())
+                elem.setAttribute("w14:textId", _generate_hex_id(self.hex_ids))
 
         def add_rsid_to_r(elem):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
@@ -195,17 +274,13 @@ class DocxXMLEditor(XMLEditor):
 
         def add_xml_space_to_t(elem):
             # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
-            if (
-                elem.firstChild
-                and elem.firstChild.nodeType == elem.firstChild.TEXT_NODE
-            ):
-                text = elem.firstChild.data
-                if text and (text[0].isspace() or text[-1].isspace()):
-                    if not elem.hasAttribute("xml:space"):
-                        elem.setAttribute("xml:space", "preserve")
+            text = elem.text
+            if text and (text[0].isspace() or text[-1].isspace()):
+                if not elem.hasAttribute("xml:space"):
+                    elem.setAttribute("xml:space", "preserve")
 
         for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+            if not isinstance(node.tag, str):
                 continue
 
             # Handle the node itself
@@ -237,29 +312,14 @@ class DocxXMLEditor(XMLEditor):
             for elem in node.getElementsByTagName("w16cex:commentExtensible"):
                 add_comment_extensible_date(elem)
 
-    def replace_node(self, elem, new_content):
-        """Replace node with automatic attribute injection."""
-        nodes = super().replace_node(elem, new_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def insert_after(self, elem, xml_content):
-        """Insert after with automatic attribute injection."""
-        nodes = super().insert_after(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+    def _nodes_inserted(self, nodes):
+        """Inject attributes into nodes added by replace_node/insert_*/append_to.
 
-    def insert_before(self, elem, xml_content):
-        """Insert before with automatic attribute injection."""
-        nodes = super().insert_before(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def append_to(self, elem, xml_content):
-        """Append to with automatic attribute injection."""
-        nodes = super().append_to(elem, xml_content)
+        Attributes are injected before the nodes are indexed so lookups by the
+        generated values (e.g. w:id) find them.
+        """
         self._inject_attributes_to_nodes(nodes)
-        return nodes
+        super()._nodes_inserted(nodes)
 
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
@@ -306,7 +366,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._new_element("w:del")
 
             # Process each run
             for run in runs:
@@ -317,26 +377,21 @@ class DocxXMLEditor(XMLEditor):
                 elif not run.hasAttribute("w:rsidDel"):
                     run.setAttribute("w:rsidDel", self.rsid)
 
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
+                # Renaming keeps the text and attributes like xml:space
+                for t_elem in run.getElementsByTagName("w:t"):
+                    t_elem.tag = self._qname("w:delText")
 
             # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            del_wrapper.extend(list(ins_elem))
 
             # Add del wrapper back to ins
-            ins_elem.appendChild(del_wrapper)
+            ins_elem.append(del_wrapper)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
 
+        self.reindex(elem)
         return [elem]
 
     def revert_deletion(self, elem):
@@ -391,22 +446,15 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+            ins_elem = self._new_element("w:ins")
 
             for run in runs:
                 # Clone the run
-                new_run = run.cloneNode(True)
+                new_run = copy.deepcopy(run)
 
                 # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+                for del_text in new_run.getElementsByTagName("w:delText"):
+                    del_text.tag = self._qname("w:t")
 
                 # Update run attributes: w:rsidDel → w:rsidR
                 if new_run.hasAttribute("w:rsidDel"):
@@ -415,7 +463,7 @@ class DocxXMLEditor(XMLEditor):
                 elif not new_run.hasAttribute("w:rsidR"):
                     new_run.setAttribute("w:rsidR", self.rsid)
 
-                ins_elem.appendChild(new_run)
+                ins_elem.append(new_run)
 
             # Insert the new insertion after the deletion
             nodes = self.insert_after(del_elem, ins_elem.toxml())
@@ -425,7 +473,7 @@ class DocxXMLEditor(XMLEditor):
                 created_insertion = nodes[0]
 
         # Return based on input type
-        if is_single_del and created_insertion:
+        if is_single_del and created_insertion is not None:
             return [elem, created_insertion]
         else:
             return [elem]
@@ -442,40 +490,33 @@ class DocxXMLEditor(XMLEditor):
         Returns:
             str: Transformed XML with tracked change wrapping
         """
-        wrapper = f'<root xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">{xml_content}</root>'
-        doc = minidom.parseString(wrapper)
-        para = doc.getElementsByTagName("w:p")[0]
+        wrapper = f'<root xmlns:w="{NAMESPACES["w"]}">{xml_content}</root>'
+        root = lxml.etree.fromstring(wrapper.encode("utf-8"), _create_parser())
+        para = root.getElementsByTagName("w:p")[0]
+        w = f"{{{NAMESPACES['w']}}}"
 
         # Ensure w:pPr exists
         pPr_list = para.getElementsByTagName("w:pPr")
         if not pPr_list:
-            pPr = doc.createElement("w:pPr")
-            para.insertBefore(
-                pPr, para.firstChild
-            ) if para.firstChild else para.appendChild(pPr)
+            pPr = para.makeelement(f"{w}pPr")
+            para.insert(0, pPr)
         else:
             pPr = pPr_list[0]
 
         # Ensure w:rPr exists in w:pPr
         rPr_list = pPr.getElementsByTagName("w:rPr")
         if not rPr_list:
-            rPr = doc.createElement("w:rPr")
-            pPr.appendChild(rPr)
+            rPr = lxml.etree.SubElement(pPr, f"{w}rPr")
         else:
             rPr = rPr_list[0]
 
         # Add <w:ins/> to w:rPr
-        ins_marker = doc.createElement("w:ins")
-        rPr.insertBefore(
-            ins_marker, rPr.firstChild
-        ) if rPr.firstChild else rPr.appendChild(ins_marker)
+        rPr.insert(0, para.makeelement(f"{w}ins"))
 
         # Wrap all non-pPr children in <w:ins>
-        ins_wrapper = doc.createElement("w:ins")
-        for child in [c for c in para.childNodes if c.nodeName != "w:pPr"]:
-            para.removeChild(child)
-            ins_wrapper.appendChild(child)
-        para.appendChild(ins_wrapper)
+        ins_wrapper = para.makeelement(f"{w}ins")
+        ins_wrapper.extend([c for c in para if c.tag != f"{w}pPr"])
+        para.append(ins_wrapper)
 
         return para.toxml()
 
@@ -487,7 +528,7 @@ class DocxXMLEditor(XMLEditor):
         For w:p (numbered list): adds <w:del/> to w:rPr in w:pPr, wraps content in <w:del>
 
         Args:
-            elem: A w:r or w:p DOM element without existing tracked changes
+            elem: A w:r or w:p element without existing tracked changes
 
         Returns:
             Element: The modified element
@@ -500,17 +541,9 @@ class DocxXMLEditor(XMLEditor):
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
 
-            # Convert w:t → w:delText
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+            # Convert w:t → w:delText (renaming preserves attributes like xml:space)
+            for t_elem in elem.getElementsByTagName("w:t"):
+                t_elem.tag = self._qname("w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             if elem.hasAttribute("w:rsidR"):
@@ -520,14 +553,14 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
-            parent = elem.parentNode
-            parent.insertBefore(del_wrapper, elem)
-            parent.removeChild(elem)
-            del_wrapper.appendChild(elem)
+            del_wrapper = self._new_element("w:del")
+            elem.addprevious(del_wrapper)
+            del_wrapper.tail, elem.tail = elem.tail, None
+            del_wrapper.append(elem)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self.reindex(del_wrapper)
 
             return del_wrapper
 
@@ -546,28 +579,17 @@ class DocxXMLEditor(XMLEditor):
                 rPr_list = pPr.getElementsByTagName("w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
-                    pPr.appendChild(rPr)
+                    rPr = self._new_element("w:rPr")
+                    pPr.append(rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
-                rPr.insertBefore(
-                    del_marker, rPr.firstChild
-                ) if rPr.firstChild else rPr.appendChild(del_marker)
-
-            # Convert w:t → w:delText in all runs
-            for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
-                # Copy ALL child nodes (not just firstChild) to handle entities
-                while t_elem.firstChild:
-                    del_text.appendChild(t_elem.firstChild)
-                # Preserve attributes like xml:space
-                for i in range(t_elem.attributes.length):
-                    attr = t_elem.attributes.item(i)
-                    del_text.setAttribute(attr.name, attr.value)
-                t_elem.parentNode.replaceChild(del_text, t_elem)
+                rPr.insert(0, self._new_element("w:del"))
+
+            # Convert w:t → w:delText in all runs (renaming preserves xml:space)
+            for t_elem in elem.getElementsByTagName("w:t"):
+                t_elem.tag = self._qname("w:delText")
 
             # Update run attributes: w:rsidR → w:rsidDel
             for run in elem.getElementsByTagName("w:r"):
@@ -578,14 +600,13 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
-            for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
-                elem.removeChild(child)
-                del_wrapper.appendChild(child)
-            elem.appendChild(del_wrapper)
+            del_wrapper = self._new_element("w:del")
+            del_wrapper.extend([c for c in elem if c.tag != self._qname("w:pPr")])
+            elem.append(del_wrapper)
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self.reindex(elem)
 
             return elem
 
@@ -593,15 +614,43 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
-def _generate_hex_id() -> str:
+def _generate_hex_id(used: Optional[set] = None) -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
     Values are constrained to be less than 0x7FFFFFFF per OOXML spec:
     - paraId must be < 0x80000000
     - durableId must be < 0x7FFFFFFF
     We use the stricter constraint (0x7FFFFFFF) for both.
+
+    Args:
+        used: Optional set of IDs already in use. The new ID is guaranteed not to be
+            in it and is added to it.
     """
-    return f"{random.randint(1, 0x7FFFFFFE):08X}"
+    while True:
+        hex_id = f"{random.randint(1, 0x7FFFFFFE):08X}"
+        if used is None:
+            return hex_id
+        if hex_id not in used:
+            used.add(hex_id)
+            return hex_id
+
+
+def _link_tree(source, target):
+    """Mirror the files under source into target with hard links.
+
+    Files are copied where linking is not possible (e.g. across filesystems).
+    Existing files in target are replaced.
+    """
+    for path in Path(source).rglob("*"):
+        if path.is_dir():
+            continue
+        destination = Path(target) / path.relative_to(source)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.unlink(missing_ok=True)
+        try:
+            os.link(path, destination)
+        except OSError:
+            shutil.copy2(path, destination)
 
 
 def _generate_rsid() -> str:
@@ -610,7 +659,12 @@ def _generate_rsid() -> str:
 
 
 class Document:
-    """Manages comments in unpacked Word documents."""
+    """Manages comments in unpacked Word documents.
+
+    The unpacked directory is not copied. Parts opened with doc[...] (and files
+    added by the caller) are materialized in an overlay directory,
+    doc.unpacked_path, and only those are written back on save().
+    """
 
     def __init__(
         self,
@@ -636,14 +690,17 @@ class Document:
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Temporary directory holding the overlay of changed parts. Files in the
+        # overlay shadow the same paths in the original directory.
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self.unpacked_path.mkdir()
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Validation baseline, packed on first use (see original_docx). Original
+        # versions of parts overwritten by save() are kept so it stays correct.
+        self._original_docx = None
+        self._pristine_path = Path(self.temp_dir) / "pristine"
+        self._created_parts = set()
 
         self.word_path = self.unpacked_path / "word"
 
@@ -658,6 +715,9 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # paraId/durableId values used by any loaded part (shared by all editors)
+        self._hex_ids = set()
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -665,8 +725,7 @@ class Document:
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
         # Load existing comments and determine next ID (before setup modifies files)
-        self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
+        self.existing_comments, self.next_comment_id = self._load_existing_comments()
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -702,11 +761,19 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
-            if not file_path.exists():
+            if not self._part_exists(file_path):
                 raise ValueError(f"XML file not found: {xml_path}")
+            if not file_path.exists():
+                # Materialize the part in the overlay on first access
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(self.original_path / xml_path, file_path)
             # Use DocxXMLEditor with RSID, author, and initials for all editors
             self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                hex_ids=self._hex_ids,
             )
         return self._editors[xml_path]
 
@@ -728,8 +795,8 @@ class Document:
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        para_id = _generate_hex_id(self._hex_ids)
+        durable_id = _generate_hex_id(self._hex_ids)
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
@@ -785,8 +852,8 @@ class Document:
 
         parent_info = self.existing_comments[parent_comment_id]
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
+        para_id = _generate_hex_id(self._hex_ids)
+        durable_id = _generate_hex_id(self._hex_ids)
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         # Add comment ranges to document.xml immediately
@@ -835,6 +902,30 @@ class Document:
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
+    @property
+    def original_docx(self) -> Path:
+        """Packed copy of the unmodified document, used as the validation baseline.
+
+        Built on first access.
+        """
+        if self._original_docx is None:
+            original_docx = Path(self.temp_dir) / "original.docx"
+            if self._pristine_path.exists() or self._created_parts:
+                # save() has written into the original directory; rebuild its
+                # unmodified state from the kept originals
+                baseline_dir = Path(self.temp_dir) / "baseline"
+                _link_tree(self.original_path, baseline_dir)
+                for rel_path in self._created_parts:
+                    (baseline_dir / rel_path).unlink(missing_ok=True)
+                if self._pristine_path.exists():
+                    _link_tree(self._pristine_path, baseline_dir)
+                pack_document(baseline_dir, original_docx, validate=False)
+                shutil.rmtree(baseline_dir)
+            else:
+                pack_document(self.original_path, original_docx, validate=False)
+            self._original_docx = original_docx
+        return self._original_docx
+
     def validate(self) -> None:
         """
         Validate the document against XSD schema and redlining rules.
@@ -842,19 +933,29 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
+        # Validators need the complete document: link the original files and
+        # lay the overlay on top
+        merged_dir = Path(self.temp_dir) / "merged"
+        shutil.rmtree(merged_dir, ignore_errors=True)
+        _link_tree(self.original_path, merged_dir)
+        _link_tree(self.unpacked_path, merged_dir)
+
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            merged_dir, self.original_docx, verbose=False
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            merged_dir, self.original_docx, verbose=False
         )
 
         # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+        try:
+            if not schema_validator.validate():
+                raise ValueError("Schema validation failed")
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
+        finally:
+            shutil.rmtree(merged_dir, ignore_errors=True)
 
     def save(self, destination=None, validate=True) -> None:
         """
@@ -867,7 +968,7 @@ class Document:
             validate: If True, validates document before saving (default: True).
         """
         # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        if self._part_exists(self.comments_path):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
@@ -879,40 +980,66 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Write the overlay to the destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
+        if target_path.resolve() == self.original_path.resolve():
+            if self._original_docx is None:
+                self._keep_pristine_parts()
+        else:
+            shutil.copytree(self.original_path, target_path, dirs_exist_ok=True)
         shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
 
-    # ==================== Private: Initialization ====================
+    def _part_exists(self, path):
+        """Check whether a part exists in the overlay or the original directory."""
+        path = Path(path)
+        return (
+            path.exists()
+            or (self.original_path / path.relative_to(self.unpacked_path)).exists()
+        )
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
+    def _create_part(self, path, template):
+        """Create a new part in the overlay from a template file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(template, path)
 
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+    def _keep_pristine_parts(self):
+        """Record the original state of every part the overlay is about to overwrite."""
+        for path in self.unpacked_path.rglob("*"):
+            if path.is_dir():
+                continue
+            rel_path = path.relative_to(self.unpacked_path)
+            original = self.original_path / rel_path
+            pristine = self._pristine_path / rel_path
+            if not original.exists():
+                if not pristine.exists():
+                    self._created_parts.add(rel_path)
+            elif not pristine.exists() and rel_path not in self._created_parts:
+                pristine.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(original, pristine)
+
+    # ==================== Private: Initialization ====================
 
     def _load_existing_comments(self):
-        """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
-            return {}
+        """Load existing comments from files to enable replies.
+
+        Returns:
+            tuple: (existing comments by ID, next available comment ID)
+        """
+        if not self._part_exists(self.comments_path):
+            return {}, 0
 
         editor = self["word/comments.xml"]
         existing = {}
+        max_id = -1
 
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
+        for comment_elem in editor.root.getElementsByTagName("w:comment"):
             comment_id = comment_elem.getAttribute("w:id")
             if not comment_id:
                 continue
+            try:
+                max_id = max(max_id, int(comment_id))
+            except ValueError:
+                continue
 
             # Find para_id from the w:p element within the comment
             para_id = None
@@ -926,7 +1053,7 @@ class Document:
 
             existing[int(comment_id)] = {"para_id": para_id}
 
-        return existing
+        return existing, max_id + 1
 
     # ==================== Private: Setup Methods ====================
 
@@ -953,9 +1080,9 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
+        if not self._part_exists(path):
             # Copy from template
-            shutil.copy(TEMPLATE_DIR / "people.xml", path)
+            self._create_part(path, TEMPLATE_DIR / "people.xml")
 
     def _add_content_type_for_people(self, path):
         """Add people.xml content type to [Content_Types].xml if not already present."""
@@ -965,7 +1092,7 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
+        root = editor.root
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
@@ -976,8 +1103,8 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor.root
+        root_tag = root.tagName
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid = editor.get_next_rid()
 
@@ -1004,7 +1131,7 @@ class Document:
         if track_revisions:
             track_revisions_exists = any(
                 elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
+                for elem in editor.root.getElementsByTagName(f"{prefix}:trackRevisions")
             )
 
             if not track_revisions_exists:
@@ -1012,20 +1139,20 @@ class Document:
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor.root.getElementsByTagName(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
                         break
                 if not inserted:
                     # Insert as first child of settings
-                    if root.firstChild:
-                        editor.insert_before(root.firstChild, track_rev_xml)
+                    if len(root):
+                        editor.insert_before(root[0], track_rev_xml)
                     else:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor.root.getElementsByTagName(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1036,13 +1163,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor.root.getElementsByTagName(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
+                clr_elements = editor.root.getElementsByTagName(
                     f"{prefix}:clrSchemeMapping"
                 )
                 if clr_elements:
@@ -1069,8 +1196,8 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+        if not self._part_exists(self.comments_path):
+            self._create_part(self.comments_path, TEMPLATE_DIR / "comments.xml")
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
@@ -1090,9 +1217,9 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
+        if not self._part_exists(self.comments_extended_path):
+            self._create_part(
+                self.comments_extended_path, TEMPLATE_DIR / "commentsExtended.xml"
             )
 
         editor = self["word/commentsExtended.xml"]
@@ -1106,8 +1233,8 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+        if not self._part_exists(self.comments_ids_path):
+            self._create_part(self.comments_ids_path, TEMPLATE_DIR / "commentsIds.xml")
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
@@ -1117,9 +1244,9 @@ class Document:
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
+        if not self._part_exists(self.comments_extensible_path):
+            self._create_part(
+                self.comments_extensible_path, TEMPLATE_DIR / "commentsExtensible.xml"
             )
 
         editor = self["word/commentsExtensible.xml"]
@@ -1159,21 +1286,21 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
+        for rel_elem in editor.root.getElementsByTagName("Relationship"):
             if rel_elem.getAttribute("Target") == target:
                 return True
         return False
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
+        for override_elem in editor.root.getElementsByTagName("Override"):
             if override_elem.getAttribute("PartName") == part_name:
                 return True
         return False
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
+        for person_elem in editor.root.getElementsByTagName("w15:person"):
             if person_elem.getAttribute("w15:author") == author:
                 return True
         return False
@@ -1183,7 +1310,7 @@ class Document:
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._part_exists(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
@@ -1207,8 +1334,8 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor.root
+        root_tag = root.tagName
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid_num = int(editor.get_next_rid()[3:])
 
@@ -1247,7 +1374,7 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor.root
 
         # Add Override elements
         overrides = [
@@ -0,0 +1,78 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from .document import DocxXMLEditor
+
+DOCUMENT_XML = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p>
+      <w:r w:rsidR="00AB12CD">
+        <w:t xml:space="preserve">Para 3 </w:t>
+      </w:r>
+      <w:r>
+        <w:t>tail</w:t>
+      </w:r>
+    </w:p>
+    <w:p>
+      <w:del w:id="7" w:author="Someone">
+        <w:r>
+          <w:delText>Removed</w:delText>
+        </w:r>
+      </w:del>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestTrackedChangeLookups(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "document.xml"
+        path.write_text(DOCUMENT_XML, encoding="utf-8")
+        self.editor = DocxXMLEditor(path, rsid="00112233")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_deleted_text_is_not_found_as_text(self):
+        """Test that w:t renamed to w:delText is no longer returned for w:t"""
+        t_elem = self.editor.get_node(tag="w:t", contains="Para 3 ")
+        self.editor.suggest_deletion(t_elem.getparent())
+
+        with self.assertRaises(ValueError):
+            self.editor.get_node(tag="w:t", contains="Para 3 ")
+        del_text = self.editor.get_node(tag="w:delText", contains="Para 3 ")
+        self.assertIs(del_text, t_elem)
+
+    def test_rename_after_attribute_lookup(self):
+        """Test that an attribute-indexed element is dropped once renamed"""
+        t_elem = self.editor.get_node(tag="w:t", attrs={"xml:space": "preserve"})
+        self.editor.suggest_deletion(t_elem.getparent())
+
+        with self.assertRaises(ValueError):
+            self.editor.get_node(tag="w:t", attrs={"xml:space": "preserve"})
+        self.assertIs(
+            self.editor.get_node(tag="w:delText", attrs={"xml:space": "preserve"}),
+            t_elem,
+        )
+
+    def test_restored_text_is_found_as_text(self):
+        """Test that w:delText turned back into w:t by revert_deletion is found"""
+        self.editor.get_node(tag="w:t", contains="tail")  # Build the w:t index
+        del_elem = self.editor.get_node(tag="w:del", attrs={"w:id": "7"})
+        self.editor.revert_deletion(del_elem)
+
+        restored = self.editor.get_node(tag="w:t", contains="Removed")
+        ins_tag = self.editor._qname("w:ins")
+        self.assertEqual(restored.getparent().getparent().tag, ins_tag)
+        # The original deletion is kept, so its text is still deleted text
+        self.editor.get_node(tag="w:delText", contains="Removed")
+
+
+if __name__ == "__main__":
+    unittest.main()
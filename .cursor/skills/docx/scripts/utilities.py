@@ -3,8 +3,9 @@
 Utilities for editing OOXML documents.
 
 This module provides XMLEditor, a tool for manipulating XML files with support for
-line-number-based node finding and DOM manipulation. Each element is automatically
-annotated with its original line and column position during parsing.
+line-number-based node finding and DOM manipulation. Documents are parsed with lxml,
+which records the source line of every element, and elements are indexed by tag,
+attribute value and source line so lookups do not rescan the whole document.
 
 Example usage:
     editor = XMLEditor("document.xml")
@@ -30,26 +31,93 @@ Example usage:
     editor.save()
 """
 
+import bisect
 import html
 from pathlib import Path
 from typing import Optional, Union
 
-import defusedxml.minidom
-import defusedxml.sax
+import lxml.etree
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+class XMLElement(lxml.etree.ElementBase):
+    """
+    lxml element with the prefixed-name helpers of the DOM API.
+
+    Elements returned by XMLEditor are regular lxml elements (tag is in
+    "{namespace}local" form, attributes live in .attrib, text in .text/.tail).
+    The camelCase helpers below accept prefixed names such as "w:id" and resolve
+    them against the namespaces in scope, so code written against minidom nodes
+    keeps working.
+    """
+
+    @property
+    def tagName(self):
+        """Prefixed tag name, e.g. "w:p"."""
+        local = lxml.etree.QName(self).localname
+        return f"{self.prefix}:{local}" if self.prefix else local
+
+    nodeName = tagName
+
+    @property
+    def parentNode(self):
+        return self.getparent()
+
+    def getAttribute(self, name):
+        """Return the value of a prefixed attribute, or "" if it is not set."""
+        key = _clark_name(name, self.nsmap, attribute=True)
+        return self.get(key, "") if key else ""
+
+    def hasAttribute(self, name):
+        key = _clark_name(name, self.nsmap, attribute=True)
+        return key is not None and key in self.attrib
+
+    def setAttribute(self, name, value):
+        key = _clark_name(name, self.nsmap, attribute=True)
+        if key is None:
+            raise ValueError(f"Undeclared namespace prefix in attribute: {name}")
+        self.set(key, value)
+
+    def removeAttribute(self, name):
+        key = _clark_name(name, self.nsmap, attribute=True)
+        if key is not None:
+            self.attrib.pop(key, None)
+
+    def getElementsByTagName(self, name):
+        """Return descendant elements (not self) with the given prefixed tag, or "*"."""
+        if name == "*":
+            return list(self.iterdescendants(lxml.etree.Element))
+        tag = _clark_name(name, self.nsmap)
+        return list(self.iterdescendants(tag)) if tag else []
+
+    def toxml(self):
+        """Serialize the element (without its tail text) to a string."""
+        return lxml.etree.tostring(self, encoding="unicode", with_tail=False)
 
 
 class XMLEditor:
     """
     Editor for manipulating OOXML XML files with line-number-based node finding.
 
-    This class parses XML files and tracks the original line and column position
-    of each element. This enables finding nodes by their line number in the original
-    file, which is useful when working with Read tool output.
+    This class parses XML files with lxml, which tracks the original source line
+    of each element (element.sourceline). This enables finding nodes by their line
+    number in the original file, which is useful when working with Read tool output.
+    Elements inserted by the editor have no source line.
+
+    Lookups go through indexes (tag -> elements, (tag, attr, value) -> elements and
+    source line -> elements) that are built on first use and maintained by
+    replace_node/insert_*/append_to. Code that mutates the tree directly should
+    call reindex(node) afterwards; stale entries left behind by renamed or
+    removed elements are skipped and dropped on lookup.
+
+    Parsing never resolves entities, loads DTDs or touches the network.
 
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
-        dom: Parsed DOM tree with parse_position attributes on elements
+        dom: Parsed lxml ElementTree; elements are XMLElement instances
+        root: The document's root element
     """
 
     def __init__(self, xml_path):
@@ -70,8 +138,19 @@ class XMLEditor:
             header = f.read(200).decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
-        parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._parser = _create_parser()
+        self.dom = lxml.etree.parse(str(self.xml_path), self._parser)
+
+        # Lookup indexes, built on first use. Entries for removed elements are
+        # dropped lazily.
+        self._tag_index = {}  # tag -> {elem: None} (ordered set)
+        self._attr_index = {}  # tag -> {attr: {value: {elem: None}}}
+        self._line_index = None  # source line -> [elem]
+        self._indexed_lines = []
+
+    @property
+    def root(self):
+        return self.dom.getroot()
 
     def get_node(
         self,
@@ -94,7 +173,7 @@ class XMLEditor:
                       Supports both entity notation (&#8220;) and Unicode characters (\u201c).
 
         Returns:
-            defusedxml.minidom.Element: The matching DOM element
+            XMLElement: The matching element
 
         Raises:
             ValueError: If node not found or multiple matches found
@@ -109,12 +188,32 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
+        clark_tag = self._qname(tag)
+        clark_attrs = None
+        if attrs is not None:
+            clark_attrs = {
+                self._qname(name, attribute=True): value for name, value in attrs.items()
+            }
+            if None in clark_attrs:
+                clark_tag = None  # Undeclared prefix: nothing can match
+
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
         matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        for elem in self._candidates(clark_tag, clark_attrs, line_number):
+            if not self._is_attached(elem):
+                continue
+
+            # Renamed elements (e.g. w:t -> w:delText) stay in their old index
+            if elem.tag != clark_tag:
+                self._tag_index.get(clark_tag, {}).pop(elem, None)
+                continue
+
             # Check line_number filter
             if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
+                elem_line = elem.sourceline
 
                 # Handle both single line number and range
                 if isinstance(line_number, range):
@@ -125,20 +224,16 @@ class XMLEditor:
                         continue
 
             # Check attrs filter
-            if attrs is not None:
+            if clark_attrs is not None:
                 if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
+                    elem.get(attr_name) == attr_value
+                    for attr_name, attr_value in clark_attrs.items()
                 ):
                     continue
 
             # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
+            if normalized_contains is not None:
+                if normalized_contains not in self._get_element_text(elem):
                     continue
 
             # If all applicable filters passed, this is a match
@@ -180,48 +275,155 @@ class XMLEditor:
             )
         return matches[0]
 
+    def reindex(self, node):
+        """
+        Add an element and all of its descendant elements to the lookup indexes.
+
+        Called automatically for nodes inserted through this editor. Indexing an
+        element twice is harmless, so callers may pass any subtree they changed.
+
+        Args:
+            node: Element whose subtree should be indexed
+        """
+        if not isinstance(node.tag, str):  # Comments and processing instructions
+            return
+        for elem in node.iter(lxml.etree.Element):
+            by_tag = self._tag_index.get(elem.tag)
+            if by_tag is None:
+                continue  # Tag not indexed yet; it will be built from the tree
+            by_tag[elem] = None
+            for attr_name, by_value in self._attr_index.get(elem.tag, {}).items():
+                by_value.setdefault(elem.get(attr_name, ""), {})[elem] = None
+
+    def _tag_lookup(self, tag):
+        """Return the indexed elements with tag, building that index on first use."""
+        by_tag = self._tag_index.get(tag)
+        if by_tag is None:
+            by_tag = self._tag_index[tag] = dict.fromkeys(self.root.iter(tag))
+        return by_tag
+
+    def _attr_lookup(self, tag, attr_name, value):
+        """Return indexed elements with tag whose attr_name equals value."""
+        by_attr = self._attr_index.setdefault(tag, {})
+        if attr_name not in by_attr:
+            by_value = by_attr[attr_name] = {}
+            for elem in self._tag_lookup(tag):
+                by_value.setdefault(elem.get(attr_name, ""), {})[elem] = None
+        return by_attr[attr_name].get(value, {})
+
+    def _build_line_index(self):
+        """Index elements by their line in the original file, on first use."""
+        if self._line_index is not None:
+            return
+        self._line_index = {}
+        for elem in self.root.iter(lxml.etree.Element):
+            if elem.sourceline is not None:
+                self._line_index.setdefault(elem.sourceline, []).append(elem)
+        self._indexed_lines = sorted(self._line_index)
+
+    def _candidates(self, tag, attrs, line_number):
+        """
+        Return a small superset of the elements that can match the given filters.
+
+        Candidates may include removed elements or elements whose tag or attributes
+        have since changed, so get_node re-checks every filter on them.
+        """
+        if tag is None:
+            return []
+        if attrs:
+            return list(
+                min(
+                    (self._attr_lookup(tag, name, value) for name, value in attrs.items()),
+                    key=len,
+                )
+            )
+        if line_number is not None:
+            self._build_line_index()
+            if isinstance(line_number, range) and line_number.step == 1:
+                lo = bisect.bisect_left(self._indexed_lines, line_number.start)
+                hi = bisect.bisect_left(self._indexed_lines, line_number.stop)
+                lines = self._indexed_lines[lo:hi]
+            elif isinstance(line_number, range):
+                lines = [line for line in line_number if line in self._line_index]
+            else:
+                lines = [line_number]
+            return [
+                elem
+                for line in lines
+                for elem in self._line_index.get(line, ())
+                if elem.tag == tag
+            ]
+        return list(self._tag_lookup(tag))
+
+    def _is_attached(self, elem):
+        """Check that elem is still part of the document (not removed)."""
+        node = elem
+        parent = node.getparent()
+        while parent is not None:
+            node, parent = parent, parent.getparent()
+        if node is self.dom.getroot():
+            return True
+        self._tag_index.get(elem.tag, {}).pop(elem, None)
+        return False
+
+    def _nodes_inserted(self, nodes):
+        """
+        Hook called after new nodes are attached to the document.
+
+        Subclasses can override this to post-process inserted nodes; they must call
+        super() so the nodes are indexed.
+
+        Args:
+            nodes: List of inserted elements
+        """
+        for node in nodes:
+            self.reindex(node)
+
     def _get_element_text(self, elem):
         """
-        Recursively extract all text content from an element.
+        Extract all text content from an element.
 
-        Skips text nodes that contain only whitespace (spaces, tabs, newlines),
-        which typically represent XML formatting rather than document content.
+        Skips text that contains only whitespace (spaces, tabs, newlines), which
+        typically represents XML formatting rather than document content.
 
         Args:
-            elem: defusedxml.minidom.Element to extract text from
+            elem: Element to extract text from
 
         Returns:
-            str: Concatenated text from all non-whitespace text nodes within the element
+            str: Concatenated text from all non-whitespace text within the element
         """
-        text_parts = []
-        for node in elem.childNodes:
-            if node.nodeType == node.TEXT_NODE:
-                # Skip whitespace-only text nodes (XML formatting)
-                if node.data.strip():
-                    text_parts.append(node.data)
-            elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+        return "".join(text for text in elem.itertext() if text.strip())
+
+    def _qname(self, name, attribute=False):
+        """Resolve a prefixed name against the root element's namespaces."""
+        return _clark_name(name, self.root.nsmap, attribute)
+
+    def _new_element(self, name):
+        """Create a detached element from a prefixed name declared on the root."""
+        return self._parser.makeelement(self._qname(name))
 
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
 
         Args:
-            elem: defusedxml.minidom.Element to replace
+            elem: Element to replace
             new_content: String containing XML to replace the node with
 
         Returns:
-            List[defusedxml.minidom.Node]: All inserted nodes
+            List[XMLElement]: All inserted nodes
 
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
+        parent = elem.getparent()
+        index = parent.index(elem)
+        tail = elem.tail
+        nodes = self._insert_fragment(parent, index, new_content)
+        parent.remove(elem)
+        if tail:
+            nodes[-1].tail = (nodes[-1].tail or "") + tail
+        self._nodes_inserted(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -229,23 +431,18 @@ class XMLEditor:
         Insert XML content after a DOM element.
 
         Args:
-            elem: defusedxml.minidom.Element to insert after
+            elem: Element to insert after
             xml_content: String containing XML to insert
 
         Returns:
-            List[defusedxml.minidom.Node]: All inserted nodes
+            List[XMLElement]: All inserted nodes
 
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
+        parent = elem.getparent()
+        nodes = self._insert_fragment(parent, parent.index(elem) + 1, xml_content)
+        self._nodes_inserted(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -253,19 +450,18 @@ class XMLEditor:
         Insert XML content before a DOM element.
 
         Args:
-            elem: defusedxml.minidom.Element to insert before
+            elem: Element to insert before
             xml_content: String containing XML to insert
 
         Returns:
-            List[defusedxml.minidom.Node]: All inserted nodes
+            List[XMLElement]: All inserted nodes
 
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
+        parent = elem.getparent()
+        nodes = self._insert_fragment(parent, parent.index(elem), xml_content)
+        self._nodes_inserted(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -273,25 +469,26 @@ class XMLEditor:
         Append XML content as a child of a DOM element.
 
         Args:
-            elem: defusedxml.minidom.Element to append to
+            elem: Element to append to
             xml_content: String containing XML to append
 
         Returns:
-            List[defusedxml.minidom.Node]: All inserted nodes
+            List[XMLElement]: All inserted nodes
 
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        nodes = self._insert_fragment(elem, len(elem), xml_content)
+        self._nodes_inserted(nodes)
         return nodes
 
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
+        for rel_elem in self._candidates(self._qname("Relationship"), None, None):
+            if not self._is_attached(rel_elem):
+                continue
+            rel_id = rel_elem.get("Id", "")
             if rel_id.startswith("rId"):
                 try:
                     max_id = max(max_id, int(rel_id[3:]))
@@ -306,69 +503,98 @@ class XMLEditor:
         Serializes the DOM tree and writes it back to the original file path,
         preserving the original encoding (ascii or utf-8).
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>'
+        content = lxml.etree.tostring(
+            self.dom, encoding=self.encoding, xml_declaration=False
+        )
+        self.xml_path.write_bytes(declaration.encode(self.encoding) + content)
 
-    def _parse_fragment(self, xml_content):
+    def _insert_fragment(self, parent, index, xml_content):
         """
-        Parse XML fragment and return list of imported nodes.
+        Parse an XML fragment and insert its top-level nodes at parent[index].
+
+        Returns:
+            List of the inserted top-level nodes
+        """
+        wrapper = self._parse_fragment(xml_content, parent)
+        nodes = list(wrapper)
+        if wrapper.text:  # Keep text that precedes the first node
+            if index == 0:
+                parent.text = (parent.text or "") + wrapper.text
+            else:
+                previous = parent[index - 1]
+                previous.tail = (previous.tail or "") + wrapper.text
+        for offset, node in enumerate(nodes):
+            parent.insert(index + offset, node)
+        return nodes
+
+    def _parse_fragment(self, xml_content, context):
+        """
+        Parse XML fragment with the namespaces in scope at context.
 
         Args:
             xml_content: String containing XML fragment
+            context: Element whose in-scope namespaces the fragment may use
 
         Returns:
-            List of defusedxml.minidom.Node objects imported into this document
+            The wrapper element holding the parsed nodes
 
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
+        namespaces = [
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in context.nsmap.items()
         ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
-        return nodes
-
+        ns_decl = " ".join(namespaces)
+        wrapper = lxml.etree.fromstring(
+            f"<root {ns_decl}>{xml_content}</root>".encode("utf-8"), self._parser
+        )
+        # Drop namespace declarations repeated inside the fragment (e.g. from toxml())
+        lxml.etree.cleanup_namespaces(wrapper)
+        assert any(
+            isinstance(node.tag, str) for node in wrapper
+        ), "Fragment must contain at least one element"
+        # Inserted elements have no line in the original file
+        for elem in wrapper.iter(lxml.etree.Element):
+            elem.sourceline = 0
+        return wrapper
+
+
+def _clark_name(name, nsmap, attribute=False):
+    """
+    Convert a prefixed name ("w:id") to lxml's "{namespace}local" form.
 
-def _create_line_tracking_parser():
+    Unprefixed element names take the default namespace; unprefixed attribute
+    names have no namespace. Returns None if the prefix is not declared.
     """
-    Create a SAX parser that tracks line and column numbers for each element.
+    prefix, sep, local = name.rpartition(":")
+    if not sep:
+        uri = None if attribute else nsmap.get(None)
+        return f"{{{uri}}}{name}" if uri else name
+    uri = XML_NAMESPACE if prefix == "xml" else nsmap.get(prefix)
+    return f"{{{uri}}}{local}" if uri else None
 
-    Monkey patches the SAX content handler to store the current line and column
-    position from the underlying expat parser onto each element as a parse_position
-    attribute (line, column) tuple.
 
-    Returns:
-        defusedxml.sax.xmlreader.XMLReader: Configured SAX parser
+def _create_parser():
     """
+    Create an lxml parser that returns XMLElement nodes.
 
-    def set_content_handler(dom_handler):
-        def startElementNS(name, tagName, attrs):
-            orig_start_cb(name, tagName, attrs)
-            cur_elem = dom_handler.elementStack[-1]
-            cur_elem.parse_position = (
-                parser._parser.CurrentLineNumber,  # type: ignore
-                parser._parser.CurrentColumnNumber,  # type: ignore
-            )
-
-        orig_start_cb = dom_handler.startElementNS
-        dom_handler.startElementNS = startElementNS
-        orig_set_content_handler(dom_handler)
+    Entities are not resolved and DTDs and network resources are never loaded,
+    which gives the same protection as defusedxml. lxml records each element's
+    source line as element.sourceline.
 
-    parser = defusedxml.sax.make_parser()
-    orig_set_content_handler = parser.setContentHandler
-    parser.setContentHandler = set_content_handler  # type: ignore
+    Returns:
+        lxml.etree.XMLParser: Configured parser
+    """
+    parser = lxml.etree.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        dtd_validation=False,
+        huge_tree=False,
+    )
+    parser.set_element_class_lookup(
+        lxml.etree.ElementDefaultClassLookup(element=XMLElement)
+    )
     return parser
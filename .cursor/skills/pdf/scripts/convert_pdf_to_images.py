@@ -1,29 +1,29 @@
 import os
 import sys
 
-from pdf2image import convert_from_path
+from PIL import Image
 
-
-# Converts each page of a PDF to a PNG image.
+from pdf_rasterizer import rasterize_pdf
 
 
-def convert(pdf_path, output_dir, max_dim=1000):
-    images = convert_from_path(pdf_path, dpi=200)
+# Converts each page of a PDF to a PNG image.
 
-    for i, image in enumerate(images):
-        # Scale image if needed to keep width/height under `max_dim`
-        width, height = image.size
-        if width > max_dim or height > max_dim:
-            scale_factor = min(max_dim / width, max_dim / height)
-            new_width = int(width * scale_factor)
-            new_height = int(height * scale_factor)
-            image = image.resize((new_width, new_height))
-        
-        image_path = os.path.join(output_dir, f"page_{i+1}.png")
-        image.save(image_path)
-        print(f"Saved page {i+1} as {image_path} (size: {image.size})")
 
-    print(f"Converted {len(images)} pages to PNG images")
+def convert(pdf_path, output_dir, max_dim=1000, workers=None):
+    # Pages are rendered in parallel, already scaled to keep width/height under
+    # `max_dim`, and written to disk one at a time as they are ready
+    count = 0
+    for page_number, rendered_path in rasterize_pdf(
+        pdf_path, output_dir, dpi=200, fmt="png", max_dim=max_dim, workers=workers
+    ):
+        image_path = os.path.join(output_dir, f"page_{page_number}.png")
+        os.replace(rendered_path, image_path)
+        with Image.open(image_path) as image:
+            size = image.size
+        print(f"Saved page {page_number} as {image_path} (size: {size})")
+        count += 1
+
+    print(f"Converted {count} pages to PNG images")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Pool of warm headless LibreOffice (soffice) workers shared by the Office tools.
+
+Starting soffice costs seconds per call, and concurrent calls that share the
+default user profile block or corrupt each other. SofficePool keeps N soffice
+processes running, each with its own isolated profile and listening on its own
+UNO socket, and hands them out to callers through a queue.
+
+When the Python UNO bridge (the `uno` module) is not importable, the pool falls
+back to one short-lived `soffice --headless` process per job. Jobs still get an
+isolated profile per worker slot, so concurrent callers do not collide.
+
+Profiles live in stable per-slot directories under SOFFICE_PROFILE_DIR (default:
+$XDG_CACHE_HOME/soffice_pool or ~/.cache/soffice_pool) and are kept between
+runs, so soffice only pays its first-start profile setup once per slot. A slot
+is locked while a worker uses it; a worker whose slot is held by another
+process takes the next free one.
+
+Example usage:
+    from soffice_pool import get_pool
+
+    pool = get_pool()
+    pdf_path = pool.convert("deck.pptx", "out_dir", "pdf")
+    pool.recalculate("model.xlsx")
+
+    # Dedicated pool for a batch job
+    with SofficePool(size=4) as pool:
+        for path in paths:
+            pool.convert(path, "out_dir", "pdf")
+"""
+
+import atexit
+import itertools
+import os
+import queue
+import socket
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.connection import NoConnectException
+except ImportError:  # LibreOffice's Python bridge is optional
+    uno = None
+
+try:
+    import fcntl
+except ImportError:  # Slot locking is POSIX-only
+    fcntl = None
+
+# Default number of warm workers for the shared pool
+DEFAULT_POOL_SIZE = int(os.environ.get("SOFFICE_POOL_SIZE", "1"))
+
+# Restart a worker after this many jobs to bound memory growth inside soffice
+MAX_JOBS_PER_WORKER = 50
+
+# Seconds to wait for a freshly started worker to accept UNO connections
+STARTUP_TIMEOUT = 30
+
+# Root of the persistent per-slot soffice profiles
+PROFILE_ROOT = Path(
+    os.environ.get("SOFFICE_PROFILE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "soffice_pool"
+)
+
+# Export filters used when a target format is given without an explicit filter
+DEFAULT_FILTERS = {
+    ("pdf", ".docx"): "writer_pdf_Export",
+    ("pdf", ".pptx"): "impress_pdf_Export",
+    ("pdf", ".xlsx"): "calc_pdf_Export",
+}
+
+RECALC_MACRO_URL = (
+    "vnd.sun.star.script:Standard.Module1.RecalculateAndSave"
+    "?language=Basic&location=application"
+)
+
+RECALC_MACRO = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
+<script:module xmlns:script="http://openoffice.org/2000/script" script:name="Module1" script:language="StarBasic">
+    Sub RecalculateAndSave()
+      ThisComponent.calculateAll()
+      ThisComponent.store()
+      ThisComponent.close(True)
+    End Sub
+</script:module>"""
+
+
+class SofficeError(RuntimeError):
+    """Raised when soffice fails to complete a job."""
+
+
+class SofficePool:
+    """Queue of isolated soffice workers handing out conversions and recalculations.
+
+    Attributes:
+        size: Number of workers in the pool
+        timeout: Default per-job timeout in seconds
+        uses_uno: True if workers are kept warm over UNO sockets
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, timeout=120):
+        """
+        Create the pool. Workers are started lazily on first use.
+
+        Args:
+            size: Number of soffice workers (default: SOFFICE_POOL_SIZE or 1)
+            timeout: Default per-job timeout in seconds (default: 120)
+        """
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.uses_uno = uno is not None
+        self._idle = queue.Queue()
+        self._workers = [_SofficeWorker(i, self.uses_uno) for i in range(self.size)]
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def convert(self, input_path, output_dir, convert_to, timeout=None):
+        """
+        Convert a document, mirroring `soffice --convert-to`.
+
+        Args:
+            input_path: Document to convert
+            output_dir: Directory for the converted file
+            convert_to: Target as "ext" or "ext:FilterName" (e.g. "pdf", "html:HTML")
+            timeout: Seconds before the job is aborted (default: pool timeout)
+
+        Returns:
+            Path: The converted file, named <input stem>.<ext> in output_dir
+
+        Raises:
+            FileNotFoundError: If soffice is not installed
+            TimeoutError: If the conversion does not finish in time
+            SofficeError: If soffice does not produce the output file
+        """
+        input_path = Path(input_path).resolve()
+        output_dir = Path(output_dir).resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        extension, _, filter_name = convert_to.partition(":")
+        output_path = output_dir / f"{input_path.stem}.{extension}"
+
+        with self._checkout() as worker:
+            worker.convert(
+                input_path,
+                output_dir,
+                output_path,
+                convert_to,
+                filter_name
+                or DEFAULT_FILTERS.get((extension, input_path.suffix.lower())),
+                timeout or self.timeout,
+            )
+
+        if not output_path.exists():
+            raise SofficeError(f"Conversion of {input_path.name} produced no output")
+        return output_path
+
+    def recalculate(self, input_path, timeout=None):
+        """
+        Recalculate all formulas in a spreadsheet and save it in place.
+
+        Args:
+            input_path: Spreadsheet to recalculate
+            timeout: Seconds before the job is aborted (default: pool timeout)
+
+        Raises:
+            FileNotFoundError: If soffice is not installed
+            TimeoutError: If the recalculation does not finish in time
+            SofficeError: If soffice reports an error
+        """
+        input_path = Path(input_path).resolve()
+        with self._checkout() as worker:
+            worker.recalculate(input_path, timeout or self.timeout)
+
+    def close(self):
+        """Stop all workers and release their profile slots."""
+        for worker in self._workers:
+            worker.stop(release_profile=True)
+
+    def _checkout(self):
+        return _Checkout(self._idle)
+
+
+class _Checkout:
+    """Context manager that borrows an idle worker and recycles it when needed."""
+
+    def __init__(self, idle):
+        self._idle = idle
+        self._worker = None
+
+    def __enter__(self):
+        self._worker = self._idle.get()
+        try:
+            self._worker.ensure_healthy()
+        except BaseException:
+            self._idle.put(self._worker)
+            raise
+        return self._worker
+
+    def __exit__(self, *exc_info):
+        worker = self._worker
+        worker.jobs += 1
+        if worker.jobs >= MAX_JOBS_PER_WORKER:
+            worker.stop()
+        self._idle.put(worker)
+
+
+class _SofficeWorker:
+    """One soffice slot with an isolated, persistent user profile."""
+
+    def __init__(self, index, use_uno):
+        self.index = index
+        self.use_uno = use_uno
+        self.profile_dir, self._profile_lock = _claim_profile(index)
+        self.process = None
+        self.desktop = None
+        self.jobs = 0
+        self._macro_installed = False
+
+    @property
+    def profile_url(self):
+        return self.profile_dir.as_uri()
+
+    # ==================== Lifecycle ====================
+
+    def ensure_healthy(self):
+        """Start the worker, or restart it if the process died or stopped responding."""
+        if not self.use_uno:
+            return
+        if self.process is not None and self.process.poll() is None:
+            try:
+                self.desktop.getComponents()
+                return
+            except Exception:
+                pass
+        self.stop()
+        self._start()
+
+    def _start(self):
+        port = _free_port()
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                f"-env:UserInstallation={self.profile_url}",
+                f"--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+                )
+                break
+            except NoConnectException:
+                if self.process.poll() is not None:
+                    raise SofficeError("soffice exited during startup")
+                if time.monotonic() > deadline:
+                    self.stop()
+                    raise TimeoutError("soffice did not start in time")
+                time.sleep(0.1)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        self.jobs = 0
+
+    def stop(self, release_profile=False):
+        """Terminate the soffice process (if any)."""
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass
+            self.desktop = None
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        self.jobs = 0
+        if release_profile and self._profile_lock is not None:
+            self._profile_lock.close()
+            self._profile_lock = None
+
+    def _kill(self):
+        if self.process is not None:
+            self.process.kill()
+
+    # ==================== Jobs ====================
+
+    def convert(
+        self, input_path, output_dir, output_path, convert_to, filter_name, timeout
+    ):
+        if not self.use_uno:
+            self._run_cli(
+                ["--convert-to", convert_to, "--outdir", str(output_dir), str(input_path)],
+                timeout,
+            )
+            return
+
+        def job():
+            document = self._load(input_path)
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(str(output_path)),
+                    _properties(FilterName=filter_name, Overwrite=True),
+                )
+            finally:
+                document.close(True)
+
+        self._run_uno(job, timeout)
+
+    def recalculate(self, input_path, timeout):
+        if not self.use_uno:
+            self._install_recalc_macro()
+            # soffice keeps running after the macro closes the document, so
+            # hitting the timeout is the expected way for this job to end
+            self._run_cli([RECALC_MACRO_URL, str(input_path)], timeout, timeout_ok=True)
+            return
+
+        def job():
+            document = self._load(input_path)
+            try:
+                document.calculateAll()
+                document.store()
+            finally:
+                document.close(True)
+
+        self._run_uno(job, timeout)
+
+    def _load(self, input_path):
+        document = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(input_path)),
+            "_blank",
+            0,
+            _properties(Hidden=True, ReadOnly=False),
+        )
+        if document is None:
+            raise SofficeError(f"soffice could not open {input_path.name}")
+        return document
+
+    def _run_uno(self, job, timeout):
+        # UNO calls cannot be interrupted; on timeout the process is killed,
+        # which makes the pending call fail and the worker restart on next use.
+        timer = threading.Timer(timeout, self._kill)
+        timer.start()
+        try:
+            job()
+        except Exception as e:
+            if not timer.is_alive():
+                raise TimeoutError(f"soffice job exceeded {timeout}s") from e
+            raise SofficeError(str(e)) from e
+        finally:
+            timer.cancel()
+
+    def _run_cli(self, args, timeout, timeout_ok=False):
+        try:
+            result = subprocess.run(
+                [
+                    "soffice",
+                    "--headless",
+                    "--norestore",
+                    f"-env:UserInstallation={self.profile_url}",
+                    *args,
+                ],
+                capture_output=True,
+                timeout=timeout,
+                text=True,
+            )
+        except subprocess.TimeoutExpired as e:
+            if timeout_ok:
+                return
+            raise TimeoutError(f"soffice job exceeded {timeout}s") from e
+        if result.returncode != 0:
+            raise SofficeError(result.stderr.strip() or "soffice failed")
+
+    def _install_recalc_macro(self):
+        """Install the recalculation macro into this worker's profile."""
+        if self._macro_installed:
+            return
+        macro_dir = self.profile_dir / "user" / "basic" / "Standard"
+        if not macro_dir.exists():
+            # Let soffice create the profile skeleton first
+            self._run_cli(["--terminate_after_init"], STARTUP_TIMEOUT)
+            macro_dir.mkdir(parents=True, exist_ok=True)
+        (macro_dir / "Module1.xba").write_text(RECALC_MACRO)
+        self._macro_installed = True
+
+
+def _properties(**values):
+    """Build a tuple of UNO PropertyValue structs."""
+    props = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        props.append(prop)
+    return tuple(props)
+
+
+def _claim_profile(index):
+    """
+    Lock a persistent profile slot, starting at `index`.
+
+    Returns:
+        tuple: (profile directory, open lock file or None without fcntl)
+    """
+    PROFILE_ROOT.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        return PROFILE_ROOT / f"slot{index}", None
+    for slot in itertools.count(index):
+        lock = open(PROFILE_ROOT / f"slot{slot}.lock", "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            continue
+        return PROFILE_ROOT / f"slot{slot}", lock
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide shared pool, creating it on first use."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SofficePool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
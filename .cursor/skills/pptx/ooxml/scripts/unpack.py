@@ -1,29 +1,395 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir>
+    python unpack.py <office_file> <output_dir> --workers 4 --media link
+"""
+
+import argparse
+import hashlib
+import os
 import random
-import sys
-import defusedxml.minidom
+import shutil
+import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from xml.sax.handler import ContentHandler, property_lexical_handler
+
+import defusedxml.sax
+
+# Total uncompressed XML size above which parts are formatted in parallel
+PARALLEL_THRESHOLD = 4 * 1024 * 1024
+
+# Per-user store of extracted media for --media link, keyed by SHA-256. Least
+# recently used files are evicted past the bound; unpacked links keep theirs.
+MEDIA_CACHE_DIR = Path(
+    os.environ.get("OOXML_MEDIA_CACHE")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "ooxml"
+    / "media"
+)
+MEDIA_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+MEDIA_MODES = ("extract", "link", "skip")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Unpack an Office file and pretty-print its XML parts"
+    )
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes used to format XML parts "
+        "(default: one per CPU for large files, otherwise 1)",
+    )
+    parser.add_argument(
+        "--media",
+        choices=MEDIA_MODES,
+        default="extract",
+        help="How to unpack non-XML parts: extract copies (default), "
+        "link hard links into a per-user cache, skip leaves them out",
+    )
+    args = parser.parse_args()
+
+    unpack_document(
+        args.office_file, args.output_dir, workers=args.workers, media=args.media
+    )
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, workers=None, media="extract"):
+    """Unpack an Office file, pretty-printing its XML parts.
+
+    Each XML part is streamed from the archive through a pretty-printer straight
+    to disk, so no part is ever held in memory as a DOM. The output is the same
+    as minidom's toprettyxml(indent="  ", encoding="ascii"), including its
+    placement of namespace declarations before the other attributes.
+
+    Args:
+        input_file: Path to the Office file
+        output_dir: Directory to unpack into (created if needed)
+        workers: Number of processes used to format XML parts. None picks one
+            per CPU for large packages and 1 otherwise.
+        media: How to unpack non-XML parts (media, fonts, embeddings):
+            "extract" writes them out, "link" hard links them from a per-user
+            cache of previously extracted media (replace such files instead of
+            writing into them), "skip" leaves them out (the result cannot be
+            packed back into a complete document)
+    """
+    if media not in MEDIA_MODES:
+        raise ValueError(f"media must be one of {', '.join(MEDIA_MODES)}")
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(input_file) as zf:
+        members = [info for info in zf.infolist() if not info.is_dir()]
+
+    xml_members = [info.filename for info in members if _is_xml_part(info.filename)]
+    other_members = [info for info in members if not _is_xml_part(info.filename)]
+
+    if workers is None:
+        xml_size = sum(info.file_size for info in members if _is_xml_part(info.filename))
+        workers = (os.cpu_count() or 1) if xml_size > PARALLEL_THRESHOLD else 1
+
+    if workers > 1 and len(xml_members) > 1:
+        # Largest parts first so one big part does not finish last
+        sizes = {info.filename: info.file_size for info in members}
+        xml_members.sort(key=sizes.get, reverse=True)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_open_worker_archive,
+            initargs=(str(input_file),),
+        ) as executor:
+            futures = [
+                executor.submit(_format_worker_member, name, str(output_path))
+                for name in xml_members
+            ]
+            _unpack_other_members(input_file, other_members, output_path, media)
+            for future in futures:
+                future.result()
+    else:
+        with zipfile.ZipFile(input_file) as zf:
+            for name in xml_members:
+                _format_member(zf, name, output_path)
+        _unpack_other_members(input_file, other_members, output_path, media)
+
+
+def _is_xml_part(name):
+    return name.endswith((".xml", ".rels"))
+
+
+def _member_path(output_path, name):
+    """Map an archive member name to a path under output_path, like ZipFile.extract."""
+    parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".", "..")]
+    return Path(output_path).joinpath(*parts)
+
+
+_worker_archive = None
+
+
+def _open_worker_archive(input_file):
+    """Open the archive once per worker process."""
+    global _worker_archive
+    _worker_archive = zipfile.ZipFile(input_file)
+
+
+def _format_worker_member(name, output_path):
+    _format_member(_worker_archive, name, output_path)
+
+
+def _format_member(zf, name, output_path):
+    """Stream one XML member through the pretty-printer into output_path."""
+    target = _member_path(output_path, name)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zf.open(name) as source, open(
+        target, "w", encoding="ascii", errors="xmlcharrefreplace", newline="\n"
+    ) as out:
+        handler = _PrettyPrintingHandler(out)
+        parser = defusedxml.sax.make_parser()
+        parser.setContentHandler(handler)
+        parser.setProperty(property_lexical_handler, handler)
+        parser.parse(source)
+
+
+def _unpack_other_members(input_file, members, output_path, media):
+    """Write non-XML members according to the media mode."""
+    if media == "skip" or not members:
+        return
+    with zipfile.ZipFile(input_file) as zf:
+        for info in members:
+            target = _member_path(output_path, info.filename)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Never write through an existing hard link into the media cache
+            target.unlink(missing_ok=True)
+            if media == "link":
+                try:
+                    os.link(_cached_media(zf, info), target)
+                    continue
+                except OSError:
+                    pass  # Unusable cache or different filesystem: copy instead
+            with zf.open(info) as source, open(target, "wb") as dest:
+                shutil.copyfileobj(source, dest, 1024 * 1024)
+    if media == "link":
+        _evict_media_cache()
+
+
+def _cached_media(zf, info):
+    """Return the cache file holding a member's content, extracting it if needed.
+
+    Files are named by the SHA-256 of their content, which is verified before a
+    cached file is reused (an unpacked link may have been written into).
+
+    Raises:
+        OSError: If the cache cannot be read or written
+    """
+    with zf.open(info) as source:
+        digest = _stream_sha256(source)
+    cached = MEDIA_CACHE_DIR / f"{digest}{Path(info.filename).suffix}"
+    try:
+        if cached.stat().st_size == info.file_size:
+            with open(cached, "rb") as f:
+                if _stream_sha256(f) == digest:
+                    os.utime(cached)  # Mark as recently used
+                    return cached
+    except FileNotFoundError:
+        pass
+
+    # Extract to a temporary name first so concurrent unpacks never see a partial file
+    MEDIA_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, partial = tempfile.mkstemp(dir=MEDIA_CACHE_DIR)
+    try:
+        with zf.open(info) as source, os.fdopen(fd, "wb") as dest:
+            shutil.copyfileobj(source, dest, 1024 * 1024)
+        # Links share the cache file's mode, so give it a regular file's
+        os.chmod(partial, 0o644)
+        os.replace(partial, cached)
+    except BaseException:
+        Path(partial).unlink(missing_ok=True)
+        raise
+    return cached
+
+
+def _stream_sha256(f):
+    digest = hashlib.sha256()
+    while chunk := f.read(1024 * 1024):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _evict_media_cache(max_bytes=MEDIA_CACHE_MAX_BYTES):
+    """Remove the least recently used media files until under max_bytes."""
+    entries = []
+    total = 0
+    try:
+        paths = list(MEDIA_CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in paths:
+        if path.name.startswith("tmp"):
+            continue  # Being extracted by a concurrent unpack
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        total += stat.st_size
+        entries.append((stat.st_mtime, stat.st_size, path))
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+
+
+def _write_data(data):
+    """Escape text and attribute values like minidom's writer."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def _is_xmlns(attr_name):
+    return attr_name == "xmlns" or attr_name.startswith("xmlns:")
+
+
+class _PrettyPrintingHandler(ContentHandler):
+    """SAX handler that writes XML formatted like minidom's toprettyxml(indent="  ").
+
+    minidom writes an element with a single text child inline
+    (<w:t>text</w:t>) and puts every other child on its own indented line. A
+    streaming writer cannot know an element's children in advance, so each
+    open element keeps its start tag unterminated, and buffers at most one text
+    child, until the next event decides between empty, inline and block form.
+    """
+
+    INDENT = "  "
+
+    def __init__(self, out):
+        super().__init__()
+        self._write = out.write
+        self._stack = []  # Open elements: [name, mode, buffered single child]
+        self._text = []
+        self._in_cdata = False
+
+    def startDocument(self):
+        self._write('<?xml version="1.0" encoding="ascii"?>\n')
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        self._enter_block()
+        self._write(self.INDENT * len(self._stack) + "<" + name)
+        # minidom's namespace-aware parser puts namespace declarations first
+        items = sorted(attrs.items(), key=lambda item: not _is_xmlns(item[0]))
+        for attr_name, value in items:
+            self._write(f' {attr_name}="{_write_data(value)}"')
+        self._stack.append([name, "empty", None])
+
+    def endElement(self, name):
+        self._flush_text()
+        _, mode, single = self._stack.pop()
+        if mode == "empty":
+            self._write("/>\n")
+        elif mode == "single":
+            self._write(">" + self._render(single, "", "") + f"</{name}>\n")
+        else:
+            self._write(self.INDENT * len(self._stack) + f"</{name}>\n")
+
+    def characters(self, content):
+        self._text.append(content)
+
+    def ignorableWhitespace(self, whitespace):
+        self._text.append(whitespace)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._add_child(("pi", f"<?{target} {data}?>"))
+
+    # LexicalHandler methods (comments and CDATA sections)
+
+    def comment(self, content):
+        self._flush_text()
+        self._add_child(("comment", f"<!--{content}-->"))
+
+    def startCDATA(self):
+        self._flush_text()
+        self._in_cdata = True
+
+    def endCDATA(self):
+        data = "".join(self._text)
+        self._text.clear()
+        self._in_cdata = False
+        self._add_child(("cdata", data))
+
+    def startDTD(self, name, public_id, system_id):
+        pass
+
+    def endDTD(self):
+        pass
+
+    def startEntity(self, name):
+        pass
+
+    def endEntity(self, name):
+        pass
+
+    # Layout
+
+    def _flush_text(self):
+        # SAX may deliver one text node in several chunks; minidom merges them
+        if not self._text or self._in_cdata:
+            return
+        text = "".join(self._text)
+        self._text.clear()
+        if self._stack:  # Text outside the root element is not a node
+            self._add_child(("text", text))
+
+    def _add_child(self, node):
+        if not self._stack:
+            # Document-level comment or processing instruction
+            self._write(self._render(node, "", "\n"))
+            return
+        top = self._stack[-1]
+        if top[1] == "empty" and node[0] in ("text", "cdata"):
+            top[1], top[2] = "single", node
+            return
+        self._enter_block()
+        self._write(self._render(node, self.INDENT * len(self._stack), "\n"))
+
+    def _enter_block(self):
+        """Switch the innermost open element to one-child-per-line form."""
+        if not self._stack or self._stack[-1][1] == "block":
+            return
+        top = self._stack[-1]
+        self._write(">\n")
+        if top[1] == "single":
+            self._write(self._render(top[2], self.INDENT * len(self._stack), "\n"))
+        top[1], top[2] = "block", None
+
+    @staticmethod
+    def _render(node, indent, newl):
+        kind, data = node
+        if kind == "text":
+            return _write_data(indent + data + newl)
+        if kind == "cdata":
+            return f"<![CDATA[{data}]]>"
+        return indent + data + newl
+
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+if __name__ == "__main__":
+    main()
@@ -3,25 +3,48 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--no-cache]
+    python validate.py --batch <manifest.jsonl> [--report <report.jsonl>] [--workers N]
+
+A batch manifest has one JSON object per line naming a document (an unpacked
+directory or a packed .docx/.pptx file) and its original:
+
+    {"document": "out/report-q3", "original": "templates/report.pptx"}
+
+Relative paths are resolved against the manifest's directory. The report has
+one JSON object per document, written as each document finishes.
 """
 
 import argparse
+import contextlib
+import io
+import json
+import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from unpack import unpack_document
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    ValidationCache,
+)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
+        nargs="?",
         help="Path to unpacked Office document directory",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
     parser.add_argument(
@@ -30,8 +53,46 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not reuse or record cached results for unchanged parts",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Validate every document listed in a JSONL manifest",
+    )
+    parser.add_argument(
+        "--report",
+        help="Write the batch report to this JSONL file (default: stdout)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of documents validated in parallel in batch mode "
+        "(default: one per CPU)",
+    )
     args = parser.parse_args()
 
+    if args.batch:
+        try:
+            success = run_batch(
+                args.batch,
+                report=args.report,
+                workers=args.workers,
+                cache=not args.no_cache,
+                verbose=args.verbose,
+            )
+        except ValueError as e:
+            # Malformed manifest, reported without a traceback
+            print(f"Error: {e}")
+            sys.exit(1)
+        sys.exit(0 if success else 1)
+
+    if not args.unpacked_dir or not args.original:
+        parser.error("unpacked_dir and --original are required without --batch")
+
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
@@ -43,26 +104,186 @@ def main():
     )
 
     # Run validations
+    if get_validators(file_extension) is None:
+        print(f"Error: Validation not supported for file type {file_extension}")
+        sys.exit(1)
+
+    success = validate_document(
+        unpacked_dir, original_file, verbose=args.verbose, cache=not args.no_cache
+    )
+    if success:
+        print("All validations PASSED!")
+
+    sys.exit(0 if success else 1)
+
+
+def get_validators(file_extension):
+    """Validator classes for a file type, or None if it is not supported."""
     match file_extension:
         case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
+            return [DOCXSchemaValidator, RedliningValidator]
         case ".pptx":
-            validators = [PPTXSchemaValidator]
+            return [PPTXSchemaValidator]
         case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+            return None
 
-    # Run validators
+
+def validate_document(
+    unpacked_dir, original_file, verbose=False, cache=False, timings=None
+):
+    """Run all validators for a document and return True if all pass.
+
+    Args:
+        unpacked_dir: Unpacked document directory
+        original_file: Original packed file the document was derived from
+        verbose: Enable verbose output
+        cache: True, False or a shared ValidationCache (see BaseSchemaValidator)
+        timings: Optional dict receiving seconds spent per validator
+    """
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+    for V in get_validators(Path(original_file).suffix.lower()):
+        start = time.perf_counter()
+        if issubclass(V, BaseSchemaValidator):
+            validator = V(unpacked_dir, original_file, verbose=verbose, cache=cache)
+        else:
+            validator = V(unpacked_dir, original_file, verbose=verbose)
         if not validator.validate():
             success = False
+        if timings is not None:
+            timings[V.__name__] = round(time.perf_counter() - start, 3)
+    return success
 
-    if success:
-        print("All validations PASSED!")
 
-    sys.exit(0 if success else 1)
+def run_batch(manifest, report=None, workers=None, cache=True, verbose=False):
+    """Validate every document in a manifest and write a JSONL report.
+
+    Documents are validated by a pool of worker processes. Each worker keeps
+    its compiled schemas, parsed baselines and an open result cache for the
+    whole batch, so documents derived from the same originals get cheaper as
+    the batch goes on.
+
+    Returns:
+        bool: True if every document passed
+    """
+    entries = _read_manifest(manifest)
+    workers = workers or os.cpu_count() or 1
+
+    out = open(report, "w", encoding="utf-8") if report else sys.stdout
+    passed = 0
+    try:
+        if workers > 1 and len(entries) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(entries)),
+                initializer=_init_batch_worker,
+                initargs=(cache, verbose),
+            ) as executor:
+                futures = [
+                    executor.submit(_validate_entry, index, entry)
+                    for index, entry in enumerate(entries)
+                ]
+                for future in as_completed(futures):
+                    passed += _write_record(out, future.result())
+        else:
+            _init_batch_worker(cache, verbose)
+            for index, entry in enumerate(entries):
+                passed += _write_record(out, _validate_entry(index, entry))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{passed}/{len(entries)} documents passed validation", file=sys.stderr)
+    return passed == len(entries)
+
+
+def _read_manifest(manifest):
+    """Read (document, original) entries, resolving paths against the manifest."""
+    base_dir = Path(manifest).parent
+    entries = []
+    with open(manifest, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                document, original = entry["document"], entry["original"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(
+                    f"{manifest}:{line_number}: expected an object with "
+                    f'"document" and "original": {e}'
+                ) from e
+            entries.append(
+                {
+                    "document": str(base_dir / document),
+                    "original": str(base_dir / original),
+                }
+            )
+    return entries
+
+
+def _write_record(out, record):
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+    return 1 if record["passed"] else 0
+
+
+_batch_options = {}
+
+
+def _init_batch_worker(cache, verbose):
+    """Set up the state one worker shares across all its documents."""
+    _batch_options["cache"] = ValidationCache() if cache else False
+    _batch_options["verbose"] = verbose
+
+
+def _validate_entry(index, entry):
+    """Validate one manifest entry and return its report record."""
+    document = Path(entry["document"])
+    original = Path(entry["original"])
+    record = {
+        "index": index,
+        "document": entry["document"],
+        "original": entry["original"],
+    }
+    timings = {}
+    output = io.StringIO()
+    start = time.perf_counter()
+
+    try:
+        if not original.is_file():
+            raise FileNotFoundError(f"{original} is not a file")
+        if get_validators(original.suffix.lower()) is None:
+            raise ValueError(
+                f"Validation not supported for file type {original.suffix}"
+            )
+
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(contextlib.redirect_stdout(output))
+            if document.is_dir():
+                unpacked_dir = document
+            elif document.is_file():
+                # Packed documents are unpacked into a scratch directory first
+                unpacked_dir = stack.enter_context(tempfile.TemporaryDirectory())
+                unpack_start = time.perf_counter()
+                unpack_document(document, unpacked_dir, workers=1)
+                timings["unpack"] = round(time.perf_counter() - unpack_start, 3)
+            else:
+                raise FileNotFoundError(f"{document} does not exist")
+
+            record["passed"] = validate_document(
+                unpacked_dir,
+                original,
+                verbose=_batch_options["verbose"],
+                cache=_batch_options["cache"],
+                timings=timings,
+            )
+    except Exception as e:
+        record["passed"] = False
+        record["error"] = str(e)
+
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    record["timings"] = timings
+    record["output"] = output.getvalue()
+    return record
 
 
 if __name__ == "__main__":
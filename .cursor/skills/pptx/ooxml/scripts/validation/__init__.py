@@ -3,13 +3,17 @@ Validation modules for Word document processing.
 """
 
 from .base import BaseSchemaValidator
+from .cache import ValidationCache
 from .docx import DOCXSchemaValidator
+from .package import PackageGraph
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "PackageGraph",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "ValidationCache",
 ]
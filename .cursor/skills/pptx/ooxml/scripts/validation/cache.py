@@ -0,0 +1,207 @@
+"""
+Persistent cache of per-part validation results.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+
+# Bump when a check changes what it reports, so stale verdicts are never reused
+VALIDATOR_VERSION = "1"
+
+# Default cache location and size bound (least recently used entries are evicted)
+CACHE_PATH = Path(
+    os.environ.get("OOXML_VALIDATION_CACHE")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "ooxml"
+    / "validation_cache.sqlite3"
+)
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def content_hash(path):
+    """SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Bound on the decompressed original parts kept in memory per process. Parts
+# larger than a quarter of it are never kept; callers that may meet large
+# parts should use open_original_part and stream them instead.
+ORIGINAL_PARTS_MAX_BYTES = 32 * 1024 * 1024
+
+_original_parts = OrderedDict()  # (file, mtime, size, part) -> bytes or None
+_original_parts_bytes = 0
+
+
+def original_part(original_file, part):
+    """Content of one part of a packed original file, or None if it has no such part.
+
+    Recently read parts are kept in memory, up to ORIGINAL_PARTS_MAX_BYTES,
+    so validators sharing a baseline (several checks, or many documents
+    derived from one template) read and decompress it once per process.
+    """
+    global _original_parts_bytes
+
+    original_file = Path(original_file).resolve()
+    stat = original_file.stat()
+    # mtime and size are part of the key so a replaced file is re-read
+    key = (str(original_file), stat.st_mtime_ns, stat.st_size, part)
+    if key in _original_parts:
+        _original_parts.move_to_end(key)
+        return _original_parts[key]
+
+    with open_original_part(original_file, part) as f:
+        data = None if f is None else f.read()
+
+    size = len(data or b"")
+    if size <= ORIGINAL_PARTS_MAX_BYTES // 4:
+        _original_parts[key] = data
+        _original_parts_bytes += size
+        while _original_parts_bytes > ORIGINAL_PARTS_MAX_BYTES:
+            _, evicted = _original_parts.popitem(last=False)
+            _original_parts_bytes -= len(evicted or b"")
+    return data
+
+
+@contextlib.contextmanager
+def open_original_part(original_file, part):
+    """Open one part of a packed original file as a binary stream.
+
+    Yields None if the file has no such part. The part is decompressed as it
+    is read, so large parts can be parsed incrementally.
+    """
+    with zipfile.ZipFile(original_file, "r") as zip_ref:
+        try:
+            stream = zip_ref.open(part)
+        except KeyError:
+            yield None
+            return
+        with stream:
+            yield stream
+
+
+class ValidationCache:
+    """On-disk store of JSON-serializable check results keyed by part content.
+
+    Each entry is keyed by the check name, the part name (checks embed it in
+    their messages and schemas are chosen by path), the SHA-256 of the part's
+    content and VALIDATOR_VERSION, so an unchanged part reuses its verdict
+    from any earlier run. The store is an SQLite database, which keeps
+    concurrent validators safe; once it grows past max_bytes the least
+    recently used entries are evicted.
+
+    Cache errors are never fatal: a cache that cannot be opened or written
+    behaves as if every lookup missed.
+    """
+
+    def __init__(self, path=None, max_bytes=CACHE_MAX_BYTES):
+        self.path = Path(path) if path is not None else CACHE_PATH
+        self.max_bytes = max_bytes
+        self._db = None
+        self._pending = {}  # Key -> JSON-encoded value written on flush
+        self._used = set()  # Keys read this run, refreshed on flush
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), timeout=30)
+            # WAL lets concurrent validators read while one of them writes
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            self._db.commit()
+        except (OSError, sqlite3.Error):
+            self._db = None
+
+    @staticmethod
+    def key(check, part, digest):
+        return f"{VALIDATOR_VERSION}:{check}:{part}:{digest}"
+
+    def get(self, key):
+        """Return the cached result for key, or None."""
+        if key in self._pending:
+            return json.loads(self._pending[key])
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        self._used.add(key)
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        """Store a result; entries are written in one transaction by flush()."""
+        self._pending[key] = json.dumps(value)
+
+    def flush(self):
+        """Write pending results, refresh recently used entries and evict to size."""
+        if self._db is None:
+            self._pending.clear()
+            return
+        if not (self._pending or self._used):
+            return
+        now = time.time()
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    [
+                        (key, encoded, len(encoded), now)
+                        for key, encoded in self._pending.items()
+                    ],
+                )
+                self._db.executemany(
+                    "UPDATE results SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in self._used],
+                )
+                self._evict()
+        except sqlite3.Error:
+            pass
+        self._pending.clear()
+        self._used.clear()
+
+    def _evict(self):
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        # Drop the least recently used entries until under the bound
+        excess = total - self.max_bytes
+        freed = 0
+        stale = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM results ORDER BY last_used"
+        ):
+            if freed >= excess:
+                break
+            stale.append((key,))
+            freed += size
+        self._db.executemany("DELETE FROM results WHERE key = ?", stale)
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,131 @@
+import itertools
+import random
+import unittest
+
+from validation.redlining import _myers_diff, _render_word_diff
+
+
+def lcs_length(a, b):
+    """Reference result: length of the longest common subsequence"""
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            if x == y:
+                current.append(previous[j] + 1)
+            else:
+                current.append(max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestMyersDiff(unittest.TestCase):
+
+    def assertValidOpcodes(self, a, b, opcodes):
+        """Opcodes cover both sequences in order and turn a into b"""
+        i = j = 0
+        rebuilt = []
+        for tag, i1, i2, j1, j2 in opcodes:
+            self.assertIn(tag, ("equal", "delete", "insert", "replace"))
+            self.assertEqual((i1, j1), (i, j))
+            if tag == "equal":
+                self.assertEqual(list(a[i1:i2]), list(b[j1:j2]))
+            if tag == "delete":
+                self.assertEqual(j1, j2)
+            if tag == "insert":
+                self.assertEqual(i1, i2)
+            rebuilt.extend(b[j1:j2])
+            i, j = i2, j2
+        self.assertEqual((i, j), (len(a), len(b)))
+        self.assertEqual(rebuilt, list(b))
+
+    def edits(self, opcodes):
+        return sum(
+            (i2 - i1) + (j2 - j1) for tag, i1, i2, j1, j2 in opcodes if tag != "equal"
+        )
+
+    def test_identical(self):
+        """Test that equal sequences are one equal block"""
+        self.assertEqual(_myers_diff("abc", "abc"), [("equal", 0, 3, 0, 3)])
+
+    def test_empty(self):
+        """Test empty sequences on either side"""
+        self.assertEqual(_myers_diff("", ""), [])
+        self.assertEqual(_myers_diff("", "ab"), [("insert", 0, 0, 0, 2)])
+        self.assertEqual(_myers_diff("ab", ""), [("delete", 0, 2, 0, 0)])
+
+    def test_common_prefix_and_suffix(self):
+        """Test a change in the middle of otherwise equal sequences"""
+        self.assertEqual(
+            _myers_diff("the cat sat", "the dog sat"),
+            [
+                ("equal", 0, 4, 0, 4),
+                ("delete", 4, 7, 4, 4),
+                ("insert", 7, 7, 4, 7),
+                ("equal", 7, 11, 7, 11),
+            ],
+        )
+
+    def test_all_short_sequences_are_minimal(self):
+        """Test every pair of short sequences against the LCS edit distance"""
+        sequences = [
+            "".join(chars)
+            for length in range(5)
+            for chars in itertools.product("ab", repeat=length)
+        ]
+        for a, b in itertools.product(sequences, repeat=2):
+            opcodes = _myers_diff(a, b)
+            self.assertValidOpcodes(a, b, opcodes)
+            self.assertEqual(
+                self.edits(opcodes), len(a) + len(b) - 2 * lcs_length(a, b), (a, b)
+            )
+
+    def test_random_sequences_are_minimal(self):
+        """Test random paragraph-id sequences against the LCS edit distance"""
+        rng = random.Random(0)
+        for _ in range(300):
+            a = [rng.randrange(6) for _ in range(rng.randint(0, 40))]
+            b = list(a)
+            for _ in range(rng.randint(0, 10)):
+                position = rng.randint(0, len(b))
+                if b and rng.random() < 0.5:
+                    del b[min(position, len(b) - 1)]
+                else:
+                    b.insert(position, rng.randrange(6))
+            opcodes = _myers_diff(a, b)
+            self.assertValidOpcodes(a, b, opcodes)
+            self.assertEqual(
+                self.edits(opcodes), len(a) + len(b) - 2 * lcs_length(a, b)
+            )
+
+    def test_max_edits_gives_up_with_replace(self):
+        """Test that a diff beyond max_edits is one replace block"""
+        self.assertEqual(
+            _myers_diff("xabcx", "xdefx", max_edits=2),
+            [("equal", 0, 1, 0, 1), ("replace", 1, 4, 1, 4), ("equal", 4, 5, 4, 5)],
+        )
+        opcodes = _myers_diff("xabcx", "xdefx", max_edits=6)
+        self.assertValidOpcodes("xabcx", "xdefx", opcodes)
+        self.assertEqual(self.edits(opcodes), 6)
+
+
+class TestRenderWordDiff(unittest.TestCase):
+
+    def test_changed_word(self):
+        """Test removed and added text markers"""
+        self.assertEqual(
+            _render_word_diff("the cat sat", "the dog sat"),
+            ["the [-cat-]{+dog+} sat"],
+        )
+
+    def test_changes_across_paragraphs(self):
+        """Test that markers are split at paragraph breaks"""
+        self.assertEqual(
+            _render_word_diff("first para\nsecond", "first\nsecond para"),
+            ["first[- para-]", "second{+ para+}"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,28 +12,41 @@ This module provides functionality to:
 
 Classes:
     ParagraphData: Represents a text paragraph with formatting
+    FontCatalog: Index of installed fonts used for text measurement
+    StyleResolver: Default font sizes indexed from masters and layouts
     ShapeData: Represents a shape with position and text content
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
     save_inventory: Save extracted data to JSON
+    stream_inventory: Extract slides one at a time, optionally in parallel
+    save_inventory_stream: Write streamed slides to JSON incrementally
 
 Usage:
     python inventory.py input.pptx output.json
 """
 
 import argparse
+import functools
 import json
+import os
 import platform
 import sys
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import lxml.etree
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from pptx.dml.color import ColorFormat
 from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
 from pptx.shapes.base import BaseShape
+from pptx.text.text import Font
 
 # Type aliases for cleaner signatures
 JsonValue = Union[str, int, float, bool, None]
@@ -60,6 +73,9 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --workers 8
+    Extracts slides in 8 worker processes, streaming results to the output
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +92,12 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes extracting slides in parallel (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -94,17 +116,21 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
-
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        save_inventory(inventory, output_path)
+
+        # Slides are written as they are extracted, so memory use does not
+        # grow with the size of the deck
+        total_slides, total_shapes = save_inventory_stream(
+            stream_inventory(
+                input_path, issues_only=args.issues_only, workers=args.workers
+            ),
+            output_path,
+        )
 
         print(f"Output saved to: {args.output}")
 
         # Report statistics
-        total_slides = len(inventory)
-        total_shapes = sum(len(shapes) for shapes in inventory.values())
         if args.issues_only:
             if total_shapes > 0:
                 print(
@@ -174,15 +200,17 @@ class ParagraphData:
                 if hasattr(paragraph, "level"):
                     self.level = paragraph.level
 
-        # Add alignment if not LEFT (default)
-        if hasattr(paragraph, "alignment") and paragraph.alignment is not None:
+        # Add alignment if not LEFT (default). Read from pPr directly, since
+        # paragraph.alignment adds an empty pPr to paragraphs without one
+        pPr = paragraph._p.pPr if hasattr(paragraph, "_p") else None
+        if pPr is not None and pPr.algn is not None:
             alignment_map = {
                 PP_ALIGN.CENTER: "CENTER",
                 PP_ALIGN.RIGHT: "RIGHT",
                 PP_ALIGN.JUSTIFY: "JUSTIFY",
             }
-            if paragraph.alignment in alignment_map:
-                self.alignment = alignment_map[paragraph.alignment]
+            if pPr.algn in alignment_map:
+                self.alignment = alignment_map[pPr.algn]
 
         # Add spacing properties if set
         if hasattr(paragraph, "space_before") and paragraph.space_before:
@@ -190,11 +218,14 @@ class ParagraphData:
         if hasattr(paragraph, "space_after") and paragraph.space_after:
             self.space_after = paragraph.space_after.pt
 
-        # Extract font properties from first run
+        # Extract font properties from first run. Properties are read from the
+        # run's existing rPr so that inventorying never modifies the document
+        # (run.font adds an rPr, font.color turns any fill into solidFill).
         if paragraph.runs:
             first_run = paragraph.runs[0]
-            if hasattr(first_run, "font"):
-                font = first_run.font
+            rPr = first_run._r.rPr if hasattr(first_run, "_r") else None
+            if rPr is not None:
+                font = Font(rPr)
                 if font.name:
                     self.font_name = font.name
                 if font.size:
@@ -207,17 +238,20 @@ class ParagraphData:
                     self.underline = font.underline
 
                 # Handle color - both RGB and theme colors
-                try:
-                    # Try RGB color first
-                    if font.color.rgb:
-                        self.color = str(font.color.rgb)
-                except (AttributeError, TypeError):
-                    # Fall back to theme color
+                solid_fill = rPr.find(qn("a:solidFill"))
+                if solid_fill is not None:
+                    color = ColorFormat.from_colorchoice_parent(solid_fill)
                     try:
-                        if font.color.theme_color:
-                            self.theme_color = font.color.theme_color.name
+                        # Try RGB color first
+                        if color.rgb:
+                            self.color = str(color.rgb)
                     except (AttributeError, TypeError):
-                        pass
+                        # Fall back to theme color
+                        try:
+                            if color.theme_color:
+                                self.theme_color = color.theme_color.name
+                        except (AttributeError, TypeError):
+                            pass
 
         # Add line spacing if set
         if hasattr(paragraph, "line_spacing") and paragraph.line_spacing is not None:
@@ -263,6 +297,213 @@ class ParagraphData:
         return result
 
 
+class FontCatalog:
+    """Index of the font files installed in the system font directories.
+
+    The directories are scanned once, so resolving a font name is a
+    dictionary lookup instead of probing candidate paths on disk. Use
+    FontCatalog.default() to share one catalog per process.
+    """
+
+    _default: Optional["FontCatalog"] = None
+
+    def __init__(
+        self,
+        font_dirs: Optional[List[str]] = None,
+        extensions: Optional[List[str]] = None,
+    ):
+        """Scan font directories (searched in order) for font files.
+
+        Args:
+            font_dirs: Directories to scan, defaults to the platform font dirs
+            extensions: Font file extensions in order of preference
+        """
+        if platform.system() == "Darwin":  # macOS
+            default_dirs = [
+                "/System/Library/Fonts/",
+                "/Library/Fonts/",
+                "~/Library/Fonts/",
+            ]
+            default_extensions = [".ttf", ".otf", ".ttc", ".dfont"]
+        else:  # Linux
+            default_dirs = [
+                "/usr/share/fonts/truetype/",
+                "/usr/local/share/fonts/",
+                "~/.fonts/",
+            ]
+            default_extensions = [".ttf", ".otf"]
+        self.extensions = extensions or default_extensions
+
+        # One (exact index, file list) pair per directory, in search order.
+        # The exact index maps a normalized file stem to its preferred file.
+        self._dirs: List[Tuple[Dict[str, str], List[Tuple[str, str]]]] = []
+        for font_dir in font_dirs or default_dirs:
+            self._dirs.append(self._scan(Path(font_dir).expanduser()))
+
+        self._resolved: Dict[str, Optional[str]] = {}  # Font name -> path
+
+    @classmethod
+    def default(cls) -> "FontCatalog":
+        """Catalog of the system font directories, built on first use."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def normalize(font_name: str) -> str:
+        """Normalize a font or file name, e.g. 'Open Sans' -> 'opensans'."""
+        return font_name.lower().replace(" ", "").replace("-", "")
+
+    def _scan(self, font_dir: Path) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
+        exact: Dict[str, Tuple[int, int, str]] = {}
+        files: List[Tuple[str, str]] = []
+        for dirpath, dirnames, filenames in os.walk(font_dir):
+            dirnames.sort()
+            depth = dirpath.count(os.sep)
+            for filename in sorted(filenames):
+                stem, ext = os.path.splitext(filename)
+                if ext.lower() not in self.extensions:
+                    continue
+                path = os.path.join(dirpath, filename)
+                files.append((filename.lower(), path))
+                # Prefer files in shallower directories, then by extension
+                rank = (depth, self.extensions.index(ext.lower()))
+                key = self.normalize(stem)
+                if key not in exact or rank < exact[key][:2]:
+                    exact[key] = (*rank, path)
+        return {key: entry[2] for key, entry in exact.items()}, files
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Path of the font file for a font name, or None if not installed.
+
+        Each directory is searched for a file named after the font first,
+        then for any font file whose name contains the font name.
+        """
+        if font_name in self._resolved:
+            return self._resolved[font_name]
+
+        result = None
+        key = self.normalize(font_name)
+        fuzzy_key = font_name.lower().replace(" ", "")
+        for exact, files in self._dirs:
+            if key in exact:
+                result = exact[key]
+                break
+            result = next(
+                (path for name, path in files if fuzzy_key in name), None
+            )
+            if result:
+                break
+
+        self._resolved[font_name] = result
+        return result
+
+
+@functools.lru_cache(maxsize=64)
+def load_font(font_path: Optional[str], size: int) -> Any:
+    """Load a font at a size, falling back to PIL's default font.
+
+    Loaded fonts are kept in a small LRU cache keyed by (path, size), since
+    most text in a deck shares a handful of fonts and sizes.
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+# Scratch surface used only to measure text with PIL
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+def measure_text(text: str, font: Any) -> float:
+    """Width of text in pixels when rendered with font."""
+    return _MEASURE_DRAW.textlength(text, font=font)
+
+
+@functools.lru_cache(maxsize=8192)
+def text_width(text: str, font: Any) -> float:
+    """Width of a word or other short token, cached per (font, token)."""
+    return measure_text(text, font)
+
+
+class StyleResolver:
+    """Default font sizes from slide masters and layouts.
+
+    Masters and layouts are shared by many slides, so each one is indexed the
+    first time it is seen and every later lookup is a dictionary access. Use
+    one resolver per presentation.
+    """
+
+    def __init__(self):
+        self._master_sizes: Dict[Any, Dict[str, int]] = {}
+        self._layout_sizes: Dict[Any, Dict[Any, Optional[float]]] = {}
+
+    def master_font_size(self, slide_master: Any, style_name: str) -> Optional[int]:
+        """Font size of a master text style ('titleStyle', 'bodyStyle', ...).
+
+        Returns:
+            The first size found in the style, in points, or None
+        """
+        key = slide_master.part
+        if key not in self._master_sizes:
+            self._master_sizes[key] = self._index_master(slide_master)
+        return self._master_sizes[key].get(style_name)
+
+    def layout_font_size(self, slide_layout: Any, placeholder_type: Any) -> Optional[float]:
+        """Default font size of a layout placeholder of the given type.
+
+        Returns:
+            Size from the first defRPr of the first matching placeholder, in
+            points, or None if not found
+        """
+        key = slide_layout.part
+        if key not in self._layout_sizes:
+            self._layout_sizes[key] = self._index_layout(slide_layout)
+        return self._layout_sizes[key].get(placeholder_type)
+
+    @staticmethod
+    def _index_master(slide_master: Any) -> Dict[str, int]:
+        sizes: Dict[str, int] = {}
+        if not hasattr(slide_master, "element"):
+            return sizes
+        for child in slide_master.element.iter():
+            if not isinstance(child.tag, str):
+                continue
+            tag = child.tag.split("}")[-1]
+            if not tag.endswith("Style") or tag in sizes:
+                continue
+            for elem in child.iter():
+                if "sz" in elem.attrib:
+                    sizes[tag] = int(elem.attrib["sz"]) // 100
+                    break
+        return sizes
+
+    @staticmethod
+    def _index_layout(slide_layout: Any) -> Dict[Any, Optional[float]]:
+        sizes: Dict[Any, Optional[float]] = {}
+        try:
+            placeholders = list(slide_layout.placeholders)
+        except Exception:
+            return sizes
+        for layout_placeholder in placeholders:
+            try:
+                placeholder_type = layout_placeholder.placeholder_format.type
+                if placeholder_type in sizes:
+                    continue
+                sizes[placeholder_type] = None
+                # Find first defRPr element with sz (size) attribute
+                for elem in layout_placeholder.element.iter():
+                    if "defRPr" in elem.tag and (sz := elem.get("sz")):
+                        sizes[placeholder_type] = float(sz) / 100.0  # Convert to points
+                        break
+            except Exception:
+                continue
+        return sizes
+
+
 class ShapeData:
     """Data structure for shape properties extracted from a PowerPoint shape."""
 
@@ -286,61 +527,7 @@ class ShapeData:
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return FontCatalog.default().find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -372,18 +559,10 @@ class ShapeData:
         try:
             if not hasattr(shape, "placeholder_format"):
                 return None
-
             shape_type = shape.placeholder_format.type  # type: ignore
-            for layout_placeholder in slide_layout.placeholders:
-                if layout_placeholder.placeholder_format.type == shape_type:
-                    # Find first defRPr element with sz (size) attribute
-                    for elem in layout_placeholder.element.iter():
-                        if "defRPr" in elem.tag and (sz := elem.get("sz")):
-                            return float(sz) / 100.0  # Convert EMUs to points
-                    break
         except Exception:
-            pass
-        return None
+            return None
+        return StyleResolver().layout_font_size(slide_layout, shape_type)
 
     def __init__(
         self,
@@ -391,6 +570,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        styles: Optional["StyleResolver"] = None,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,9 +579,11 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            styles: Optional StyleResolver shared by all shapes of a presentation
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
+        self.styles = styles if styles is not None else StyleResolver()
 
         # Get slide dimensions from slide object
         self.slide_width_emu, self.slide_height_emu = (
@@ -419,8 +601,8 @@ class ShapeData:
 
                 # Get default font size from layout
                 if slide and hasattr(slide, "slide_layout"):
-                    self.default_font_size = self.get_default_font_size(
-                        shape, slide.slide_layout
+                    self.default_font_size = self.styles.layout_font_size(
+                        slide.slide_layout, shape.placeholder_format.type  # type: ignore
                     )
 
         # Get position information
@@ -465,6 +647,17 @@ class ShapeData:
         self._calculate_slide_overflow()
         self._detect_bullet_issues()
 
+    def reestimate_text(self) -> None:
+        """Recompute frame overflow and bullet warnings from the shape's current text.
+
+        Used after the shape's text has been edited in memory; position, size
+        and overlap data are left as they are.
+        """
+        self.frame_overflow_bottom = None
+        self.warnings = []
+        self._estimate_frame_overflow()
+        self._detect_bullet_issues()
+
     @property
     def paragraphs(self) -> List[ParagraphData]:
         """Calculate paragraphs from the shape's text frame."""
@@ -486,21 +679,15 @@ class ShapeData:
                 return 14
 
             slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
-            if not hasattr(slide_master, "element"):
-                return 14
 
             # Determine theme style based on placeholder type
             style_name = "bodyStyle"  # Default
             if self.placeholder_type and "TITLE" in self.placeholder_type:
                 style_name = "titleStyle"
 
-            # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            size = self.styles.master_font_size(slide_master, style_name)
+            if size is not None:
+                return size
         except Exception:
             pass
 
@@ -531,28 +718,49 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
-        """Wrap a single line of text to fit within max_width_px."""
+    def _wrap_text_line(self, line: str, max_width_px: int, font) -> List[str]:
+        """Wrap a single line of text to fit within max_width_px.
+
+        Line widths are accumulated from cached word and space advances, so
+        each word is measured once. Kerning across word boundaries can make
+        the sum differ slightly from the measured line, so candidates within
+        a quarter of an em of the limit are re-measured exactly before the
+        line break is decided.
+        """
         if not line:
             return [""]
 
         # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
+        if measure_text(line, font) <= max_width_px:
             return [line]
 
         # Need to wrap - split into words
+        space_width = text_width(" ", font)
+        margin = getattr(font, "size", 0) / 4
         wrapped = []
         words = line.split(" ")
         current_line = ""
+        current_width = 0.0
 
         for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
+            word_width = text_width(word, font)
+            if current_line:
+                test_line = current_line + " " + word
+                test_width = current_width + space_width + word_width
+                if abs(test_width - max_width_px) <= margin:
+                    test_width = measure_text(test_line, font)
+            else:
+                test_line = word
+                test_width = word_width
+
+            if test_width <= max_width_px:
                 current_line = test_line
+                current_width = test_width
             else:
                 if current_line:
                     wrapped.append(current_line)
                 current_line = word
+                current_width = word_width
 
         if current_line:
             wrapped.append(current_line)
@@ -573,10 +781,6 @@ class ShapeData:
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
@@ -593,20 +797,12 @@ class ShapeData:
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
-            font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
+            font = load_font(self.get_font_path(font_name), font_size)
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
             for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
+                wrapped = self._wrap_text_line(line, usable_width_px, font)
                 all_wrapped_lines.extend(wrapped)
 
             if all_wrapped_lines:
@@ -879,36 +1075,72 @@ def calculate_overlap(
     return False, 0
 
 
-def detect_overlaps(shapes: List[ShapeData]) -> None:
+def detect_overlaps(shapes: List[ShapeData], tolerance: float = 0.05) -> None:
     """Detect overlapping shapes and update their overlapping_shapes dictionaries.
 
     This function requires each ShapeData to have its shape_id already set.
     It modifies the shapes in-place, adding shape IDs with overlap areas in square inches.
 
+    Shapes are bucketed into a uniform grid and only pairs sharing a grid cell
+    are compared, so slides with hundreds of small shapes (tables drawn as
+    text boxes, chart labels) no longer compare every pair. Results are the
+    same as comparing every pair with calculate_overlap.
+
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
+        tolerance: Minimum overlap in inches to consider as overlapping
     """
-    n = len(shapes)
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
+
+    rects = [(s.left, s.top, s.width, s.height) for s in shapes]
+    cell_size = _overlap_grid_cell_size(rects)
+
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    pairs = []
+    for j, (left, top, width, height) in enumerate(rects):
+        # Any two rectangles that overlap share at least one cell
+        cells = [
+            (col, row)
+            for col in range(int(left // cell_size), int((left + width) // cell_size) + 1)
+            for row in range(int(top // cell_size), int((top + height) // cell_size) + 1)
+        ]
+        candidates = set()
+        for cell in cells:
+            candidates.update(grid.get(cell, ()))
+            grid.setdefault(cell, []).append(j)
 
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
+        for i in candidates:
+            overlaps, overlap_area = calculate_overlap(rects[i], rects[j], tolerance)
+            if overlaps:
+                pairs.append((i, j, overlap_area))
 
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
+    # Record overlaps in pair order so each dictionary lists shapes by index
+    for i, j, overlap_area in sorted(pairs):
+        # Add shape IDs with overlap area in square inches
+        shapes[i].overlapping_shapes[shapes[j].shape_id] = overlap_area
+        shapes[j].overlapping_shapes[shapes[i].shape_id] = overlap_area
 
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+def _overlap_grid_cell_size(rects: List[Tuple[float, float, float, float]]) -> float:
+    """Grid cell size (inches) for detect_overlaps.
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+    Cells are about the size of a typical shape, but never so small that the
+    grid has more than a few thousand cells across the occupied area.
+    """
+    sizes = sorted(max(width, height) for _, _, width, height in rects)
+    if not sizes:
+        return 1.0
+    typical = sizes[len(sizes) // 2]
+    extent = max(
+        max(left + width for left, _, width, _ in rects)
+        - min(left for left, _, _, _ in rects),
+        max(top + height for _, top, _, height in rects)
+        - min(top for _, top, _, _ in rects),
+    )
+    cell_size = max(typical, extent / 64)
+    return cell_size if cell_size > 0 else 1.0
 
 
 def extract_text_inventory(
@@ -929,49 +1161,164 @@ def extract_text_inventory(
     if prs is None:
         prs = Presentation(str(pptx_path))
     inventory: InventoryData = {}
+    styles = StyleResolver()
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
-
-        if not shapes_with_positions:
-            continue
-
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
+        slide_shapes = extract_slide_inventory(slide, styles, issues_only)
+        if slide_shapes:
+            inventory[f"slide-{slide_idx}"] = slide_shapes
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+    return inventory
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+def extract_slide_inventory(
+    slide: Any, styles: Optional[StyleResolver] = None, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of one slide as {shape-N: ShapeData}.
 
-        if not sorted_shapes:
-            continue
+    Args:
+        slide: Slide to extract
+        styles: StyleResolver shared across the presentation's slides
+        issues_only: If True, only include shapes that have overflow or overlap issues
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+    Returns an empty dictionary if the slide has no (matching) text shapes.
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            styles,
+        )
+        for swp in shapes_with_positions
+    ]
 
-    return inventory
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
+
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
+
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    # Create slide inventory using the stable shape IDs
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+def stream_inventory(
+    pptx_path: Path, issues_only: bool = False, workers: int = 1
+) -> Iterator[Tuple[str, Dict[str, ShapeDict]]]:
+    """Yield (slide-N, {shape-N: shape dict}) for each slide with text, in slide order.
+
+    Only the slides being extracted are held in memory. With workers > 1,
+    slides are split into contiguous batches handled by a process pool; each
+    worker opens the presentation once and results are still yielded in
+    slide order.
+
+    Args:
+        pptx_path: Path to the PowerPoint file
+        issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes
+    """
+    if workers <= 1:
+        prs = Presentation(str(pptx_path))
+        styles = StyleResolver()
+        for slide_idx, slide in enumerate(prs.slides):
+            slide_shapes = extract_slide_inventory(slide, styles, issues_only)
+            if slide_shapes:
+                yield f"slide-{slide_idx}", {
+                    shape_key: shape_data.to_dict()
+                    for shape_key, shape_data in slide_shapes.items()
+                }
+        return
+
+    slide_count = count_slides(pptx_path)
+    # Several small batches per worker balance uneven slides while keeping
+    # the results waiting to be written in order small
+    batch_size = max(1, min(16, -(-slide_count // (workers * 4))))
+    batches = [
+        range(start, min(start + batch_size, slide_count))
+        for start in range(0, slide_count, batch_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(batches) or 1),
+        initializer=_init_inventory_worker,
+        initargs=(str(pptx_path), issues_only),
+    ) as executor:
+        # At most two batches per worker are in flight, so a slow consumer
+        # never has the whole deck's results waiting in memory
+        pending = deque()
+        try:
+            for batch in batches:
+                pending.append(executor.submit(_inventory_slide_batch, batch))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def count_slides(pptx_path: Path) -> int:
+    """Number of slides in a presentation, read without loading the package."""
+    with zipfile.ZipFile(pptx_path) as zf:
+        presentation = zf.read("ppt/presentation.xml")
+    root = lxml.etree.fromstring(presentation)
+    return len(
+        root.findall(
+            "{http://schemas.openxmlformats.org/presentationml/2006/main}sldIdLst/"
+            "{http://schemas.openxmlformats.org/presentationml/2006/main}sldId"
+        )
+    )
+
+
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_inventory_worker(pptx_path: str, issues_only: bool) -> None:
+    """Open the presentation once per worker process."""
+    _worker_state["prs"] = Presentation(pptx_path)
+    _worker_state["styles"] = StyleResolver()
+    _worker_state["issues_only"] = issues_only
+
+
+def _inventory_slide_batch(
+    slide_indices: range,
+) -> List[Tuple[str, Dict[str, ShapeDict]]]:
+    """Extract a batch of slides in a worker, returning JSON-ready dictionaries."""
+    slides = _worker_state["prs"].slides
+    results = []
+    for slide_idx in slide_indices:
+        slide_shapes = extract_slide_inventory(
+            slides[slide_idx], _worker_state["styles"], _worker_state["issues_only"]
+        )
+        if slide_shapes:
+            results.append(
+                (
+                    f"slide-{slide_idx}",
+                    {
+                        shape_key: shape_data.to_dict()
+                        for shape_key, shape_data in slide_shapes.items()
+                    },
+                )
+            )
+    return results
 
 
 def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
@@ -1016,5 +1363,29 @@ def save_inventory(inventory: InventoryData, output_path: Path) -> None:
         json.dump(json_inventory, f, indent=2, ensure_ascii=False)
 
 
+def save_inventory_stream(
+    slides: Iterable[Tuple[str, Dict[str, ShapeDict]]], output_path: Path
+) -> Tuple[int, int]:
+    """Write (slide key, shape dicts) pairs to a JSON file as they arrive.
+
+    The output is formatted exactly like save_inventory.
+
+    Returns:
+        Tuple of (slides written, shapes written)
+    """
+    total_slides = 0
+    total_shapes = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        for slide_key, shapes in slides:
+            f.write("{\n" if total_slides == 0 else ",\n")
+            slide_json = json.dumps({slide_key: shapes}, indent=2, ensure_ascii=False)
+            # Strip the wrapping braces, keeping the slide's own indentation
+            f.write(slide_json[2:-2])
+            total_slides += 1
+            total_shapes += len(shapes)
+        f.write("\n}" if total_slides else "{}")
+    return total_slides, total_shapes
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,168 @@
+import random
+import unittest
+from types import SimpleNamespace
+
+from PIL import ImageFont
+from inventory import ShapeData, calculate_overlap, detect_overlaps, measure_text
+
+EMU_PER_INCH = 914400
+
+
+def make_shape(left, top, width, height, shape_id):
+    """ShapeData for a plain rectangle given in inches"""
+    shape = ShapeData(
+        SimpleNamespace(
+            left=int(left * EMU_PER_INCH),
+            top=int(top * EMU_PER_INCH),
+            width=int(width * EMU_PER_INCH),
+            height=int(height * EMU_PER_INCH),
+        )
+    )
+    shape.shape_id = shape_id
+    return shape
+
+
+def all_pairs_overlaps(shapes, tolerance=0.05):
+    """Reference result: compare every pair of shapes"""
+    overlaps = {shape.shape_id: {} for shape in shapes}
+    for i, shape1 in enumerate(shapes):
+        for shape2 in shapes[i + 1 :]:
+            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
+            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+            found, area = calculate_overlap(rect1, rect2, tolerance)
+            if found:
+                overlaps[shape1.shape_id][shape2.shape_id] = area
+                overlaps[shape2.shape_id][shape1.shape_id] = area
+    return overlaps
+
+
+def reference_wrap(line, max_width_px, font):
+    """Reference result: the wrapper that measured every candidate line"""
+    if not line:
+        return [""]
+    if measure_text(line, font) <= max_width_px:
+        return [line]
+    wrapped = []
+    current_line = ""
+    for word in line.split(" "):
+        test_line = current_line + (" " if current_line else "") + word
+        if measure_text(test_line, font) <= max_width_px:
+            current_line = test_line
+        else:
+            if current_line:
+                wrapped.append(current_line)
+            current_line = word
+    if current_line:
+        wrapped.append(current_line)
+    return wrapped
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestDetectOverlaps(unittest.TestCase):
+
+    def detect(self, shapes, tolerance=0.05):
+        detect_overlaps(shapes, tolerance)
+        return {shape.shape_id: shape.overlapping_shapes for shape in shapes}
+
+    def test_no_shapes(self):
+        """Test that an empty slide is accepted"""
+        self.assertEqual(self.detect([]), {})
+
+    def test_separate_shapes(self):
+        """Test shapes that do not touch"""
+        shapes = [make_shape(0, 0, 1, 1, "a"), make_shape(2, 2, 1, 1, "b")]
+        self.assertEqual(self.detect(shapes), {"a": {}, "b": {}})
+
+    def test_overlap_is_recorded_on_both_shapes(self):
+        """Test that an overlap is listed in both shapes' dictionaries"""
+        shapes = [make_shape(0, 0, 2, 2, "a"), make_shape(1, 1, 2, 2, "b")]
+        self.assertEqual(self.detect(shapes), {"a": {"b": 1.0}, "b": {"a": 1.0}})
+
+    def test_overlap_below_tolerance_is_ignored(self):
+        """Test shapes that only touch along an edge"""
+        shapes = [make_shape(0, 0, 1, 1, "a"), make_shape(0.98, 0, 1, 1, "b")]
+        self.assertEqual(self.detect(shapes), {"a": {}, "b": {}})
+
+    def test_shape_spanning_many_cells(self):
+        """Test a large shape overlapping many small ones"""
+        shapes = [make_shape(0.5, 0.5, 8, 0.5, "banner")]
+        shapes += [make_shape(i, 0, 0.75, 0.75, f"box{i}") for i in range(10)]
+        self.assertEqual(self.detect(shapes), all_pairs_overlaps(shapes))
+
+    def test_random_slides_match_all_pairs(self):
+        """Test the grid against comparing every pair on random slides"""
+        rng = random.Random(0)
+        for count in (2, 10, 50, 200):
+            for _ in range(5):
+                shapes = [
+                    make_shape(
+                        rng.uniform(0, 12),
+                        rng.uniform(0, 7),
+                        rng.choice([rng.uniform(0, 0.5), rng.uniform(0, 4)]),
+                        rng.choice([rng.uniform(0, 0.5), rng.uniform(0, 4)]),
+                        f"shape-{index}",
+                    )
+                    for index in range(count)
+                ]
+                expected = all_pairs_overlaps(shapes)
+                self.assertEqual(self.detect(shapes), expected)
+                # Dictionaries list overlapping shapes in slide order
+                for shape in shapes:
+                    self.assertEqual(
+                        list(shape.overlapping_shapes),
+                        list(expected[shape.shape_id]),
+                    )
+
+
+class TestWrapTextLine(unittest.TestCase):
+
+    WORDS = [
+        "a", "I", "to", "of", "the", "and", "WAVE", "office", "quarterly",
+        "AVAILABILITY", "Te", "Yo", "lll", "mmm", "revenue,", "(growth)",
+        "--", "été", "",
+    ]  # fmt: skip
+
+    def setUp(self):
+        self.shape = make_shape(0, 0, 4, 1, "text")
+
+    def wrap(self, line, max_width_px, font):
+        return self.shape._wrap_text_line(line, max_width_px, font)
+
+    def test_empty_line(self):
+        """Test that an empty line is one empty line"""
+        font = ImageFont.load_default(size=18)
+        self.assertEqual(self.wrap("", 100, font), [""])
+
+    def test_line_that_fits(self):
+        """Test that a short line is not wrapped"""
+        font = ImageFont.load_default(size=18)
+        self.assertEqual(
+            self.wrap("Quarterly revenue", 1000, font), ["Quarterly revenue"]
+        )
+
+    def test_long_word_gets_own_line(self):
+        """Test that a word wider than the limit is kept whole"""
+        font = ImageFont.load_default(size=18)
+        self.assertEqual(
+            self.wrap("a AVAILABILITY b", 20, font), ["a", "AVAILABILITY", "b"]
+        )
+
+    def test_random_lines_match_reference(self):
+        """Test against measuring every candidate line, across fonts and widths"""
+        rng = random.Random(0)
+        fonts = [ImageFont.load_default(size=size) for size in (9, 14, 18, 32)]
+        fonts.append(ImageFont.load_default())
+        for _ in range(300):
+            line = " ".join(rng.choice(self.WORDS) for _ in range(rng.randint(1, 40)))
+            font = rng.choice(fonts)
+            full_width = measure_text(line, font)
+            for max_width_px in (1, full_width / 7, full_width / 3, full_width / 2):
+                self.assertEqual(
+                    self.wrap(line, int(max_width_px), font),
+                    reference_wrap(line, int(max_width_px), font),
+                    f"{line!r} at {int(max_width_px)} px",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Pipelined PDF rasterization shared by the PDF and presentation tools.
+
+rasterize_pdf splits the requested pages into short page ranges and renders
+them with concurrent `pdftoppm` processes, one range per process. Pages are
+yielded in order as soon as their range is done, as paths of image files
+written to the output directory, so a long document is never held in memory
+and later pages render while earlier ones are consumed.
+
+With max_dim, pages that would exceed it at the requested DPI are rendered
+directly at the smaller size instead of being resized afterwards; smaller
+pages are never upscaled.
+
+This module is copied into each skill that needs it.
+
+Example usage:
+    from pdf_rasterizer import rasterize_pdf
+
+    for page_number, image_path in rasterize_pdf("doc.pdf", "out", dpi=200):
+        print(page_number, image_path)
+
+    # Only pages 3-5 and 9, as JPEG, with the long side at most 1000 px
+    for page_number, image_path in rasterize_pdf(
+        "doc.pdf", "out", pages=[3, 4, 5, 9], fmt="jpeg", max_dim=1000
+    ):
+        ...
+"""
+
+import os
+import re
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Output formats and the pdftoppm flag and file extension for each
+FORMATS = {"png": ("-png", "png"), "jpeg": ("-jpeg", "jpg")}
+
+# Upper bound on pages per pdftoppm process. Each process parses the PDF
+# once, so ranges are kept long enough to amortize that but short enough
+# that the first pages arrive early and all workers stay busy.
+MAX_PAGES_PER_RANGE = 16
+
+PAGE_SIZE_PATTERN = re.compile(
+    r"^Page\s+(\d+)\s+size:\s+([\d.]+)\s+x\s+([\d.]+)\s+pts", re.MULTILINE
+)
+PAGE_COUNT_PATTERN = re.compile(r"^Pages:\s+(\d+)", re.MULTILINE)
+UNSAFE_NAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def pdf_page_sizes(pdf_path):
+    """Page sizes of a PDF in points, from `pdfinfo`.
+
+    Returns:
+        dict: Page number (1-based) -> (width, height) in points
+    """
+    result = subprocess.run(
+        # pdfinfo clamps the last page to the document's page count
+        ["pdfinfo", "-f", "1", "-l", str(2**31 - 1), str(pdf_path)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"pdfinfo failed: {result.stderr.strip()}")
+    return {
+        int(page): (float(width), float(height))
+        for page, width, height in PAGE_SIZE_PATTERN.findall(result.stdout)
+    }
+
+
+def pdf_page_count(pdf_path):
+    """Number of pages of a PDF, from `pdfinfo`."""
+    result = subprocess.run(["pdfinfo", str(pdf_path)], capture_output=True, text=True)
+    match = PAGE_COUNT_PATTERN.search(result.stdout)
+    if result.returncode != 0 or match is None:
+        raise RuntimeError(f"pdfinfo failed: {result.stderr.strip()}")
+    return int(match.group(1))
+
+
+def rasterize_pdf(
+    pdf_path, output_dir, pages=None, dpi=150, fmt="png", max_dim=None, workers=None
+):
+    """
+    Render PDF pages to image files, yielding them in page order.
+
+    Args:
+        pdf_path: PDF to render
+        output_dir: Directory the images are written to
+        pages: 1-based page numbers to render (default: all pages)
+        dpi: Render resolution
+        fmt: "png" or "jpeg"
+        max_dim: Optional bound on each image's width and height in pixels
+        workers: Concurrent pdftoppm processes (default: one per CPU)
+
+    Yields:
+        tuple: (page number, Path of the image). Files are named
+        "<pdf stem>-r<first page of range>-<page>.<ext>", with characters
+        other than letters, digits, "_", "." and "-" in the stem replaced by
+        "_"; callers move or rename them as needed.
+
+    Raises:
+        RuntimeError: If pdftoppm fails or does not render a requested page
+    """
+    pdf_path = Path(pdf_path)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    flag, extension = FORMATS[fmt]
+    # The stem is sanitized so output names never contain glob characters
+    stem = UNSAFE_NAME_CHARACTERS.sub("_", pdf_path.stem)
+    workers = workers or os.cpu_count() or 1
+
+    sizes = pdf_page_sizes(pdf_path) if max_dim else None
+    if pages is None:
+        pages = range(1, (len(sizes) if sizes else pdf_page_count(pdf_path)) + 1)
+    pages = sorted(set(pages))
+    if not pages:
+        return
+
+    def scale_to(page):
+        # Long side in pixels at dpi, capped at max_dim by rendering smaller
+        if not sizes or page not in sizes:
+            return None
+        long_side = max(sizes[page]) * dpi / 72
+        return max_dim if long_side > max_dim else None
+
+    # Split into runs of consecutive pages rendered the same way, then into
+    # ranges small enough to spread over the workers
+    range_length = max(1, min(MAX_PAGES_PER_RANGE, -(-len(pages) // (workers * 2))))
+    ranges = []
+    for page in pages:
+        if (
+            ranges
+            and page == ranges[-1][1] + 1
+            and scale_to(page) == ranges[-1][2]
+            and page - ranges[-1][0] < range_length
+        ):
+            ranges[-1][1] = page
+        else:
+            ranges.append([page, page, scale_to(page)])
+
+    def render(first, last, scale):
+        root = output_dir / f"{stem}-r{first}"
+        command = ["pdftoppm", flag, "-f", str(first), "-l", str(last)]
+        if scale is not None:
+            command += ["-scale-to", str(scale)]
+        else:
+            command += ["-r", str(dpi)]
+        result = subprocess.run(
+            command + [str(pdf_path), str(root)], capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"pdftoppm failed on pages {first}-{last}: {result.stderr.strip()}"
+            )
+        # pdftoppm zero-pads page numbers to the document's page count
+        rendered = {
+            int(path.stem.rsplit("-", 1)[1]): path
+            for path in output_dir.glob(f"{root.name}-*.{extension}")
+        }
+        missing = [page for page in range(first, last + 1) if page not in rendered]
+        if missing:
+            raise RuntimeError(
+                f"pdftoppm did not render page(s) {missing} of {pdf_path}"
+            )
+        return [(page, rendered[page]) for page in range(first, last + 1)]
+
+    # Each pdftoppm is its own process, so threads only wait on them. At most
+    # two ranges per worker are in flight, which bounds the rendered pages
+    # waiting on disk for a slow consumer.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for first, last, scale in ranges:
+                pending.append(executor.submit(render, first, last, scale))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -12,11 +12,22 @@ Slides can be repeated (e.g., 34 appears twice).
 import argparse
 import shutil
 import sys
+from collections import Counter, deque
 from copy import deepcopy
 from pathlib import Path
 
-import six
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+
+# Largest slide id PowerPoint accepts
+MAX_SLIDE_ID = 2147483647
+
+# Namespace of relationship reference attributes such as r:embed and r:id
+RELATIONSHIPS_NS = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
 
 
 def main():
@@ -74,82 +85,119 @@ Note: Slide indices are 0-based (first slide is 0, second is 1, etc.)
 
 def duplicate_slide(pres, index):
     """Duplicate a slide in the presentation."""
-    source = pres.slides[index]
-
-    # Use source's layout to preserve formatting
-    new_slide = pres.slides.add_slide(source.slide_layout)
-
-    # Collect all image and media relationships from the source slide
-    image_rels = {}
-    for rel_id, rel in six.iteritems(source.part.rels):
-        if "image" in rel.reltype or "media" in rel.reltype:
-            image_rels[rel_id] = rel
-
-    # CRITICAL: Clear placeholder shapes to avoid duplicates
-    for shape in new_slide.shapes:
-        sp = shape.element
-        sp.getparent().remove(sp)
-
-    # Copy all shapes from source
-    for shape in source.shapes:
-        el = shape.element
-        new_el = deepcopy(el)
-        new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
-
-        # Handle picture shapes - need to update the blip reference
-        # Look for all blip elements (they can be in pic or other contexts)
-        # Using the element's own xpath method without namespaces argument
-        blips = new_el.xpath(".//a:blip[@r:embed]")
-        for blip in blips:
-            old_rId = blip.get(
-                "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed"
-            )
-            if old_rId in image_rels:
-                # Create a new relationship in the destination slide for this image
-                old_rel = image_rels[old_rId]
-                # get_or_add returns the rId directly, or adds and returns new rId
-                new_rId = new_slide.part.rels.get_or_add(
-                    old_rel.reltype, old_rel._target
-                )
-                # Update the blip's embed reference to use the new relationship ID
-                blip.set(
-                    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed",
-                    new_rId,
-                )
-
-    # Copy any additional image/media relationships that might be referenced elsewhere
-    for rel_id, rel in image_rels.items():
-        try:
-            new_slide.part.rels.get_or_add(rel.reltype, rel._target)
-        except Exception:
-            pass  # Relationship might already exist
-
-    return new_slide
+    new_slides, _ = duplicate_slides(pres, index, 1)
+    return new_slides[0]
 
 
-def delete_slide(pres, index):
-    """Delete a slide from the presentation."""
-    rId = pres.slides._sldIdLst[index].rId
-    pres.part.drop_rel(rId)
-    del pres.slides._sldIdLst[index]
+def duplicate_slides(pres, index, count):
+    """Append count duplicates of a slide to the presentation.
 
+    Each copy only gets the relationships its shapes reference (images,
+    media, charts, hyperlinks, ...). The related parts are shared with the
+    source slide by reference, so a duplicate adds just its own slide part
+    to the package however many images or charts it shows.
 
-def reorder_slides(pres, slide_index, target_index):
-    """Move a slide from one position to another."""
-    slides = pres.slides._sldIdLst
+    Returns:
+        Tuple of (new slides in the order they were appended, bytes of
+        shared parts that would otherwise have been copied)
+    """
+    source = pres.slides[index]
+    source_rels = source.part.rels
 
-    # Remove slide element from current position
-    slide_element = slides[slide_index]
-    slides.remove(slide_element)
+    # Use source's layout to preserve formatting
+    new_slides = _add_blank_slides(pres, source.slide_layout, count)
+
+    shared_sizes = {}  # Partname -> size of each part shared with the source
+    for new_slide in new_slides:
+        rel_map = {}  # Source rId -> rId of the same relationship in the copy
+
+        # Copy all shapes from source
+        for shape in source.shapes:
+            new_el = deepcopy(shape.element)
+            new_slide.shapes._spTree.insert_element_before(new_el, "p:extLst")
+
+            # Point every relationship reference (r:embed on pictures, r:id
+            # on charts and hyperlinks, ...) at the copy's own relationships
+            for el in new_el.iter():
+                if not isinstance(el.tag, str):
+                    continue
+                for attr, rId in el.attrib.items():
+                    if not attr.startswith(RELATIONSHIPS_NS) or rId not in source_rels:
+                        continue
+                    if rId not in rel_map:
+                        rel_map[rId] = _relate_shared(
+                            new_slide.part, source_rels[rId], shared_sizes
+                        )
+                    el.set(attr, rel_map[rId])
+
+    return new_slides, count * sum(shared_sizes.values())
+
+
+def _relate_shared(slide_part, rel, shared_sizes):
+    """Add a relationship like rel to slide_part, sharing its target part."""
+    if rel.is_external:
+        return slide_part.rels.get_or_add_ext_rel(rel.reltype, rel.target_ref)
+
+    target = rel.target_part
+    if target.partname not in shared_sizes:
+        shared_sizes[target.partname] = len(target.blob)
+    # get_or_add returns the rId directly, or adds and returns new rId
+    return slide_part.rels.get_or_add(rel.reltype, target)
+
+
+def _add_blank_slides(pres, slide_layout, count):
+    """Append count slides using slide_layout, without any shapes.
+
+    This is what pres.slides.add_slide does minus the layout placeholders,
+    which duplicates would remove again. add_slide also looks for an existing
+    relationship to the new part and recomputes the next slide id from every
+    slide, which is quadratic when a large deck grows by many slides; new
+    parts cannot match an existing relationship, so they are related directly
+    and ids come from a running counter.
+    """
+    prs_part = pres.part
+    sld_id_lst = pres.slides._sldIdLst
+    next_id = sld_id_lst._next_id
+
+    slides = []
+    for _ in range(count):
+        partname = PackURI("/ppt/slides/slide%d.xml" % (len(sld_id_lst) + 1))
+        slide_part = SlidePart.new(partname, prs_part.package, slide_layout.part)
+        rId = prs_part.rels._add_relationship(RT.SLIDE, slide_part)
+        if next_id > MAX_SLIDE_ID:
+            next_id = sld_id_lst._next_id
+        sld_id_lst._add_sldId(id=next_id, rId=rId)
+        next_id += 1
+        slides.append(slide_part.slide)
+    return slides
+
+
+def delete_slides(pres, sld_ids):
+    """Drop the relationships of removed slides in one pass.
+
+    A slide's relationship is dropped unless something besides its sldId
+    (e.g. a custom show) still references it, like Part.drop_rel does, but
+    references are counted once instead of once per slide.
 
-    # Insert at target position
-    slides.insert(target_index, slide_element)
+    Args:
+        pres: Presentation
+        sld_ids: sldId elements of the slides being removed; the caller
+            removes them from sldIdLst
+    """
+    ref_counts = Counter(pres.part._element.xpath("//@r:id"))
+    for sld_id in sld_ids:
+        if ref_counts[sld_id.rId] < 2:
+            pres.part.rels.pop(sld_id.rId)
 
 
 def rearrange_presentation(template_path, output_path, slide_sequence):
     """
     Create a new presentation with slides from template in specified order.
 
+    Occurrences are counted once, repeated slides are duplicated up front,
+    and the final slide list is assigned in one step instead of deleting and
+    moving slides one at a time.
+
     Args:
         template_path: Path to template PPTX file
         output_path: Path for output PPTX file
@@ -162,69 +210,67 @@ def rearrange_presentation(template_path, output_path, slide_sequence):
     else:
         prs = Presentation(template_path)
 
-    total_slides = len(prs.slides)
+    sld_id_lst = prs.slides._sldIdLst
+    template_ids = list(sld_id_lst)
+    total_slides = len(template_ids)
 
     # Validate indices
     for idx in slide_sequence:
         if idx < 0 or idx >= total_slides:
             raise ValueError(f"Slide index {idx} out of range (0-{total_slides - 1})")
 
-    # Track original slides and their duplicates
-    slide_map = []  # List of actual slide indices for final presentation
-    duplicated = {}  # Track duplicates: original_idx -> [duplicate_indices]
+    counts = Counter(slide_sequence)
+    shared_bytes = 0  # Size of parts duplicates share instead of copying
+    available = {}  # template_idx -> sldId elements not yet placed, original first
+    final_ids = []  # sldId elements in final order
 
     # Step 1: DUPLICATE repeated slides
     print(f"Processing {len(slide_sequence)} slides from template...")
     for i, template_idx in enumerate(slide_sequence):
-        if template_idx in duplicated and duplicated[template_idx]:
+        if available.get(template_idx):
             # Already duplicated this slide, use the duplicate
-            slide_map.append(duplicated[template_idx].pop(0))
             print(f"  [{i}] Using duplicate of slide {template_idx}")
-        elif slide_sequence.count(template_idx) > 1 and template_idx not in duplicated:
+        elif counts[template_idx] > 1:
             # First occurrence of a repeated slide - create duplicates
-            slide_map.append(template_idx)
-            duplicates = []
-            count = slide_sequence.count(template_idx) - 1
+            count = counts[template_idx] - 1
             print(
                 f"  [{i}] Using original slide {template_idx}, creating {count} duplicate(s)"
             )
-            for _ in range(count):
-                duplicate_slide(prs, template_idx)
-                duplicates.append(len(prs.slides) - 1)
-            duplicated[template_idx] = duplicates
+            _, shared = duplicate_slides(prs, template_idx, count)
+            shared_bytes += shared
+            # Duplicates are appended to the end of the slide list
+            available[template_idx] = deque(
+                [template_ids[template_idx]] + list(sld_id_lst[-count:])
+            )
         else:
-            # Unique slide or first occurrence already handled, use original
-            slide_map.append(template_idx)
+            # Unique slide, use original
             print(f"  [{i}] Using original slide {template_idx}")
+            available[template_idx] = deque([template_ids[template_idx]])
+        final_ids.append(available[template_idx].popleft())
 
-    # Step 2: DELETE unwanted slides (work backwards)
-    slides_to_keep = set(slide_map)
-    print(f"\nDeleting {len(prs.slides) - len(slides_to_keep)} unused slides...")
-    for i in range(len(prs.slides) - 1, -1, -1):
-        if i not in slides_to_keep:
-            delete_slide(prs, i)
-            # Update slide_map indices after deletion
-            slide_map = [idx - 1 if idx > i else idx for idx in slide_map]
+    # Step 2: DELETE unwanted slides
+    kept = {sld_id.rId for sld_id in final_ids}
+    unused = [sld_id for sld_id in sld_id_lst if sld_id.rId not in kept]
+    print(f"\nDeleting {len(unused)} unused slides...")
+    delete_slides(prs, unused)
 
     # Step 3: REORDER to final sequence
-    print(f"Reordering {len(slide_map)} slides to final sequence...")
-    for target_pos in range(len(slide_map)):
-        # Find which slide should be at target_pos
-        current_pos = slide_map[target_pos]
-        if current_pos != target_pos:
-            reorder_slides(prs, current_pos, target_pos)
-            # Update slide_map: the move shifts other slides
-            for i in range(len(slide_map)):
-                if slide_map[i] > current_pos and slide_map[i] <= target_pos:
-                    slide_map[i] -= 1
-                elif slide_map[i] < current_pos and slide_map[i] >= target_pos:
-                    slide_map[i] += 1
-            slide_map[target_pos] = target_pos
+    print(f"Reordering {len(final_ids)} slides to final sequence...")
+    sld_id_lst[:] = final_ids
+
+    # Name slide parts (slide1.xml, ...) in their final order
+    prs.part.rename_slide_parts([sld_id.rId for sld_id in final_ids])
+    final_slide_count = len(final_ids)
 
     # Save the presentation
     prs.save(output_path)
     print(f"\nSaved rearranged presentation to: {output_path}")
-    print(f"Final presentation has {len(prs.slides)} slides")
+    print(f"Final presentation has {final_slide_count} slides")
+    if shared_bytes:
+        print(
+            f"Duplicates share images, media and charts with their originals "
+            f"({shared_bytes / 1024:.1f} KB not copied)"
+        )
 
 
 if __name__ == "__main__":
@@ -3,23 +3,43 @@
 
 Usage:
     python replace.py <input.pptx> <replacements.json> <output.pptx>
+    python replace.py <template.pptx> <jobs> <output_dir> --batch [--workers N] [--report report.jsonl]
 
 The replacements JSON should have the structure output by inventory.py.
 ALL text shapes identified by inventory.py will have their text cleared
 unless "paragraphs" is specified in the replacements for that shape.
+
+In batch mode the template is loaded and inventoried once and every
+replacement JSON is applied to a fresh copy of it. <jobs> is either a
+directory of replacement JSON files (each written to <output_dir>/<name>.pptx)
+or a JSONL file with one job per line:
+
+    {"replacements": "team-a.json", "output": "team-a.pptx"}
+
+Replacement paths are relative to the JSONL file and outputs to <output_dir>.
+The report has one JSON object per job, written as each job finishes.
 """
 
+import argparse
+import contextlib
+import copy
+import io
 import json
+import multiprocessing
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
-from inventory import InventoryData, extract_text_inventory
+from inventory import InventoryData, StyleResolver, extract_text_inventory
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.dml import MSO_THEME_COLOR
 from pptx.enum.text import PP_ALIGN
 from pptx.oxml.xmlchemy import OxmlElement
+from pptx.shapes.shapetree import SlideShapeFactory
 from pptx.util import Pt
 
 
@@ -211,18 +231,83 @@ def check_duplicate_keys(pairs):
     return result
 
 
-def apply_replacements(pptx_file: str, json_file: str, output_file: str):
-    """Apply text replacements from JSON to PowerPoint presentation."""
+class ReplacementTemplate:
+    """A presentation inventoried once and used as the source of many replacement jobs.
+
+    The template's bytes, inventory and original overflow are kept in memory.
+    open() returns a fresh, independent copy of the presentation with an
+    inventory bound to its shapes, without measuring any text again.
+    """
 
-    # Load presentation
-    prs = Presentation(pptx_file)
+    def __init__(self, pptx_file: str):
+        self.path = Path(pptx_file)
+        self.data = self.path.read_bytes()
+        prs = Presentation(io.BytesIO(self.data))
+        self.inventory = extract_text_inventory(self.path, prs)
+        self.original_overflow = detect_frame_overflow(self.inventory)
+
+        # Position of each inventoried shape's element in its slide, as child
+        # indices from the slide root, so it can be found in a fresh copy
+        self._locations: Dict[str, Dict[str, List[int]]] = {}
+        for slide_key, shapes_dict in self.inventory.items():
+            self._locations[slide_key] = {}
+            for shape_key, shape_data in shapes_dict.items():
+                path = []
+                element = shape_data.shape._element
+                while element.getparent() is not None:
+                    path.append(element.getparent().index(element))
+                    element = element.getparent()
+                self._locations[slide_key][shape_key] = path[::-1]
+
+    def open(self) -> Tuple[Any, InventoryData]:
+        """Load a fresh copy of the template and its inventory."""
+        prs = Presentation(io.BytesIO(self.data))
+        # The template's resolver is keyed by part, so sharing it would keep
+        # every opened copy's package alive
+        styles = StyleResolver()
+        inventory: InventoryData = {}
+        for slide_key, shapes_dict in self.inventory.items():
+            slide = prs.slides[int(slide_key.split("-")[1])]
+            inventory[slide_key] = {}
+            for shape_key, shape_data in shapes_dict.items():
+                element = slide._element
+                for index in self._locations[slide_key][shape_key]:
+                    element = element[index]
+                shape_copy = copy.copy(shape_data)
+                shape_copy.shape = SlideShapeFactory(element, slide.shapes)
+                shape_copy.styles = styles
+                inventory[slide_key][shape_key] = shape_copy
+        return prs, inventory
+
+
+def apply_replacements(
+    pptx_file: str,
+    json_file: str,
+    output_file: str,
+    template: Optional[ReplacementTemplate] = None,
+):
+    """Apply text replacements from JSON to PowerPoint presentation.
+
+    Args:
+        pptx_file: Input presentation
+        json_file: Replacement JSON
+        output_file: Where to save the updated presentation
+        template: Optional ReplacementTemplate of pptx_file to copy instead of
+            loading and inventorying the file again
+    """
+    if template is None:
+        # Load presentation
+        prs = Presentation(pptx_file)
 
-    # Get inventory of all text shapes (returns ShapeData objects)
-    # Pass prs to use same Presentation instance
-    inventory = extract_text_inventory(Path(pptx_file), prs)
+        # Get inventory of all text shapes (returns ShapeData objects)
+        # Pass prs to use same Presentation instance
+        inventory = extract_text_inventory(Path(pptx_file), prs)
 
-    # Detect text overflow in original presentation
-    original_overflow = detect_frame_overflow(inventory)
+        # Detect text overflow in original presentation
+        original_overflow = detect_frame_overflow(inventory)
+    else:
+        prs, inventory = template.open()
+        original_overflow = template.original_overflow
 
     # Load replacement data with duplicate key detection
     with open(json_file, "r") as f:
@@ -245,6 +330,10 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     shapes_cleared = 0
     shapes_replaced = 0
 
+    # Shapes given new text; only these can overflow or raise warnings
+    # after the replacement, since every other shape is left empty
+    replaced_shapes: InventoryData = {}
+
     # Process each slide from inventory
     for slide_key, shapes_dict in inventory.items():
         if not slide_key.startswith("slide-"):
@@ -278,6 +367,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
                 continue
 
             shapes_replaced += 1
+            replaced_shapes.setdefault(slide_key, {})[shape_key] = shape_data
 
             # Add replacement paragraphs
             for i, para_data in enumerate(replacement_shape_data["paragraphs"]):
@@ -288,20 +378,12 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
                 apply_paragraph_properties(p, para_data)
 
-    # Check for issues after replacements
-    # Save to a temporary file and reload to avoid modifying the presentation during inventory
-    # (extract_text_inventory accesses font.color which adds empty <a:solidFill/> elements)
-    import tempfile
-
-    with tempfile.NamedTemporaryFile(suffix=".pptx", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        prs.save(str(tmp_path))
-
-    try:
-        updated_inventory = extract_text_inventory(tmp_path)
-        updated_overflow = detect_frame_overflow(updated_inventory)
-    finally:
-        tmp_path.unlink()  # Clean up temp file
+    # Check for issues after replacements by re-measuring the replaced shapes
+    # in memory (inventory reads formatting without modifying the document)
+    for shapes_dict in replaced_shapes.values():
+        for shape_data in shapes_dict.values():
+            shape_data.reestimate_text()
+    updated_overflow = detect_frame_overflow(replaced_shapes)
 
     # Check if any text overflow got worse
     overflow_errors = []
@@ -320,7 +402,7 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
 
     # Collect warnings from updated shapes
     warnings = []
-    for slide_key, shapes_dict in updated_inventory.items():
+    for slide_key, shapes_dict in replaced_shapes.items():
         for shape_key, shape_data in shapes_dict.items():
             if shape_data.warnings:
                 for warning in shape_data.warnings:
@@ -353,15 +435,173 @@ def apply_replacements(pptx_file: str, json_file: str, output_file: str):
     print(f"  - Shapes replaced: {shapes_replaced}")
 
 
+def apply_replacements_batch(
+    template_file: str,
+    jobs: str,
+    output_dir: str,
+    workers: Optional[int] = None,
+    report: Optional[str] = None,
+) -> bool:
+    """Apply many replacement JSON files to one template and write a JSONL report.
+
+    The template is loaded and inventoried once, before the worker processes
+    start, so workers share it copy-on-write where the platform forks. A
+    failing job is recorded in the report and does not stop the others.
+
+    Returns:
+        bool: True if every job succeeded
+    """
+    job_list = _read_jobs(jobs, output_dir)
+    workers = workers or os.cpu_count() or 1
+
+    _batch_state["template"] = ReplacementTemplate(template_file)
+
+    out = open(report, "w", encoding="utf-8") if report else sys.stdout
+    succeeded = 0
+    try:
+        if workers > 1 and len(job_list) > 1:
+            # Forked workers inherit the loaded template; elsewhere each
+            # worker loads it once in _init_batch_worker
+            context = (
+                multiprocessing.get_context("fork")
+                if "fork" in multiprocessing.get_all_start_methods()
+                else None
+            )
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(job_list)),
+                mp_context=context,
+                initializer=_init_batch_worker,
+                initargs=(template_file,),
+            ) as executor:
+                futures = [
+                    executor.submit(_run_job, index, job)
+                    for index, job in enumerate(job_list)
+                ]
+                for future in as_completed(futures):
+                    succeeded += _write_record(out, future.result())
+        else:
+            for index, job in enumerate(job_list):
+                succeeded += _write_record(out, _run_job(index, job))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{succeeded}/{len(job_list)} replacement jobs succeeded", file=sys.stderr)
+    return succeeded == len(job_list)
+
+
+def _read_jobs(jobs: str, output_dir: str) -> List[Dict[str, str]]:
+    """Read (replacements, output) jobs from a directory or JSONL file."""
+    jobs_path = Path(jobs)
+    if jobs_path.is_dir():
+        return [
+            {
+                "replacements": str(json_file),
+                "output": str(Path(output_dir) / f"{json_file.stem}.pptx"),
+            }
+            for json_file in sorted(jobs_path.glob("*.json"))
+        ]
+
+    job_list = []
+    with open(jobs_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+                replacements, output = job["replacements"], job["output"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(
+                    f"{jobs}:{line_number}: expected an object with "
+                    f'"replacements" and "output": {e}'
+                ) from e
+            job_list.append(
+                {
+                    "replacements": str(jobs_path.parent / replacements),
+                    "output": str(Path(output_dir) / output),
+                }
+            )
+    return job_list
+
+
+def _write_record(out, record: Dict[str, Any]) -> int:
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+    return 1 if record["passed"] else 0
+
+
+_batch_state: Dict[str, Any] = {}
+
+
+def _init_batch_worker(template_file: str):
+    """Load the template in workers that did not inherit it."""
+    if "template" not in _batch_state:
+        _batch_state["template"] = ReplacementTemplate(template_file)
+
+
+def _run_job(index: int, job: Dict[str, str]) -> Dict[str, Any]:
+    """Apply one replacement job to a copy of the template and return its report record."""
+    record: Dict[str, Any] = {
+        "index": index,
+        "replacements": job["replacements"],
+        "output": job["output"],
+    }
+    log = io.StringIO()
+    start = time.perf_counter()
+
+    try:
+        Path(job["output"]).parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.redirect_stdout(log):
+            apply_replacements(
+                str(_batch_state["template"].path),
+                job["replacements"],
+                job["output"],
+                template=_batch_state["template"],
+            )
+        record["passed"] = True
+    except Exception as e:
+        record["passed"] = False
+        record["error"] = str(e)
+
+    record["seconds"] = round(time.perf_counter() - start, 3)
+    record["log"] = log.getvalue()
+    return record
+
+
 def main():
     """Main entry point for command-line usage."""
-    if len(sys.argv) != 4:
-        print(__doc__)
-        sys.exit(1)
-
-    input_pptx = Path(sys.argv[1])
-    replacements_json = Path(sys.argv[2])
-    output_pptx = Path(sys.argv[3])
+    parser = argparse.ArgumentParser(
+        description="Apply text replacements to PowerPoint presentation",
+        epilog=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="Input (or template) PowerPoint file")
+    parser.add_argument(
+        "replacements",
+        help="Replacement JSON; with --batch, a directory of them or a JSONL job file",
+    )
+    parser.add_argument(
+        "output", help="Output PowerPoint file; with --batch, an output directory"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Apply many replacement jobs to the same template",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of jobs run in parallel in batch mode (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--report",
+        help="Write the batch report to this JSONL file (default: stdout)",
+    )
+    args = parser.parse_args()
+
+    input_pptx = Path(args.input)
+    replacements_json = Path(args.replacements)
+    output_pptx = Path(args.output)
 
     if not input_pptx.exists():
         print(f"Error: Input file '{input_pptx}' not found")
@@ -371,6 +611,21 @@ def main():
         print(f"Error: Replacements JSON file '{replacements_json}' not found")
         sys.exit(1)
 
+    if args.batch:
+        try:
+            success = apply_replacements_batch(
+                str(input_pptx),
+                str(replacements_json),
+                str(output_pptx),
+                workers=args.workers,
+                report=args.report,
+            )
+        except ValueError as e:
+            # Malformed job file, reported without a traceback
+            print(f"Error: {e}")
+            sys.exit(1)
+        sys.exit(0 if success else 1)
+
     try:
         apply_replacements(str(input_pptx), str(replacements_json), str(output_pptx))
     except Exception as e:
@@ -38,17 +38,33 @@ Examples:
 
     python thumbnail.py template.pptx analysis --outline-placeholders
     # Creates thumbnail grids with red outlines around text placeholders
+
+Rendered slides are cached by content (see slide_render_keys), so a re-run
+only renders the slides that changed and only rewrites the grids containing
+them. Pass --no-cache to render everything from scratch.
 """
 
 import argparse
-import subprocess
+import hashlib
+import json
+import os
+import posixpath
+import shutil
 import sys
 import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import unquote
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
 
-from inventory import extract_text_inventory
+import lxml.etree
+from pdf_rasterizer import rasterize_pdf
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
+from rearrange import delete_slides
+from soffice_pool import get_pool
 
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
@@ -63,6 +79,67 @@ BORDER_WIDTH = 2  # Border width around thumbnails
 FONT_SIZE_RATIO = 0.12  # Font size as fraction of thumbnail width
 LABEL_PADDING_RATIO = 0.4  # Label padding as fraction of font size
 
+# Rendered slide cache (least recently used images are evicted past the bound)
+CACHE_DIR = Path(
+    os.environ.get("PPTX_THUMBNAIL_CACHE")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "pptx_thumbnails"
+)
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Bump when rendering changes, so stale images and grids are never reused
+CACHE_VERSION = "2"
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+PRESENTATIONML_NAMESPACE = "http://schemas.openxmlformats.org/presentationml/2006/main"
+OFFICE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+
+DRAWINGML_NAMESPACE = "http://schemas.openxmlformats.org/drawingml/2006/main"
+EMU_PER_INCH = 914400.0
+
+SHAPE_TREE_PATH = (
+    f"{{{PRESENTATIONML_NAMESPACE}}}cSld/{{{PRESENTATIONML_NAMESPACE}}}spTree"
+)
+PLACEHOLDER_PATH = "/".join(
+    f"{{{PRESENTATIONML_NAMESPACE}}}{tag}" for tag in ("*", "nvPr", "ph")
+)
+XFRM_PATH = f"{{{PRESENTATIONML_NAMESPACE}}}*/{{{DRAWINGML_NAMESPACE}}}xfrm"
+SHAPE_ELEMENTS = {"sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart"}
+
+# Master placeholder type a layout placeholder inherits its position from
+MASTER_PLACEHOLDER_TYPES = {
+    "body": "body",
+    "chart": "body",
+    "clipArt": "body",
+    "ctrTitle": "title",
+    "dgm": "body",
+    "dt": "dt",
+    "ftr": "ftr",
+    "media": "body",
+    "obj": "body",
+    "pic": "body",
+    "sldNum": "sldNum",
+    "subTitle": "body",
+    "tbl": "body",
+    "title": "title",
+}
+
+# Relationships that do not affect how a slide renders. Links to other slides
+# are not followed so that editing one slide leaves the others' keys alone.
+NON_RENDERING_RELATIONSHIPS = {
+    "notesSlide",
+    "slide",
+    "comments",
+    "commentAuthors",
+    "notesMaster",
+    "handoutMaster",
+    "viewProps",
+    "printerSettings",
+}
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -86,6 +163,11 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every slide instead of reusing cached images of unchanged slides",
+    )
 
     args = parser.parse_args()
 
@@ -106,26 +188,36 @@ def main():
     print(f"Processing: {args.input}")
 
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Get placeholder regions if outlining is enabled
-            placeholder_regions = None
-            slide_dimensions = None
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            # Get placeholder regions if outlining is enabled, reading the
+            # slide XML while soffice converts the deck
+            regions_future = None
             if args.outline_placeholders:
                 print("Extracting placeholder regions...")
-                placeholder_regions, slide_dimensions = get_placeholder_regions(
-                    input_path
-                )
-                if placeholder_regions:
-                    print(f"Found placeholders on {len(placeholder_regions)} slides")
+                regions_future = executor.submit(get_placeholder_regions, input_path)
 
             # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
+            slides = slide_render_keys(input_path)
+            cache = None if args.no_cache else ThumbnailCache()
+            slide_images = convert_to_images(
+                input_path, Path(temp_dir), CONVERSION_DPI, cache=cache, slides=slides
+            )
             if not slide_images:
                 print("Error: No slides found")
                 sys.exit(1)
 
             print(f"Found {len(slide_images)} slides")
 
+            placeholder_regions = None
+            slide_dimensions = None
+            if regions_future is not None:
+                placeholder_regions, slide_dimensions = regions_future.result()
+                if placeholder_regions:
+                    print(f"Found placeholders on {len(placeholder_regions)} slides")
+
             # Create grids (max cols×(cols+1) images per grid)
             grid_files = create_grids(
                 slide_images,
@@ -134,6 +226,11 @@ def main():
                 output_path,
                 placeholder_regions,
                 slide_dimensions,
+                image_keys=(
+                    None
+                    if cache is None
+                    else [slide.image_key(CONVERSION_DPI) for slide in slides]
+                ),
             )
 
             # Print saved files
@@ -159,98 +256,470 @@ def create_hidden_slide_placeholder(size):
 def get_placeholder_regions(pptx_path):
     """Extract ALL text regions from the presentation.
 
+    Shape boxes are read straight from the slide XML: a shape counts if it
+    holds non-blank text (slide numbers and numeric footers excepted), shapes
+    in groups are offset by their groups, and placeholders inherit missing
+    position and size from their layout and master placeholders, matching
+    the shapes and positions reported by inventory.py.
+
     Returns a tuple of (placeholder_regions, slide_dimensions).
     text_regions is a dict mapping slide indices to lists of text regions.
     Each region is a dict with 'left', 'top', 'width', 'height' in inches.
     slide_dimensions is a tuple of (width_inches, height_inches).
     """
-    prs = Presentation(str(pptx_path))
-    inventory = extract_text_inventory(pptx_path, prs)
     placeholder_regions = {}
+    layout_boxes = {}  # Layout part -> placeholder idx -> inherited box
+
+    with zipfile.ZipFile(pptx_path) as zf:
+        package = _PackageReader(zf)
+        presentation, slide_parts = package.presentation()
+
+        # Get actual slide dimensions in inches (EMU to inches conversion)
+        sld_sz = presentation.find(f"{{{PRESENTATIONML_NAMESPACE}}}sldSz")
+        slide_width = int(sld_sz.get("cx", 0)) if sld_sz is not None else 0
+        slide_height = int(sld_sz.get("cy", 0)) if sld_sz is not None else 0
+        slide_width_inches = (slide_width or 9144000) / EMU_PER_INCH
+        slide_height_inches = (slide_height or 5143500) / EMU_PER_INCH
+
+        for slide_idx, slide_part in enumerate(slide_parts):
+            layout_part = package.related(slide_part, "slideLayout")
+            if layout_part not in layout_boxes:
+                layout_boxes[layout_part] = _layout_placeholder_boxes(
+                    package, layout_part
+                )
+            sp_tree = package.xml(slide_part).find(SHAPE_TREE_PATH)
+            if sp_tree is None:
+                continue
 
-    # Get actual slide dimensions in inches (EMU to inches conversion)
-    slide_width_inches = (prs.slide_width or 9144000) / 914400.0
-    slide_height_inches = (prs.slide_height or 5143500) / 914400.0
-
-    for slide_key, shapes in inventory.items():
-        # Extract slide index from "slide-N" format
-        slide_idx = int(slide_key.split("-")[1])
-        regions = []
-
-        for shape_key, shape_data in shapes.items():
-            # The inventory only contains shapes with text, so all shapes should be highlighted
-            regions.append(
+            # The boxes only include shapes with text, so all should be highlighted
+            regions = [
                 {
-                    "left": shape_data.left,
-                    "top": shape_data.top,
-                    "width": shape_data.width,
-                    "height": shape_data.height,
+                    "left": round(left / EMU_PER_INCH, 2),
+                    "top": round(top / EMU_PER_INCH, 2),
+                    "width": round(width / EMU_PER_INCH, 2),
+                    "height": round(height / EMU_PER_INCH, 2),
                 }
-            )
-
-        if regions:
-            placeholder_regions[slide_idx] = regions
+                for left, top, width, height in _text_shape_boxes(
+                    sp_tree, layout_boxes[layout_part]
+                )
+            ]
+            if regions:
+                placeholder_regions[slide_idx] = regions
 
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
-    """Convert PowerPoint to images via PDF, handling hidden slides."""
+def _shape_elements(sp_tree):
+    """Shape elements directly inside a shape tree or group."""
+    return [
+        child
+        for child in sp_tree
+        if lxml.etree.QName(child).localname in SHAPE_ELEMENTS
+        and lxml.etree.QName(child).namespace == PRESENTATIONML_NAMESPACE
+    ]
+
+
+def _placeholder(shape):
+    """(type, idx) of a placeholder shape, or None for other shapes."""
+    ph = shape.find(PLACEHOLDER_PATH)
+    if ph is None:
+        return None
+    return ph.get("type", "obj"), int(ph.get("idx", "0"))
+
+
+def _own_box(shape):
+    """[left, top, width, height] in EMU set on a shape itself, None where unset."""
+    box = [None, None, None, None]
+    xfrm = shape.find(XFRM_PATH)
+    if xfrm is None:
+        xfrm = shape.find(f"{{{PRESENTATIONML_NAMESPACE}}}xfrm")  # graphicFrame
+    if xfrm is not None:
+        off = xfrm.find(f"{{{DRAWINGML_NAMESPACE}}}off")
+        ext = xfrm.find(f"{{{DRAWINGML_NAMESPACE}}}ext")
+        if off is not None:
+            box[0:2] = int(off.get("x")), int(off.get("y"))
+        if ext is not None:
+            box[2:4] = int(ext.get("cx")), int(ext.get("cy"))
+    return box
+
+
+def _inherit(box, base):
+    """Fill the unset values of a box from the box it inherits from."""
+    if base is None:
+        return box
+    return [own if own is not None else inherited for own, inherited in zip(box, base)]
+
+
+def _layout_placeholder_boxes(package, layout_part):
+    """Boxes of a layout's placeholders by idx, inherited from its master."""
+    if layout_part is None:
+        return {}
+    master_boxes = {}  # Placeholder type -> box
+    master_part = package.related(layout_part, "slideMaster")
+    if master_part is not None:
+        sp_tree = package.xml(master_part).find(SHAPE_TREE_PATH)
+        for shape in _shape_elements(sp_tree) if sp_tree is not None else []:
+            placeholder = _placeholder(shape)
+            if placeholder is not None:
+                master_boxes.setdefault(placeholder[0], _own_box(shape))
+
+    boxes = {}
+    sp_tree = package.xml(layout_part).find(SHAPE_TREE_PATH)
+    for shape in _shape_elements(sp_tree) if sp_tree is not None else []:
+        placeholder = _placeholder(shape)
+        if placeholder is not None and placeholder[1] not in boxes:
+            ph_type, idx = placeholder
+            base_type = MASTER_PLACEHOLDER_TYPES.get(ph_type)
+            boxes[idx] = _inherit(_own_box(shape), master_boxes.get(base_type))
+    return boxes
+
+
+def _text_shape_boxes(group, layout_boxes, parent_left=0, parent_top=0):
+    """Absolute (left, top, width, height) in EMU of the text shapes in a group."""
+    boxes = []
+    for shape in _shape_elements(group):
+        tag = lxml.etree.QName(shape).localname
+        if tag == "grpSp":
+            # Children are offset by the group's position
+            group_left, group_top = (value or 0 for value in _own_box(shape)[:2])
+            boxes.extend(
+                _text_shape_boxes(
+                    shape,
+                    layout_boxes,
+                    parent_left + group_left,
+                    parent_top + group_top,
+                )
+            )
+            continue
+        if tag != "sp":
+            continue
+
+        tx_body = shape.find(f"{{{PRESENTATIONML_NAMESPACE}}}txBody")
+        if tx_body is None:
+            continue
+        text = "".join(
+            t.text or "" for t in tx_body.iter(f"{{{DRAWINGML_NAMESPACE}}}t")
+        ).strip()
+        if not text:
+            continue
+
+        box = _own_box(shape)
+        placeholder = _placeholder(shape)
+        if placeholder is not None:
+            # Skip slide numbers and numeric footers
+            ph_type, idx = placeholder
+            if ph_type == "sldNum" or (ph_type == "ftr" and text.isdigit()):
+                continue
+            box = _inherit(box, layout_boxes.get(idx))
+
+        left, top, width, height = (value or 0 for value in box)
+        boxes.append((parent_left + left, parent_top + top, width, height))
+    return boxes
+
+
+class SlideKey:
+    """Content key of one slide and the rendering facts derived with it."""
+
+    __slots__ = ("digest", "hidden", "numbered")
+
+    def __init__(self, digest, hidden, numbered):
+        self.digest = digest
+        self.hidden = hidden
+        self.numbered = numbered  # Shows a slide number field
+
+    def image_key(self, dpi):
+        """Key of this slide's rendered image at a DPI."""
+        return f"{'hidden-' if self.hidden else ''}{self.digest}-{dpi}"
+
+
+def slide_render_keys(pptx_path):
+    """Content keys of a presentation's slides, in presentation order.
+
+    A slide's key digests everything its rendering depends on: the slide XML,
+    every part it reaches through its relationships (layout, master, theme,
+    images, charts, ...) and the presentation-wide parts: the presentation XML
+    without its slide list (slide size, default text styles) and everything it
+    reaches except slides (table styles, embedded fonts, masters, theme).
+    Notes, comments, view settings and links to other slides are not
+    followed, so editing one slide only changes that slide's key. Slides
+    showing a slide number field also depend on their position.
+
+    Returns:
+        list: SlideKey per slide
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        package = _PackageReader(zf)
+        presentation, slide_parts = package.presentation()
+        # Settings outside the slide list (slide size, default text styles,
+        # first slide number) and the parts the presentation renders through
+        # (table styles, embedded fonts, ...) affect every slide
+        sld_id_lst = presentation.find(f"{{{PRESENTATIONML_NAMESPACE}}}sldIdLst")
+        if sld_id_lst is not None:
+            presentation.remove(sld_id_lst)
+        digest = hashlib.sha256(lxml.etree.tostring(presentation))
+        presentation_part = package.related("", "officeDocument")
+        for part_digest in sorted(
+            package.part_digest(part) for part in package.reachable(presentation_part)
+        ):
+            digest.update(part_digest.encode())
+        deck_digest = digest.hexdigest()
+
+        keys = []
+        for position, slide_part in enumerate(slide_parts):
+            blob = zf.read(slide_part)
+            numbered = b'type="slidenum"' in blob
+            digest = hashlib.sha256(
+                "\n".join(
+                    [
+                        CACHE_VERSION,
+                        deck_digest,
+                        package.closure_digest(slide_part),
+                        str(position) if numbered else "",
+                    ]
+                ).encode()
+            ).hexdigest()
+            hidden = lxml.etree.fromstring(blob).get("show") == "0"
+            keys.append(SlideKey(digest, hidden, numbered))
+    return keys
+
+
+class _PackageReader:
+    """Relationships, XML and content digests of the parts of a zipped package."""
+
+    def __init__(self, zf):
+        self.zf = zf
+        self.names = set(zf.namelist())
+        self._relationships = {}
+        self._digests = {}
+
+    def relationships(self, part):
+        """(id, type, target attribute, target part or None) per relationship."""
+        if part not in self._relationships:
+            directory, filename = posixpath.split(part)
+            rels_part = posixpath.join(directory, "_rels", f"{filename}.rels")
+            relationships = []
+            if rels_part in self.names:
+                root = lxml.etree.fromstring(self.zf.read(rels_part))
+                tag = f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+                for rel in root.iter(tag):
+                    target = rel.get("Target", "")
+                    target_part = None
+                    if rel.get("TargetMode") != "External":
+                        target_part = posixpath.normpath(
+                            posixpath.join(directory, unquote(target.split("#")[0]))
+                            if not target.startswith("/")
+                            else target.lstrip("/")
+                        )
+                        if target_part not in self.names:
+                            target_part = None
+                    relationships.append(
+                        (rel.get("Id"), rel.get("Type", ""), target, target_part)
+                    )
+            self._relationships[part] = relationships
+        return self._relationships[part]
+
+    def related(self, part, type_name):
+        """First part related to a part by a relationship type, or None."""
+        for _, rel_type, _, target_part in self.relationships(part):
+            if rel_type.rsplit("/", 1)[-1] == type_name:
+                return target_part
+        return None
+
+    def xml(self, part):
+        """Parsed root element of a part."""
+        return lxml.etree.fromstring(self.zf.read(part))
+
+    def presentation(self):
+        """(presentation root element, slide part names in presentation order)."""
+        presentation_part = self.related("", "officeDocument")
+        presentation = self.xml(presentation_part)
+        targets = {
+            rel_id: target_part
+            for rel_id, _, _, target_part in self.relationships(presentation_part)
+        }
+        slide_parts = [
+            targets[sld_id.get(f"{{{OFFICE_RELATIONSHIPS_NAMESPACE}}}id")]
+            for sld_id in presentation.iterfind(
+                f"{{{PRESENTATIONML_NAMESPACE}}}sldIdLst/"
+                f"{{{PRESENTATIONML_NAMESPACE}}}sldId"
+            )
+        ]
+        return presentation, slide_parts
+
+    @staticmethod
+    def _renders(rel_type):
+        return rel_type.rsplit("/", 1)[-1] not in NON_RENDERING_RELATIONSHIPS
+
+    def part_digest(self, part):
+        """Digest of a part's content and the relationships it renders through."""
+        if part not in self._digests:
+            digest = hashlib.sha256(self.zf.read(part))
+            for rel_id, rel_type, target, _ in self.relationships(part):
+                # Non-rendering targets (e.g. other slides' names) are left out
+                if not self._renders(rel_type):
+                    target = ""
+                digest.update(f"\n{rel_id} {rel_type} {target}".encode())
+            self._digests[part] = digest.hexdigest()
+        return self._digests[part]
+
+    def reachable(self, part):
+        """Parts reachable from a part through rendering relationships, excluding it."""
+        reached = {part}
+        pending = [part]
+        while pending:
+            for _, rel_type, _, target_part in self.relationships(pending.pop()):
+                if (
+                    target_part is not None
+                    and target_part not in reached
+                    and self._renders(rel_type)
+                ):
+                    reached.add(target_part)
+                    pending.append(target_part)
+        reached.discard(part)
+        return reached
+
+    def closure_digest(self, part):
+        """Digest of a part and all parts reachable through rendering relationships."""
+        digest = hashlib.sha256(self.part_digest(part).encode())
+        for part_digest in sorted(self.part_digest(p) for p in self.reachable(part)):
+            digest.update(part_digest.encode())
+        return digest.hexdigest()
+
+
+class ThumbnailCache:
+    """Directory of rendered slide images named by their SlideKey image key.
+
+    Images are reused across runs and presentations: any slide whose content
+    is unchanged keeps its key. Reading an image refreshes its modification
+    time, and evict() removes the least recently used images once the
+    directory grows past max_bytes.
+
+    The cache is private to the user and never fails a run: if its directory
+    cannot be read or written, lookups miss and rendered images stay where
+    they are.
+    """
+
+    def __init__(self, path=None, max_bytes=CACHE_MAX_BYTES):
+        self.path = Path(path) if path is not None else CACHE_DIR
+        self.max_bytes = max_bytes
+        try:
+            self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        except OSError:
+            pass  # Every get() misses and put() keeps the rendered image
+
+    def _image_path(self, image_key):
+        return self.path / f"{image_key}.jpg"
+
+    def get(self, image_key):
+        """Path of the cached image for a key, or None."""
+        path = self._image_path(image_key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, image_key, image_path):
+        """Move a rendered image into the cache and return its new path.
+
+        If the cache cannot be written, the image is left in place and its
+        original path is returned.
+        """
+        path = self._image_path(image_key)
+        # Move under a private name first so readers never see a partial file
+        partial = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+        try:
+            shutil.move(str(image_path), partial)
+        except OSError:
+            return Path(image_path)
+        try:
+            os.replace(partial, path)
+        except OSError:
+            shutil.move(partial, str(image_path))
+            return Path(image_path)
+        return path
+
+    def evict(self, keep=()):
+        """Remove the least recently used images until under max_bytes."""
+        keep = {Path(path) for path in keep}
+        entries = []
+        total = 0
+        try:
+            paths = list(self.path.glob("*.jpg"))
+        except OSError:
+            return
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            entries.append((stat.st_mtime, stat.st_size, path))
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path in keep:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+            total -= size
+
+
+def convert_to_images(pptx_path, temp_dir, dpi, cache=None, slides=None):
+    """Convert PowerPoint to images via PDF, handling hidden slides.
+
+    With a cache, only slides without a cached image are rendered. When that
+    is a minority of the slides, they are converted from a copy of the deck
+    holding just those slides; otherwise the whole deck is converted and only
+    their pages are rasterized.
+
+    Args:
+        pptx_path: Presentation to render
+        temp_dir: Scratch directory for the PDF and uncached images
+        dpi: Rasterization resolution
+        cache: Optional ThumbnailCache
+        slides: SlideKey list from slide_render_keys (computed if None)
+    """
     # Detect hidden slides
     print("Analyzing presentation...")
-    prs = Presentation(str(pptx_path))
-    total_slides = len(prs.slides)
+    if slides is None:
+        slides = slide_render_keys(pptx_path)
+    total_slides = len(slides)
 
     # Find hidden slides (1-based indexing for display)
-    hidden_slides = {
-        idx + 1
-        for idx, slide in enumerate(prs.slides)
-        if slide.element.get("show") == "0"
-    }
+    hidden_slides = {idx + 1 for idx, slide in enumerate(slides) if slide.hidden}
 
     print(f"Total slides: {total_slides}")
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
-    # Convert to PDF
-    print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
-
-    # Convert PDF to images
-    print(f"Converting to images at {dpi} DPI...")
-    result = subprocess.run(
-        ["pdftoppm", "-jpeg", "-r", str(dpi), str(pdf_path), str(temp_dir / "slide")],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        raise RuntimeError("Image conversion failed")
-
-    visible_images = sorted(temp_dir.glob("slide-*.jpg"))
+    visible = [idx for idx, slide in enumerate(slides) if not slide.hidden]
+    images = {}  # Slide index -> image path
+    if cache is not None:
+        for idx in visible:
+            cached = cache.get(slides[idx].image_key(dpi))
+            if cached is not None:
+                images[idx] = cached
+        if images:
+            print(f"Reusing {len(images)} cached slide image(s)")
+
+    missing = [idx for idx in visible if idx not in images]
+    if missing:
+        images.update(_render_slides(pptx_path, slides, missing, temp_dir, dpi))
+        if cache is not None:
+            for idx in missing:
+                images[idx] = cache.put(slides[idx].image_key(dpi), images[idx])
+    if cache is not None:
+        cache.evict(keep=images.values())
 
     # Create full list with placeholders for hidden slides
     all_images = []
-    visible_idx = 0
 
     # Get placeholder dimensions from first visible slide
-    if visible_images:
-        with Image.open(visible_images[0]) as img:
+    if visible and visible[0] in images:
+        with Image.open(images[visible[0]]) as img:
             placeholder_size = img.size
     else:
         placeholder_size = (1920, 1080)
@@ -262,15 +731,66 @@ def convert_to_images(pptx_path, temp_dir, dpi):
             placeholder_img = create_hidden_slide_placeholder(placeholder_size)
             placeholder_img.save(placeholder_path, "JPEG")
             all_images.append(placeholder_path)
-        else:
+        elif slide_num - 1 in images:
             # Use the actual visible slide image
-            if visible_idx < len(visible_images):
-                all_images.append(visible_images[visible_idx])
-                visible_idx += 1
+            all_images.append(images[slide_num - 1])
 
     return all_images
 
 
+def _render_slides(pptx_path, slides, indices, temp_dir, dpi):
+    """Render the given visible slides and return {slide index: image path}."""
+    visible = [idx for idx, slide in enumerate(slides) if not slide.hidden]
+    # A deck holding only some slides renumbers them, so slides showing their
+    # number are rendered from the whole deck
+    subset = len(indices) * 2 <= len(visible) and not any(
+        slides[idx].numbered for idx in indices
+    )
+
+    if subset:
+        deck_dir = temp_dir / "changed"
+        deck_dir.mkdir(exist_ok=True)
+        deck_path = deck_dir / pptx_path.name
+        _write_slide_subset(pptx_path, indices, deck_path)
+        pages = list(range(1, len(indices) + 1))
+    else:
+        deck_dir = temp_dir
+        deck_path = pptx_path
+        # Hidden slides are not exported, so pages count visible slides only
+        page_of = {idx: page for page, idx in enumerate(visible, 1)}
+        pages = [page_of[idx] for idx in indices]
+
+    # Convert to PDF using a pooled soffice worker
+    print(
+        f"Converting {len(indices)} slide(s) to PDF"
+        + (" from a partial deck..." if subset else "...")
+    )
+    try:
+        get_pool().convert(deck_path, deck_dir, "pdf")
+    except Exception as e:
+        raise RuntimeError(f"PDF conversion failed: {e}") from e
+
+    # Convert PDF to images
+    print(f"Converting to images at {dpi} DPI...")
+    pdf_path = deck_dir / f"{deck_path.stem}.pdf"
+    page_images = dict(
+        rasterize_pdf(pdf_path, temp_dir, pages=pages, dpi=dpi, fmt="jpeg")
+    )
+    return {idx: page_images[page] for idx, page in zip(indices, pages)}
+
+
+def _write_slide_subset(pptx_path, indices, output_path):
+    """Save a copy of a presentation keeping only the slides at indices."""
+    prs = Presentation(str(pptx_path))
+    keep = set(indices)
+    sld_id_lst = prs.slides._sldIdLst
+    removed = [sld_id for idx, sld_id in enumerate(sld_id_lst) if idx not in keep]
+    for sld_id in removed:
+        sld_id_lst.remove(sld_id)
+    delete_slides(prs, removed)
+    prs.save(str(output_path))
+
+
 def create_grids(
     image_paths,
     cols,
@@ -278,44 +798,113 @@ def create_grids(
     output_path,
     placeholder_regions=None,
     slide_dimensions=None,
+    image_keys=None,
 ):
-    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid."""
+    """Create multiple thumbnail grids from slide images, max cols×(cols+1) images per grid.
+
+    With image_keys (one SlideKey.image_key per image), each grid records a
+    key of its contents and an existing grid whose key still matches is kept
+    instead of being rebuilt.
+    """
     # Maximum images per grid is cols × (cols + 1) for better proportions
     max_images_per_grid = cols * (cols + 1)
     grid_files = []
+    reused = 0
 
     print(
         f"Creating grids with {cols} columns (max {max_images_per_grid} images per grid)"
     )
 
-    # Split images into chunks
-    for chunk_idx, start_idx in enumerate(
-        range(0, len(image_paths), max_images_per_grid)
-    ):
-        end_idx = min(start_idx + max_images_per_grid, len(image_paths))
-        chunk_images = image_paths[start_idx:end_idx]
+    # Tiles are decoded by a thread pool (Pillow releases the GIL while
+    # decoding and resampling), shared by all grids
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        for chunk_idx, start_idx in enumerate(
+            range(0, len(image_paths), max_images_per_grid)
+        ):
+            end_idx = min(start_idx + max_images_per_grid, len(image_paths))
+            chunk_images = image_paths[start_idx:end_idx]
+
+            # Generate output filename
+            if len(image_paths) <= max_images_per_grid:
+                # Single grid - use base filename without suffix
+                grid_filename = output_path
+            else:
+                # Multiple grids - insert index before extension with dash
+                stem = output_path.stem
+                suffix = output_path.suffix
+                grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
+
+            grid_key = None
+            if image_keys is not None:
+                grid_key = _grid_key(
+                    image_keys[start_idx:end_idx],
+                    cols,
+                    width,
+                    start_idx,
+                    placeholder_regions,
+                    slide_dimensions,
+                )
+                if _saved_grid_key(grid_filename) == grid_key:
+                    reused += 1
+                    grid_files.append(str(grid_filename))
+                    continue
+
+            # Create grid for this chunk
+            grid = create_grid(
+                chunk_images,
+                cols,
+                width,
+                start_idx,
+                placeholder_regions,
+                slide_dimensions,
+                executor=executor,
+            )
 
-        # Create grid for this chunk
-        grid = create_grid(
-            chunk_images, cols, width, start_idx, placeholder_regions, slide_dimensions
-        )
+            # Save grid
+            grid_filename.parent.mkdir(parents=True, exist_ok=True)
+            if grid_key is None:
+                grid.save(str(grid_filename), quality=JPEG_QUALITY)
+            else:
+                grid.save(str(grid_filename), quality=JPEG_QUALITY, comment=grid_key)
+            grid_files.append(str(grid_filename))
 
-        # Generate output filename
-        if len(image_paths) <= max_images_per_grid:
-            # Single grid - use base filename without suffix
-            grid_filename = output_path
-        else:
-            # Multiple grids - insert index before extension with dash
-            stem = output_path.stem
-            suffix = output_path.suffix
-            grid_filename = output_path.parent / f"{stem}-{chunk_idx + 1}{suffix}"
+    if reused:
+        print(f"Kept {reused} unchanged grid(s)")
+    return grid_files
 
-        # Save grid
-        grid_filename.parent.mkdir(parents=True, exist_ok=True)
-        grid.save(str(grid_filename), quality=JPEG_QUALITY)
-        grid_files.append(str(grid_filename))
 
-    return grid_files
+def _grid_key(
+    image_keys, cols, width, start_idx, placeholder_regions, slide_dimensions
+):
+    """Key of everything a grid's pixels depend on."""
+    regions = [
+        (placeholder_regions or {}).get(start_idx + i) for i in range(len(image_keys))
+    ]
+    content = json.dumps(
+        [
+            CACHE_VERSION,
+            image_keys,
+            cols,
+            width,
+            start_idx,
+            regions,
+            slide_dimensions,
+            JPEG_QUALITY,
+        ]
+    )
+    return f"thumbnail-grid:{hashlib.sha256(content.encode()).hexdigest()}"
+
+
+def _saved_grid_key(grid_path):
+    """Key recorded in an existing grid image's JPEG comment, or None."""
+    try:
+        with Image.open(grid_path) as img:
+            comment = img.info.get("comment")
+    except (OSError, ValueError):
+        return None
+    if isinstance(comment, bytes):
+        comment = comment.decode("ascii", "replace")
+    return comment
 
 
 def create_grid(
@@ -325,8 +914,12 @@ def create_grid(
     start_slide_num=0,
     placeholder_regions=None,
     slide_dimensions=None,
+    executor=None,
 ):
-    """Create thumbnail grid from slide images with optional placeholder outlining."""
+    """Create thumbnail grid from slide images with optional placeholder outlining.
+
+    Tiles are decoded through executor.map when an executor is given.
+    """
     font_size = int(width * FONT_SIZE_RATIO)
     label_padding = int(font_size * LABEL_PADDING_RATIO)
 
@@ -352,8 +945,23 @@ def create_grid(
         # Fall back to basic default font if size parameter not supported
         font = ImageFont.load_default()
 
+    # Decode and scale the tiles in parallel, then place them in order
+    tile_args = [
+        (
+            img_path,
+            (width, height),
+            (placeholder_regions or {}).get(start_slide_num + i),
+            slide_dimensions,
+        )
+        for i, img_path in enumerate(image_paths)
+    ]
+    if executor is None:
+        tiles = map(_prepare_tile, *zip(*tile_args))
+    else:
+        tiles = executor.map(_prepare_tile, *zip(*tile_args))
+
     # Place thumbnails
-    for i, img_path in enumerate(image_paths):
+    for i, tile in enumerate(tiles):
         row, col = i // cols, i % cols
         x = col * width + (col + 1) * GRID_PADDING
         y_base = (
@@ -374,76 +982,72 @@ def create_grid(
         # Add thumbnail below label with proportional spacing
         y_thumbnail = y_base + label_padding + font_size + label_padding
 
-        with Image.open(img_path) as img:
-            # Get original dimensions before thumbnail
-            orig_w, orig_h = img.size
-
-            # Apply placeholder outlines if enabled
-            if placeholder_regions and (start_slide_num + i) in placeholder_regions:
-                # Convert to RGBA for transparency support
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Get the regions for this slide
-                regions = placeholder_regions[start_slide_num + i]
-
-                # Calculate scale factors using actual slide dimensions
-                if slide_dimensions:
-                    slide_width_inches, slide_height_inches = slide_dimensions
-                else:
-                    # Fallback: estimate from image size at CONVERSION_DPI
-                    slide_width_inches = orig_w / CONVERSION_DPI
-                    slide_height_inches = orig_h / CONVERSION_DPI
-
-                x_scale = orig_w / slide_width_inches
-                y_scale = orig_h / slide_height_inches
-
-                # Create a highlight overlay
-                overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-                overlay_draw = ImageDraw.Draw(overlay)
-
-                # Highlight each placeholder region
-                for region in regions:
-                    # Convert from inches to pixels in the original image
-                    px_left = int(region["left"] * x_scale)
-                    px_top = int(region["top"] * y_scale)
-                    px_width = int(region["width"] * x_scale)
-                    px_height = int(region["height"] * y_scale)
-
-                    # Draw highlight outline with red color and thick stroke
-                    # Using a bright red outline instead of fill
-                    stroke_width = max(
-                        5, min(orig_w, orig_h) // 150
-                    )  # Thicker proportional stroke width
-                    overlay_draw.rectangle(
-                        [(px_left, px_top), (px_left + px_width, px_top + px_height)],
-                        outline=(255, 0, 0, 255),  # Bright red, fully opaque
-                        width=stroke_width,
-                    )
+        w, h = tile.size
+        tx = x + (width - w) // 2
+        ty = y_thumbnail + (height - h) // 2
+        grid.paste(tile, (tx, ty))
+
+        # Add border
+        if BORDER_WIDTH > 0:
+            draw.rectangle(
+                [
+                    (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
+                    (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
+                ],
+                outline="gray",
+                width=BORDER_WIDTH,
+            )
 
-                # Composite the overlay onto the image using alpha blending
-                img = Image.alpha_composite(img, overlay)
-                # Convert back to RGB for JPEG saving
-                img = img.convert("RGB")
+    return grid
 
-            img.thumbnail((width, height), Image.Resampling.LANCZOS)
-            w, h = img.size
-            tx = x + (width - w) // 2
-            ty = y_thumbnail + (height - h) // 2
-            grid.paste(img, (tx, ty))
 
-            # Add border
-            if BORDER_WIDTH > 0:
-                draw.rectangle(
-                    [
-                        (tx - BORDER_WIDTH, ty - BORDER_WIDTH),
-                        (tx + w + BORDER_WIDTH - 1, ty + h + BORDER_WIDTH - 1),
-                    ],
-                    outline="gray",
-                    width=BORDER_WIDTH,
-                )
+def _prepare_tile(img_path, size, regions=None, slide_dimensions=None):
+    """Decode one slide image at thumbnail size, with placeholder outlines if given.
 
-    return grid
+    JPEGs are decoded in draft mode, which downscales by up to 8x while
+    decoding, so a full-resolution bitmap is never built. Outlines are drawn
+    on the thumbnail with the stroke scaled down from source resolution.
+    """
+    with Image.open(img_path) as img:
+        # Get original dimensions before thumbnail
+        orig_w, orig_h = img.size
+        img.draft("RGB", size)
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        tile = img.convert("RGB")
+
+    # Apply placeholder outlines if enabled
+    if regions:
+        # Calculate scale factors using actual slide dimensions
+        if slide_dimensions:
+            slide_width_inches, slide_height_inches = slide_dimensions
+        else:
+            # Fallback: estimate from image size at CONVERSION_DPI
+            slide_width_inches = orig_w / CONVERSION_DPI
+            slide_height_inches = orig_h / CONVERSION_DPI
+
+        w, h = tile.size
+        x_scale = w / slide_width_inches
+        y_scale = h / slide_height_inches
+
+        # Thick proportional stroke at source resolution, scaled to the tile
+        stroke_width = max(1, round(max(5, min(orig_w, orig_h) // 150) * w / orig_w))
+
+        draw = ImageDraw.Draw(tile)
+        for region in regions:
+            # Convert from inches to pixels in the thumbnail
+            px_left = round(region["left"] * x_scale)
+            px_top = round(region["top"] * y_scale)
+            px_right = round((region["left"] + region["width"]) * x_scale)
+            px_bottom = round((region["top"] + region["height"]) * y_scale)
+
+            # Draw highlight outline with red color instead of fill
+            draw.rectangle(
+                [(px_left, px_top), (px_right, px_bottom)],
+                outline=(255, 0, 0),
+                width=stroke_width,
+            )
+
+    return tile
 
 
 if __name__ == "__main__":
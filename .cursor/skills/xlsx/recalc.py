@@ -6,48 +6,9 @@ Recalculates all formulas in an Excel file using LibreOffice
 
 import json
 import sys
-import subprocess
-import os
-import platform
 from pathlib import Path
 from openpyxl import load_workbook
-
-
-def setup_libreoffice_macro():
-    """Setup LibreOffice macro for recalculation if not already configured"""
-    if platform.system() == 'Darwin':
-        macro_dir = os.path.expanduser('~/Library/Application Support/LibreOffice/4/user/basic/Standard')
-    else:
-        macro_dir = os.path.expanduser('~/.config/libreoffice/4/user/basic/Standard')
-    
-    macro_file = os.path.join(macro_dir, 'Module1.xba')
-    
-    if os.path.exists(macro_file):
-        with open(macro_file, 'r') as f:
-            if 'RecalculateAndSave' in f.read():
-                return True
-    
-    if not os.path.exists(macro_dir):
-        subprocess.run(['soffice', '--headless', '--terminate_after_init'], 
-                      capture_output=True, timeout=10)
-        os.makedirs(macro_dir, exist_ok=True)
-    
-    macro_content = '''<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE script:module PUBLIC "-//OpenOffice.org//DTD OfficeDocument 1.0//EN" "module.dtd">
-<script:module xmlns:script="http://openoffice.org/2000/script" script:name="Module1" script:language="StarBasic">
-    Sub RecalculateAndSave()
-      ThisComponent.calculateAll()
-      ThisComponent.store()
-      ThisComponent.close(True)
-    End Sub
-</script:module>'''
-    
-    try:
-        with open(macro_file, 'w') as f:
-            f.write(macro_content)
-        return True
-    except Exception:
-        return False
+from soffice_pool import get_pool
 
 
 def recalc(filename, timeout=30):
@@ -66,37 +27,15 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
-    if not setup_libreoffice_macro():
-        return {'error': 'Failed to setup LibreOffice macro'}
-    
-    cmd = [
-        'soffice', '--headless', '--norestore',
-        'vnd.sun.star.script:Standard.Module1.RecalculateAndSave?language=Basic&location=application',
-        abs_path
-    ]
-    
-    # Handle timeout command differences between Linux and macOS
-    if platform.system() != 'Windows':
-        timeout_cmd = 'timeout' if platform.system() == 'Linux' else None
-        if platform.system() == 'Darwin':
-            # Check if gtimeout is available on macOS
-            try:
-                subprocess.run(['gtimeout', '--version'], capture_output=True, timeout=1, check=False)
-                timeout_cmd = 'gtimeout'
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-        
-        if timeout_cmd:
-            cmd = [timeout_cmd, str(timeout)] + cmd
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
-    if result.returncode != 0 and result.returncode != 124:  # 124 is timeout exit code
-        error_msg = result.stderr or 'Unknown error during recalculation'
-        if 'Module1' in error_msg or 'RecalculateAndSave' not in error_msg:
-            return {'error': 'LibreOffice macro not configured properly'}
-        else:
-            return {'error': error_msg}
+    # Recalculate and save with a pooled LibreOffice worker (isolated profile)
+    try:
+        get_pool().recalculate(abs_path, timeout=timeout)
+    except FileNotFoundError:
+        return {'error': 'LibreOffice (soffice) not found'}
+    except TimeoutError:
+        return {'error': f'Recalculation timed out after {timeout} seconds'}
+    except Exception as e:
+        return {'error': str(e) or 'Unknown error during recalculation'}
     
     # Check for Excel errors in the recalculated file - scan ALL cells
     try: